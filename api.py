@@ -0,0 +1,380 @@
+"""
+JSON HTTP API for planarity checks, served by an async (ASGI) server:
+
+    uvicorn api:app --workers 1
+    python api.py
+
+``POST /api/planarity`` takes a JSON body ``{"edges": [...], "nodes": [...]}``,
+a bare JSON edge list, an edge-list file (CSV, NDJSON, ``A-B`` lines, gzip),
+GraphML or a binary ``.pgb`` graph (see ``graph_binary``) and answers with the result directly. Anything derived from the graph is
+stored under its content hash, so concurrent requests never share a file and a
+graph is only processed once:
+
+    GET /api/graphs/{hash}              the stored result
+    GET /api/graphs/{hash}/layout       node positions, computed on first request
+    GET /api/graphs/{hash}/kuratowski   K5/K3,3 subdivision of a non-planar graph
+    GET /api/graphs/{hash}/planarization  maximal planar subgraph and low-crossing drawing
+    GET /api/graphs/{hash}/image.png (or .svg; ?width=&height=&dpi=&labels=&layout=)
+    GET /metrics                        per-stage timings in Prometheus text format
+
+Every request and every stage run in the worker processes (parsing, planarity,
+layout, ...; see ``instrument``) is timed into the ``/metrics`` histograms. Set
+``PLANAR_TRACE_LOG`` to a file to also append one JSONL trace per worker call.
+"""
+import asyncio
+import json
+import os
+import re
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import numpy as np
+from starlette.applications import Starlette
+from starlette.exceptions import HTTPException
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import FileResponse, JSONResponse, PlainTextResponse, Response
+from starlette.routing import Route
+
+from compact import CompactGraph
+from graph_binary import join_labels
+from ingest import edge_from_item, load_graph
+from instrument import REGISTRY, JsonlExporter, call_traced, prometheus_text, span
+from kuratowski import find_kuratowski_subgraph
+from layout import compute_layout
+from planarity import check_planarity_and_euler
+from planarize import planarize
+from render import RENDER_FORMATS, RenderService
+
+ARTIFACT_DIR = Path(os.environ.get("PLANAR_ARTIFACT_DIR", Path(__file__).resolve().parent / ".cache" / "artifacts"))
+
+# Request bodies above this many bytes are rejected with 413
+MAX_BODY_BYTES = int(os.environ.get("PLANAR_MAX_BODY_BYTES", 16 * 1024 * 1024))
+# Processes for the CPU-bound work, and requests allowed to wait for one before answering 503
+API_WORKERS = int(os.environ.get("PLANAR_API_WORKERS", os.cpu_count() or 1))
+MAX_PENDING = 4 * API_WORKERS
+# Optional JSONL file receiving the trace of every worker call
+TRACE_LOG = os.environ.get("PLANAR_TRACE_LOG")
+
+_HASH = re.compile(r"[0-9a-f]{32}")
+
+
+class ArtifactStore:
+    """
+    Files derived from a graph, stored under ``root/<content hash>/``.
+
+    Every write goes to a unique temporary file that is atomically renamed into
+    place, so two requests producing the same artifact cannot corrupt it and a
+    reader never sees a partial file.
+    """
+
+    def __init__(self, root=ARTIFACT_DIR):
+        self.root = Path(root)
+
+    def path(self, key, name):
+        if not _HASH.fullmatch(key):
+            raise ValueError(f"Invalid graph hash '{key}'")
+        return self.root / key / name
+
+    def exists(self, key, name):
+        return self.path(key, name).exists()
+
+    def write_bytes(self, key, name, data):
+        path = self.path(key, name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{name}.{uuid.uuid4().hex}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        return path
+
+    def write_json(self, key, name, obj):
+        return self.write_bytes(key, name, json.dumps(obj, separators=(",", ":")).encode("utf-8"))
+
+    def save_graph(self, key, compact):
+        path = self.path(key, "graph.npz")
+        if path.exists():
+            return path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".graph.{uuid.uuid4().hex}.tmp.npz")
+        # Labels as raw bytes: a NumPy string array would drop trailing NULs and whitespace
+        labels = np.frombuffer(join_labels(compact.labels), dtype=np.uint8)
+        np.savez(tmp, edges=compact.edges, loops=compact.loops, labels=labels, nodes=len(compact.labels))
+        os.replace(tmp, path)
+        return path
+
+    def load_graph(self, key):
+        with np.load(self.path(key, "graph.npz")) as data:
+            text = data["labels"].tobytes().decode("utf-8")
+            labels = text.split("\0") if int(data["nodes"]) else []
+            return CompactGraph(data["edges"], labels, loops=data["loops"])
+
+
+def parse_graph(body):
+    """
+    ``CompactGraph`` from a request body: a JSON object with ``edges`` (and optional
+    ``nodes``), or anything ``ingest.load_graph`` reads (edge lists, GraphML, ``.pgb``).
+    """
+    if body.lstrip()[:1] == b"{":
+        payload = json.loads(body)
+        if not isinstance(payload.get("edges"), list):
+            raise ValueError("Expected an 'edges' list")
+        return CompactGraph.from_labeled_edges((edge_from_item(item) for item in payload["edges"]),
+                                               nodes=payload.get("nodes") or ())
+    return load_graph(body)
+
+
+def _result_payload(key, result):
+    payload = {
+        "hash": key,
+        "is_planar": bool(result.is_planar),
+        "tier": result.tier,
+        "vertices": result.compact.number_of_nodes(),
+        "edges": result.compact.number_of_edges(),
+        "faces": result.F,
+        "components": int(result.C),
+        "artifacts": {
+            "result": f"/api/graphs/{key}",
+            "layout": f"/api/graphs/{key}/layout",
+            "image": f"/api/graphs/{key}/image.png",
+        },
+    }
+    if not result.is_planar:
+        payload["artifacts"]["kuratowski"] = f"/api/graphs/{key}/kuratowski"
+        payload["artifacts"]["planarization"] = f"/api/graphs/{key}/planarization"
+    return payload
+
+
+def analyze_body(body, root=ARTIFACT_DIR):
+    """
+    Worker: parse, check and store one graph; returns the JSON result payload.
+    """
+    store = ArtifactStore(root)
+    with span("load"):
+        compact = parse_graph(body)
+    key = compact.content_hash()
+    if store.exists(key, "result.json"):
+        return json.loads(store.path(key, "result.json").read_bytes())
+    payload = _result_payload(key, check_planarity_and_euler(compact))
+    store.save_graph(key, compact)
+    store.write_json(key, "result.json", payload)
+    return payload
+
+
+def layout_artifact(key, root=ARTIFACT_DIR):
+    """
+    Worker: compute and store the layout of a stored graph; returns the artifact path.
+    Planar graphs get a crossing-free drawing from their embedding.
+    """
+    store = ArtifactStore(root)
+    compact = store.load_graph(key)
+    result = check_planarity_and_euler(compact)
+    layout = compute_layout(compact, embedding=result.embedding if result.is_planar else None)
+    return str(store.write_json(key, "layout.json", {
+        "hash": key,
+        "method": layout.method,
+        "nodes": layout.nodes,
+        "positions": np.round(layout.coords, 6).tolist(),
+        "edges": layout.edges.tolist(),
+    }))
+
+
+def kuratowski_artifact(key, root=ARTIFACT_DIR):
+    """
+    Worker: extract and store the Kuratowski subgraph of a stored graph; returns the artifact path.
+    """
+    store = ArtifactStore(root)
+    witness = find_kuratowski_subgraph(store.load_graph(key))
+    return str(store.write_json(key, "kuratowski.json", {
+        "hash": key,
+        "is_planar": witness is None,
+        "witness": witness.to_dict() if witness is not None else None,
+    }))
+
+
+def planarization_artifact(key, root=ARTIFACT_DIR):
+    """
+    Worker: planarize a stored graph and store the result; returns the artifact path.
+    """
+    store = ArtifactStore(root)
+    return str(store.write_json(key, "planarization.json", dict(
+        planarize(store.load_graph(key)).to_dict(), hash=key)))
+
+
+async def read_body(request, limit=MAX_BODY_BYTES):
+    """
+    Request body, read incrementally and rejected with 413 as soon as it exceeds ``limit`` bytes.
+    """
+    declared = request.headers.get("content-length")
+    if declared is not None and declared.isdigit() and int(declared) > limit:
+        raise HTTPException(413, f"Request body exceeds {limit} bytes")
+    chunks, size = [], 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > limit:
+            raise HTTPException(413, f"Request body exceeds {limit} bytes")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+@asynccontextmanager
+async def pending_slot(request):
+    """
+    Hold one of the ``MAX_PENDING`` slots shared by pool and render jobs, answering 503 when none is free.
+    """
+    state = request.app.state
+    if state.pending >= MAX_PENDING:
+        raise HTTPException(503, "Server busy, retry shortly", headers={"Retry-After": "1"})
+    state.pending += 1
+    try:
+        yield
+    finally:
+        state.pending -= 1
+
+
+async def run_in_pool(request, fn, *args):
+    """
+    Run ``fn`` in the worker pool, answering 503 instead of queueing without bound.
+    """
+    state = request.app.state
+    async with pending_slot(request):
+        result, run = await asyncio.get_running_loop().run_in_executor(state.pool, call_traced, fn, *args)
+    # The worker's stages are timed in its process; record them here, where /metrics is served
+    REGISTRY.observe_trace(run)
+    if state.trace_log is not None:
+        state.trace_log.export(run, path=request.url.path)
+    return result
+
+
+async def check_planarity(request):
+    body = await read_body(request)
+    if not body.strip():
+        raise HTTPException(400, "Empty request body")
+    try:
+        payload = await run_in_pool(request, analyze_body, body, str(request.app.state.store.root))
+    except (ValueError, KeyError, TypeError, UnicodeDecodeError) as e:
+        raise HTTPException(400, f"Invalid graph: {e}")
+    return JSONResponse(payload)
+
+
+async def get_result(request):
+    key = request.path_params["key"]
+    path = _artifact_path(request, key, "result.json")
+    if not path.exists():
+        raise HTTPException(404, "Unknown graph hash")
+    return FileResponse(path, media_type="application/json")
+
+
+async def get_layout(request):
+    return await _derived_artifact(request, "layout.json", layout_artifact)
+
+
+async def get_kuratowski(request):
+    return await _derived_artifact(request, "kuratowski.json", kuratowski_artifact)
+
+
+async def get_planarization(request):
+    return await _derived_artifact(request, "planarization.json", planarization_artifact)
+
+
+async def _derived_artifact(request, name, worker):
+    """
+    Serve artifact ``name`` of a stored graph, computing it with ``worker`` in the pool on first request.
+    """
+    key = request.path_params["key"]
+    store = request.app.state.store
+    path = _artifact_path(request, key, name)
+    if not path.exists():
+        if not store.exists(key, "graph.npz"):
+            raise HTTPException(404, "Unknown graph hash")
+        # Concurrent requests for the same artifact share one computation
+        inflight = request.app.state.inflight
+        task = inflight.get((key, name))
+        if task is None:
+            task = inflight[(key, name)] = asyncio.ensure_future(
+                run_in_pool(request, worker, key, str(store.root)))
+            task.add_done_callback(lambda _: inflight.pop((key, name), None))
+        await asyncio.shield(task)
+    return FileResponse(path, media_type="application/json")
+
+
+async def get_image(request):
+    key, fmt = request.path_params["key"], request.path_params["fmt"]
+    store = request.app.state.store
+    if fmt not in RENDER_FORMATS:
+        raise HTTPException(404, "Unknown image format")
+    if not _artifact_path(request, key, "graph.npz").exists():
+        raise HTTPException(404, "Unknown graph hash")
+    query = request.query_params
+    params = {name: query.get(name) for name in ("width", "height", "dpi", "layout", "seed")}
+    if "labels" in query:
+        params["labels"] = query["labels"].lower() not in ("0", "false", "no")
+    async with pending_slot(request):
+        # Reading the stored graph is disk I/O; keep it off the event loop
+        compact = await asyncio.to_thread(store.load_graph, key)
+        try:
+            render_id, data = await asyncio.wrap_future(request.app.state.render.submit(compact, fmt, **params))
+        except ValueError as e:
+            raise HTTPException(400, str(e))
+    return Response(data, media_type=RENDER_FORMATS[fmt],
+                    headers={"ETag": f'"{render_id}"', "Cache-Control": "public, max-age=31536000, immutable"})
+
+
+def _artifact_path(request, key, name):
+    try:
+        return request.app.state.store.path(key, name)
+    except ValueError:
+        raise HTTPException(404, "Unknown graph hash")
+
+
+async def get_metrics(request):
+    return PlainTextResponse(prometheus_text(REGISTRY), media_type="text/plain; version=0.0.4")
+
+
+async def _timed_request(request, call_next):
+    # One stage per route, with graph hashes folded into a placeholder
+    with span(f"http {request.method} {_HASH.sub('{hash}', request.url.path)}"):
+        return await call_next(request)
+
+
+async def _json_error(request, exc):
+    return JSONResponse({"error": exc.detail}, status_code=exc.status_code, headers=exc.headers)
+
+
+@asynccontextmanager
+async def lifespan(app):
+    app.state.store = ArtifactStore()
+    app.state.pool = ProcessPoolExecutor(max_workers=API_WORKERS)
+    app.state.pending = 0
+    app.state.inflight = {}
+    app.state.render = RenderService()
+    app.state.trace_log = JsonlExporter(TRACE_LOG) if TRACE_LOG else None
+    try:
+        yield
+    finally:
+        app.state.pool.shutdown(cancel_futures=True)
+        app.state.render.shutdown()
+
+
+app = Starlette(
+    routes=[
+        Route("/api/planarity", check_planarity, methods=["POST"]),
+        Route("/api/graphs/{key}", get_result, methods=["GET"]),
+        Route("/api/graphs/{key}/layout", get_layout, methods=["GET"]),
+        Route("/api/graphs/{key}/kuratowski", get_kuratowski, methods=["GET"]),
+        Route("/api/graphs/{key}/planarization", get_planarization, methods=["GET"]),
+        Route("/api/graphs/{key}/image.{fmt}", get_image, methods=["GET"]),
+        Route("/metrics", get_metrics, methods=["GET"]),
+    ],
+    middleware=[Middleware(BaseHTTPMiddleware, dispatch=_timed_request)],
+    exception_handlers={HTTPException: _json_error},
+    lifespan=lifespan,
+)
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(app, host=os.environ.get("HOST", "127.0.0.1"), port=int(os.environ.get("PORT", 8000)))
@@ -0,0 +1,175 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+
+from instrument import timed
+
+BUNDLED_DIR = Path(__file__).resolve().parent / "assets" / "lottie"
+STATIC_DIR = Path(__file__).resolve().parent / "assets" / "static"
+CACHE_DIR = Path(os.environ.get("PLANAR_ASSET_CACHE", Path(__file__).resolve().parent / ".cache" / "lottie"))
+
+# Seconds before a cached asset is revalidated, and after a failed fetch before retrying
+ASSET_TTL = 24 * 60 * 60
+FAILURE_BACKOFF = 5 * 60
+# (connect, read) timeout for the background fetch
+FETCH_TIMEOUT = (2, 3)
+# Set PLANAR_OFFLINE=1 to never touch the network and serve bundled/cached assets only
+OFFLINE = os.environ.get("PLANAR_OFFLINE", "").lower() in ("1", "true", "yes")
+
+
+class AssetCache:
+    """
+    Two-level (memory + disk) cache for remote JSON assets.
+
+    Lookups never wait on the network: a cached copy is returned immediately even
+    when stale, and a missing asset falls back to a bundled file. Stale or missing
+    entries are refreshed on a background thread with a conditional GET
+    (``If-None-Match``), so the next rerun picks up the new copy.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, bundled_dir=BUNDLED_DIR, ttl=ASSET_TTL,
+                 timeout=FETCH_TIMEOUT, offline=OFFLINE):
+        self.cache_dir = Path(cache_dir)
+        self.bundled_dir = Path(bundled_dir)
+        self.ttl = ttl
+        self.timeout = timeout
+        self.offline = offline
+        self._memory = {}
+        self._failed_at = {}
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url):
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+
+    def get(self, url):
+        """
+        Return the asset for ``url`` from memory, disk or the bundled fallback, or ``None``.
+        """
+        entry = self._memory.get(url)
+        if entry is None:
+            entry = self._read_disk(url)
+            if entry is not None:
+                self._memory[url] = entry
+        if entry is None or time.time() - entry["fetched_at"] > self.ttl:
+            self._refresh_async(url, entry)
+        if entry is not None:
+            return entry["data"]
+        return self._bundled(url)
+
+    def fetch(self, url, entry=None):
+        """
+        Fetch ``url`` synchronously, revalidating ``entry`` by ETag when one is cached.
+        """
+        import requests  # only the background refresh needs it, not every app start
+
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        r = requests.get(url, headers=headers, timeout=self.timeout)
+        if r.status_code == 304 and entry is not None:
+            entry = dict(entry, fetched_at=time.time())
+        elif r.status_code == 200:
+            entry = {"data": r.json(), "etag": r.headers.get("ETag"), "fetched_at": time.time()}
+        else:
+            raise requests.HTTPError(f"{r.status_code} for {url}")
+        self._memory[url] = entry
+        self._write_disk(url, entry)
+        return entry
+
+    def _refresh_async(self, url, entry):
+        if self.offline:
+            return
+        with self._lock:
+            if url in self._pending or time.time() - self._failed_at.get(url, 0) < FAILURE_BACKOFF:
+                return
+            self._pending.add(url)
+
+        def worker():
+            import requests
+
+            try:
+                self.fetch(url, entry)
+            except (requests.RequestException, ValueError, OSError):
+                self._failed_at[url] = time.time()
+            finally:
+                with self._lock:
+                    self._pending.discard(url)
+
+        threading.Thread(target=worker, name="asset-refresh", daemon=True).start()
+
+    def _read_disk(self, url):
+        path = self.cache_dir / f"{self.key(url)}.json"
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_disk(self, url, entry):
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self.cache_dir / f"{self.key(url)}.json"
+            tmp = path.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(entry, f, separators=(",", ":"))
+            os.replace(tmp, path)
+        except OSError:
+            pass  # a read-only deployment still has the memory cache
+
+    def _bundled(self, url):
+        for name in (f"{self.key(url)}.json", "fallback.json"):
+            try:
+                with open(self.bundled_dir / name, encoding="utf-8") as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                continue
+        return None
+
+
+_asset_cache = AssetCache()
+
+
+# Function to load Lottie animations
+@timed("lottie")
+def load_lottie_url(url: str):
+    """
+    Lottie animation JSON for ``url``; never blocks on the network (see ``AssetCache``).
+    """
+    return _asset_cache.get(url)
+
+
+def compile_static(text):
+    """
+    Minify an HTML/CSS snippet: comments, indentation and blank lines are dropped.
+
+    Indentation matters beyond size here, since Markdown would render an HTML line
+    indented by four spaces as a code block.
+    """
+    text = re.sub(r"/\*.*?\*/|<!--.*?-->", "", text, flags=re.S)
+    return "\n".join(line.strip() for line in text.splitlines() if line.strip())
+
+
+@lru_cache(maxsize=None)
+def load_static(name):
+    """
+    Function to load a static HTML/CSS snippet from ``assets/static``, read and minified once per process.
+    """
+    with open(STATIC_DIR / name, encoding="utf-8") as f:
+        return compile_static(f.read())
+
+
+@lru_cache(maxsize=None)
+def load_script(name):
+    """
+    Function to load a bundled JavaScript library from ``assets/static`` as is (minified
+    already, and ``compile_static`` would break it), read once per process.
+    """
+    with open(STATIC_DIR / name, encoding="utf-8") as f:
+        return f.read()
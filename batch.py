@@ -0,0 +1,323 @@
+"""
+Headless batch planarity checks.
+
+Runs the same analysis as the Streamlit app (``check_planarity_and_euler``) over
+a directory of edge-list files or a JSONL stream of graphs, in a process pool:
+
+    python batch.py netlists/ -o results.jsonl --workers 8
+    python batch.py graphs.jsonl -o results.parquet --format parquet --resume
+    zcat graphs.jsonl.gz | python batch.py - -o results.jsonl
+
+Each JSONL input line is either an edge list or an object
+``{"id": ..., "edges": [...]}``; lines without an ID are named ``line:<number>``.
+The output doubles as the checkpoint: with ``--resume`` graphs whose IDs already
+appear in it are skipped and new results are appended. ``--metrics`` records where the time went, per stage (see
+``instrument``): as Prometheus text for a ``.prom`` path, otherwise as one JSONL
+trace per graph.
+"""
+import argparse
+import json
+import os
+import queue
+import re
+import sys
+import time
+from functools import partial
+from itertools import islice
+from multiprocessing import Pool
+from pathlib import Path
+
+from compact import CompactGraph
+from ingest import edge_from_item, load_edges
+from instrument import JsonlExporter, Registry, call_traced, prometheus_text, span
+from planarity import check_planarity_and_euler
+
+OUTPUT_FORMATS = ("jsonl", "parquet")
+IN_FLIGHT_PER_WORKER = 4
+INPUT_SUFFIXES = (".json", ".ndjson", ".jsonl", ".csv", ".tsv", ".txt", ".edges", ".gz")
+
+# Strings and brackets, enough to track nesting depth without parsing the values
+_JSON_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|[{}\[\]]')
+_ID_VALUE = re.compile(r'\s*:\s*("(?:[^"\\]|\\.)*"|-?\d+)')
+
+
+def iter_directory(root):
+    """
+    Yield ``(graph_id, path)`` for every edge-list file under ``root``, in a stable order.
+    """
+    root = Path(root)
+    for path in sorted(root.rglob("*")):
+        if path.is_file() and path.name.lower().endswith(INPUT_SUFFIXES):
+            yield str(path.relative_to(root)), str(path)
+
+
+def _top_level_id(line):
+    """
+    Return the ``"id"`` of a JSON object line without parsing its (possibly large)
+    edge list; IDs nested inside the edges are ignored.
+    """
+    depth = 0
+    for match in _JSON_TOKEN.finditer(line):
+        token = match.group()
+        if token in ("{", "["):
+            depth += 1
+        elif token in ("}", "]"):
+            depth -= 1
+        elif depth == 1 and token == '"id"':
+            value = _ID_VALUE.match(line, match.end())
+            if value:
+                return str(json.loads(value.group(1)))
+    return None
+
+
+def iter_jsonl(stream):
+    """
+    Yield ``(graph_id, line)`` for every non-empty line; IDs default to ``line:<number>``
+    so they cannot collide with explicit numeric IDs.
+    The line is parsed in the worker, so only raw text crosses the process boundary.
+    """
+    for number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        graph_id = _top_level_id(line) if line.startswith("{") else None
+        yield graph_id if graph_id is not None else f"line:{number}", line
+
+
+def _load_graph(source):
+    if source.startswith(("{", "[")):
+        record = json.loads(source)
+        edges = record["edges"] if isinstance(record, dict) else record
+        return CompactGraph.from_labeled_edges(edge_from_item(item) for item in edges)
+    return CompactGraph.from_buffer(load_edges(source))
+
+
+def analyze_graph(task, traced=False):
+    """
+    Worker: load one graph and return its result row. Errors are reported in the row, not raised.
+    With ``traced`` the row also carries the ``instrument`` trace of the work under ``"trace"``.
+    """
+    if traced:
+        row, run = call_traced(analyze_graph, task)
+        return dict(row, trace=run)
+    graph_id, source = task
+    start = time.perf_counter()
+    row = {"id": graph_id, "is_planar": None, "tier": None, "vertices": None, "edges": None,
+           "faces": None, "components": None, "error": None}
+    try:
+        with span("load"):
+            graph = _load_graph(source)
+        result = check_planarity_and_euler(graph, use_cache=False)
+        row.update(is_planar=bool(result.is_planar), tier=result.tier,
+                   vertices=graph.number_of_nodes(), edges=graph.number_of_edges(),
+                   faces=result.F, components=int(result.C))
+    except Exception as e:
+        row["error"] = f"{type(e).__name__}: {e}"
+    row["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    return row
+
+
+def _analyze_chunk(worker, chunk):
+    return [worker(task) for task in chunk]
+
+
+class JsonlWriter:
+    def __init__(self, path, resume):
+        self.path = path
+        if resume and os.path.exists(path):
+            self._drop_torn_line(path)
+        self._file = open(path, "a" if resume else "w", encoding="utf-8")
+
+    @staticmethod
+    def _drop_torn_line(path):
+        # Appending after a half-written row would glue the next row onto it
+        with open(path, "rb+") as f:
+            end = f.seek(0, os.SEEK_END)
+            while end > 0:
+                start = max(0, end - (1 << 16))
+                f.seek(start)
+                newline = f.read(end - start).rfind(b"\n")
+                if newline >= 0:
+                    end = start + newline + 1
+                    break
+                end = start
+            f.truncate(end)
+
+    @staticmethod
+    def completed_ids(path):
+        done = set()
+        if not os.path.exists(path):
+            return done
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    done.add(json.loads(line)["id"])
+                except (ValueError, KeyError):
+                    continue  # a torn last line from an interrupted run is simply redone
+        return done
+
+    def write(self, rows):
+        for row in rows:
+            self._file.write(json.dumps(row) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetWriter:
+    """
+    Writes a Parquet dataset directory, one part file per flush, so an interrupted
+    run keeps every completed part and can resume after the last one.
+    """
+
+    def __init__(self, path, resume):
+        import pyarrow  # noqa: F401  (fail early when the optional dependency is missing)
+
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        if not resume:
+            for part in self.path.glob("part-*.parquet"):
+                part.unlink()
+        self._next = len(list(self.path.glob("part-*.parquet")))
+
+    @staticmethod
+    def completed_ids(path):
+        import pyarrow.parquet as pq
+
+        done = set()
+        for part in sorted(Path(path).glob("part-*.parquet")):
+            done.update(pq.read_table(part, columns=["id"]).column("id").to_pylist())
+        return done
+
+    def write(self, rows):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if not rows:
+            return
+        part = self.path / f"part-{self._next:05d}.parquet"
+        tmp = part.with_suffix(".tmp")
+        pq.write_table(pa.Table.from_pylist(rows), tmp)
+        os.replace(tmp, part)
+        self._next += 1
+
+    def close(self):
+        pass
+
+
+WRITERS = {"jsonl": JsonlWriter, "parquet": ParquetWriter}
+
+
+def run_batch(tasks, output, fmt="jsonl", workers=None, chunksize=16, resume=False,
+              flush_every=1000, log=sys.stderr, metrics=None):
+    """
+    Analyze ``(graph_id, source)`` tasks across a process pool and write result rows to ``output``.
+
+    Work is handed out in chunks of ``chunksize`` graphs and collected as it
+    completes, with at most ``IN_FLIGHT_PER_WORKER`` chunks per worker outstanding,
+    so tasks are read from the input only as the pool drains them; rows are
+    flushed every ``flush_every`` results. Each graph is
+    checked whole in one worker (pool workers cannot start their own block pools),
+    so throughput comes from running many graphs side by side. Returns a summary dict.
+
+    With ``metrics`` (a path) the workers trace their stages: a ``.prom`` file gets
+    the per-stage totals and histograms in Prometheus text at the end, any other
+    path one JSONL trace per graph as results arrive.
+    """
+    registry = exporter = None
+    if metrics is not None:
+        if str(metrics).endswith(".prom"):
+            registry = Registry()
+        else:
+            exporter = JsonlExporter(metrics)
+    worker = partial(analyze_graph, traced=True) if metrics is not None else analyze_graph
+    writer_cls = WRITERS[fmt]
+    done = writer_cls.completed_ids(output) if resume else set()
+    writer = writer_cls(output, resume)
+
+    pending = ((graph_id, source) for graph_id, source in tasks if graph_id not in done)
+    chunks = iter(lambda: list(islice(pending, chunksize)), [])
+    summary = {"processed": 0, "planar": 0, "non_planar": 0, "errors": 0, "skipped": len(done)}
+    start = time.perf_counter()
+    buffer = []
+    completed = queue.SimpleQueue()
+    in_flight = 0
+    limit = IN_FLIGHT_PER_WORKER * (workers or os.cpu_count() or 1)
+    pool = Pool(processes=workers)
+    try:
+        while True:
+            while in_flight < limit:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                pool.apply_async(_analyze_chunk, (worker, chunk), callback=completed.put,
+                                 error_callback=completed.put)
+                in_flight += 1
+            if not in_flight:
+                break
+            rows = completed.get()
+            in_flight -= 1
+            if isinstance(rows, BaseException):
+                raise rows
+            for row in rows:
+                run = row.pop("trace", None)
+                if registry is not None:
+                    registry.observe_trace(run)
+                elif exporter is not None:
+                    exporter.export(run, id=row["id"])
+                buffer.append(row)
+                summary["processed"] += 1
+                if row["error"]:
+                    summary["errors"] += 1
+                elif row["is_planar"]:
+                    summary["planar"] += 1
+                else:
+                    summary["non_planar"] += 1
+                if len(buffer) >= flush_every:
+                    writer.write(buffer)
+                    buffer = []
+                    if log:
+                        rate = summary["processed"] / (time.perf_counter() - start)
+                        print(f"{summary['processed']} graphs ({rate:.0f}/s)", file=log)
+        writer.write(buffer)
+        pool.close()
+    finally:
+        pool.terminate()
+        writer.close()
+    summary["seconds"] = round(time.perf_counter() - start, 3)
+    if registry is not None:
+        with open(metrics, "w", encoding="utf-8") as f:
+            f.write(prometheus_text(registry))
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch planarity checks over many graphs.")
+    parser.add_argument("input", help="directory of edge-list files, a JSONL file of graphs, or '-' for stdin")
+    parser.add_argument("-o", "--output", required=True, help="results file (jsonl) or directory (parquet)")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default=None,
+                        help="output format (default: from the output suffix, else jsonl)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunksize", type=int, default=16, help="graphs handed to a worker at a time")
+    parser.add_argument("--flush-every", type=int, default=1000, help="results written per flush/checkpoint")
+    parser.add_argument("--resume", action="store_true", help="skip graphs already present in the output")
+    parser.add_argument("--metrics", help="per-stage timings: Prometheus text (.prom) or JSONL traces per graph")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("parquet" if args.output.endswith(".parquet") else "jsonl")
+    if args.input == "-":
+        tasks = iter_jsonl(sys.stdin)
+    elif os.path.isdir(args.input):
+        tasks = iter_directory(args.input)
+    else:
+        tasks = iter_jsonl(open(args.input, encoding="utf-8"))
+
+    summary = run_batch(tasks, args.output, fmt=fmt, workers=args.workers, chunksize=args.chunksize,
+                        resume=args.resume, flush_every=args.flush_every, metrics=args.metrics)
+    print(json.dumps(summary), file=sys.stderr)
+    return 1 if summary["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
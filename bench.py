@@ -0,0 +1,368 @@
+"""
+Reproducible benchmarks for the hot paths of the app.
+
+Times ``check_planarity_and_euler``, face counting, every layout method
+``plot_interactive_graph`` can use, and building plus serializing the Plotly
+figure, over graph families from ``generators`` (grids, random planar
+triangulations, Delaunay graphs with and without an injected crossing, K_n,
+G(n, p) and trees) from 10 up to 10^6 nodes. Each measurement records the best
+wall time and the peak traced memory, and is compared with a stored baseline:
+
+    python bench.py                                  # full run against bench_baseline.json
+    python bench.py --sizes 10,1000 --cases planarity,faces --families grid,tree
+    python bench.py --check                          # exit 1 when something regressed
+    python bench.py --save-baseline                  # record this machine's numbers
+    python bench.py --app --cases none               # only the Streamlit page timings
+
+With ``--app`` the Streamlit app is also timed, page by page, from a fresh
+interpreter: the first run of the app, each page's first visit and its
+reruns, each checked against the budgets in ``views`` as well as the baseline.
+
+Graphs come from a fixed seed, so runs differ only by the machine and the code.
+A case is skipped on the sizes where it would take longer than ``--time-limit``
+seconds, projected from how its time grew over the previous sizes.
+"""
+import argparse
+import gc
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from functools import partial
+from pathlib import Path
+
+import networkx as nx
+import numpy as np
+
+from compact import CompactGraph
+from generators import apollonian, complete, delaunay, gnp, grid, random_tree, with_crossings
+from layout import compute_layout
+from metrics import face_metrics
+from planarity import check_planarity_and_euler
+from plotting import plot_interactive_graph
+
+ROOT = Path(__file__).resolve().parent
+BASELINE_PATH = ROOT / "bench_baseline.json"
+
+SIZES = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+SEED = 42
+# Graphs with more edges than this are not generated (K_n stops at n = 3162)
+MAX_EDGES = 5_000_000
+# A case is not run on a size where it would take longer than this (seconds), projected
+# from its growth over the previous sizes of the same family
+TIME_LIMIT = 60.0
+# Slowdowns above this fraction of the baseline are regressions, unless smaller than NOISE_SECONDS
+TOLERANCE = 0.5
+NOISE_SECONDS = 0.02
+
+
+# Generator from ``generators`` and an upper bound on its edge count for ``n`` nodes
+FAMILIES = {
+    "grid": (grid, lambda n: 2 * n),
+    "triangulation": (apollonian, lambda n: 3 * n),
+    "delaunay": (delaunay, lambda n: 3 * n),
+    "crossings": (with_crossings, lambda n: 3 * n),
+    "complete": (complete, lambda n: n * (n - 1) // 2),
+    "gnp": (gnp, lambda n: 2 * n),
+    "tree": (random_tree, lambda n: n),
+}
+
+
+# -- cases ------------------------------------------------------------------
+# Each case prepares what it needs outside the timing and returns the callable to
+# time, or None when it does not apply to the graph (e.g. faces of a non-planar graph).
+
+def planarity_case(compact):
+    edges, labels = compact.edges, compact.labels
+    return lambda: check_planarity_and_euler(CompactGraph(edges, labels), use_cache=False)
+
+
+def faces_case(compact):
+    result = check_planarity_and_euler(compact, use_cache=False)
+    if not result.is_planar:
+        return None
+    embedding = result.embedding
+    return lambda: face_metrics(compact, embedding)
+
+
+def layout_case(method, compact):
+    embedding = None
+    if method == "planar":
+        result = check_planarity_and_euler(compact, use_cache=False)
+        if not result.is_planar:
+            return None
+        embedding = result.embedding
+    return lambda: compute_layout(compact, method=method, embedding=embedding, seed=SEED)
+
+
+def figure_case(compact):
+    result = check_planarity_and_euler(compact, use_cache=False)
+    layout = compute_layout(compact, embedding=result.embedding if result.is_planar else None, seed=SEED)
+    return lambda: len(plot_interactive_graph(compact, layout).to_json())
+
+
+CASES = {
+    "planarity": planarity_case,
+    "faces": faces_case,
+    **{f"layout:{method}": partial(layout_case, method)
+       for method in ("planar", "spring", "multilevel", "spectral", "random")},
+    "figure": figure_case,
+}
+
+
+def _describe(output):
+    # What a case returned, kept in the report (a layout may fall back to another method)
+    if hasattr(output, "method"):
+        return {"method": output.method}
+    if hasattr(output, "tier"):
+        return {"tier": output.tier, "is_planar": bool(output.is_planar)}
+    if isinstance(output, int):
+        return {"bytes": output}
+    return {}
+
+
+def measure(run, repeat=3, memory=True):
+    """
+    Best wall time of up to ``repeat`` runs (one if a run takes over a second), then
+    the peak memory traced by ``tracemalloc`` over one more run.
+    """
+    times, output = [], None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        output = run()
+        times.append(time.perf_counter() - start)
+        if times[-1] > 1.0:
+            break
+    peak = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            run()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return {"seconds": min(times), "peak_bytes": peak, **_describe(output)}
+
+
+def _projected(history, n):
+    """
+    Expected seconds at size ``n`` from earlier ``(size, seconds)`` measurements, assuming
+    the time keeps growing like a power of the size (at least linearly, at most cubically).
+    """
+    if not history:
+        return 0.0
+    n1, t1 = history[-1]
+    exponent = 1.0
+    if len(history) > 1:
+        n0, t0 = history[-2]
+        if t0 > NOISE_SECONDS:
+            exponent = min(max(np.log(t1 / t0) / np.log(n1 / n0), 1.0), 3.0)
+    return t1 * (n / n1) ** exponent
+
+
+def run_benchmarks(families=FAMILIES, cases=CASES, sizes=SIZES, repeat=3, memory=True,
+                   time_limit=TIME_LIMIT, seed=SEED, log=None):
+    """
+    Function to run every case on every family and size; returns ``{"family/case/size": measurement}``.
+    """
+    # Imports, caches and lazy initialization are paid once here, not by the first measurement
+    warm = grid(16)
+    for case in cases:
+        run = CASES[case](warm)
+        if run is not None:
+            run()
+
+    results = {}
+    for family in families:
+        generate, edge_estimate = FAMILIES[family]
+        previous = {}
+        for n in sorted(sizes):
+            if edge_estimate(n) > MAX_EDGES:
+                break
+            pending = [case for case in cases if _projected(previous.get(case, []), n) <= time_limit]
+            if not pending:
+                break
+            compact = generate(n, seed=seed)
+            for case in pending:
+                run = CASES[case](compact)
+                if run is None:
+                    continue
+                entry = measure(run, repeat=repeat, memory=memory)
+                entry.update(nodes=compact.n, edges=compact.m)
+                results[f"{family}/{case}/{n}"] = entry
+                previous.setdefault(case, []).append((n, entry["seconds"]))
+                if log is not None:
+                    log(f"{family}/{case}/{n}", entry)
+    return results
+
+
+# -- app --------------------------------------------------------------------
+
+def _app_probe(repeat=3):
+    # Runs in a fresh interpreter (see app_benchmarks), so the first runs pay their imports
+    from streamlit.testing.v1 import AppTest
+
+    import views
+
+    app = AppTest.from_file(str(ROOT / "dmgt.py"), default_timeout=120)
+    timings = {}
+
+    def timed(key, run):
+        start = time.perf_counter()
+        run()
+        timings[key] = time.perf_counter() - start
+        if app.exception:
+            raise RuntimeError(f"{key}: {app.exception[0].value}")
+
+    timed("startup", app.run)
+    for page, name in views.PAGES.items():
+        if app.radio[0].value != page:
+            timed(f"{name}/first", app.radio[0].set_value(page).run)
+        reruns = []
+        for _ in range(repeat):
+            timed(f"{name}/rerun", app.run)
+            reruns.append(timings[f"{name}/rerun"])
+        timings[f"{name}/rerun"] = min(reruns)
+    print(json.dumps(timings))
+
+
+def app_benchmarks(repeat=3):
+    """
+    Function to time the Streamlit app from a fresh interpreter; returns ``{"app/...": measurement}``.
+
+    ``app/startup`` is the first run of the app (the Home page), ``app/<page>/first``
+    a page's first visit and ``app/<page>/rerun`` the best of ``repeat`` reruns of
+    it, none of them with user input. Each entry carries the budget it must meet.
+    """
+    from views import RERUN_BUDGET, STARTUP_BUDGET
+
+    probe = subprocess.run([sys.executable, "-c", f"import bench; bench._app_probe({repeat})"],
+                           cwd=ROOT, capture_output=True, text=True, check=True)
+    timings = json.loads(probe.stdout.strip().splitlines()[-1])
+    return {f"app/{key}": {"seconds": seconds, "peak_bytes": None, "nodes": "-", "edges": "-",
+                           "budget": RERUN_BUDGET if key.endswith("/rerun") else STARTUP_BUDGET}
+            for key, seconds in timings.items()}
+
+
+def compare(results, baseline, tolerance=TOLERANCE, noise=NOISE_SECONDS):
+    """
+    Status of every result against ``baseline``: ``new``, ``ok``, ``faster`` or ``REGRESSION``,
+    or ``OVER BUDGET`` for app timings slower than their budget.
+    """
+    status = {}
+    for key, entry in results.items():
+        if entry.get("budget") is not None and entry["seconds"] > entry["budget"]:
+            status[key] = ("OVER BUDGET", entry["seconds"] / entry["budget"])
+            continue
+        old = baseline.get(key)
+        if old is None:
+            status[key] = ("new", None)
+            continue
+        ratio = entry["seconds"] / max(old["seconds"], 1e-9)
+        if ratio > 1 + tolerance and entry["seconds"] - old["seconds"] > noise:
+            status[key] = ("REGRESSION", ratio)
+        elif ratio < 1 / (1 + tolerance) and old["seconds"] - entry["seconds"] > noise:
+            status[key] = ("faster", ratio)
+        else:
+            status[key] = ("ok", ratio)
+    return status
+
+
+def format_report(results, status):
+    lines = [f"{'benchmark':<40} {'nodes':>9} {'edges':>10} {'seconds':>10} {'peak MB':>9} {'vs base':>8}  status"]
+    for key, entry in results.items():
+        label, ratio = status[key]
+        peak = "-" if entry["peak_bytes"] is None else f"{entry['peak_bytes'] / 2 ** 20:.1f}"
+        ratio = "-" if ratio is None else f"{ratio:.2f}x"
+        note = entry.get("method") or entry.get("tier") or ""
+        lines.append(f"{key:<40} {entry['nodes']:>9} {entry['edges']:>10} {entry['seconds']:>10.4f} "
+                     f"{peak:>9} {ratio:>8}  {label} {note}".rstrip())
+    return "\n".join(lines)
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "networkx": nx.__version__,
+        "machine": platform.machine(),
+        "platform": platform.platform(terse=True),
+        "seed": SEED,
+    }
+
+
+def load_baseline(path=BASELINE_PATH):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"environment": None, "results": {}}
+
+
+def _names(value, known, what):
+    if value is None:
+        return list(known)
+    if value == "none":
+        return []
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in names if name not in known]
+    if unknown:
+        raise SystemExit(f"Unknown {what}: {', '.join(unknown)}. Use one of {', '.join(known)}.")
+    return names
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark planarity, metrics, layout and figure building.")
+    parser.add_argument("--families", help=f"comma-separated subset of {', '.join(FAMILIES)}")
+    parser.add_argument("--cases", help=f"comma-separated subset of {', '.join(CASES)}, or none")
+    parser.add_argument("--sizes", help="comma-separated node counts (default: 10 to 10^6 by factors of 10)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per measurement (best is kept)")
+    parser.add_argument("--time-limit", type=float, default=TIME_LIMIT,
+                        help="skip sizes where a case would take longer than this (seconds)")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc peak-memory run")
+    parser.add_argument("--app", action="store_true", help="also time the Streamlit pages against their budgets")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH), help="baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="merge these results into the baseline")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="allowed slowdown before a regression")
+    parser.add_argument("--check", action="store_true", help="exit with status 1 if anything regressed")
+    parser.add_argument("-o", "--output", help="also write the results and statuses as JSON here")
+    args = parser.parse_args(argv)
+
+    families = _names(args.families, FAMILIES, "families")
+    cases = _names(args.cases, CASES, "cases")
+    sizes = [int(float(s)) for s in args.sizes.split(",")] if args.sizes else SIZES
+
+    def log(key, entry):
+        print(f"  {key}: {entry['seconds']:.4f}s", file=sys.stderr, flush=True)
+
+    results = run_benchmarks(families, cases, sizes, repeat=args.repeat, memory=not args.no_memory,
+                             time_limit=args.time_limit, log=log) if cases else {}
+    if args.app:
+        results.update(app_benchmarks(repeat=args.repeat))
+    baseline = load_baseline(args.baseline)
+    status = compare(results, baseline["results"], tolerance=args.tolerance)
+    print(format_report(results, status))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"environment": environment(), "results": results,
+                       "status": {key: label for key, (label, _) in status.items()}}, f, indent=1)
+    if args.save_baseline:
+        baseline["environment"] = environment()
+        baseline["results"].update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=1, sort_keys=True)
+            f.write("\n")
+
+    regressions = [key for key, (label, _) in status.items() if label in ("REGRESSION", "OVER BUDGET")]
+    if regressions:
+        print(f"{len(regressions)} regression(s) against {args.baseline}", file=sys.stderr)
+    return 1 if args.check and regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,295 @@
+import hashlib
+from array import array
+from functools import cached_property
+
+import numpy as np
+
+
+def normalize_label(label):
+    """
+    Canonical form of a node label: ``1``, ``"1"`` and ``" 1 "`` are the same vertex.
+    """
+    return str(label).strip()
+
+
+class LabelInterner:
+    """
+    Maps node labels to dense integer IDs ``0..n-1`` and back.
+
+    Labels are normalized with ``normalize_label`` so the IDs agree with the
+    planarity cache: ``1``, ``"1"`` and ``" 1 "`` intern to the same vertex.
+    """
+
+    def __init__(self, labels=()):
+        self.labels = []
+        self._ids = {}
+        for label in labels:
+            self.intern(label)
+
+    def intern(self, label):
+        label = normalize_label(label)
+        node_id = self._ids.get(label)
+        if node_id is None:
+            node_id = self._ids[label] = len(self.labels)
+            self.labels.append(label)
+        return node_id
+
+    def get(self, label, default=None):
+        return self._ids.get(normalize_label(label), default)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, label):
+        return normalize_label(label) in self._ids
+
+
+class EdgeBuffer:
+    """
+    Append-only edge list stored as a flat ``array('q')`` of endpoint IDs (16 bytes per edge).
+    """
+
+    def __init__(self, interner=None):
+        self.interner = interner if interner is not None else LabelInterner()
+        self._flat = array("q")
+
+    def add(self, u, v):
+        self._flat.append(self.interner.intern(u))
+        self._flat.append(self.interner.intern(v))
+
+    def __len__(self):
+        return len(self._flat) // 2
+
+    def to_numpy(self):
+        """
+        ``(m, 2)`` int64 array sharing memory with the buffer (no copy).
+        """
+        return np.frombuffer(self._flat, dtype=np.int64).reshape(-1, 2)
+
+
+def iter_labeled_edges(edges, labels):
+    """
+    Yield ``(label_u, label_v)`` pairs for an integer edge array, converting it in chunks.
+    """
+    edges = np.asarray(edges).reshape(-1, 2)
+    for start in range(0, len(edges), 1 << 16):
+        for u, v in edges[start:start + (1 << 16)].tolist():
+            yield labels[u], labels[v]
+
+
+def is_canonical(edges, n):
+    """
+    Whether an ``(m, 2)`` edge array is already in ``CompactGraph`` form: rows ``u < v``, sorted, no duplicates.
+    """
+    edges = np.asarray(edges).reshape(-1, 2)
+    if not len(edges):
+        return True
+    keys = edges[:, 0].astype(np.int64) * max(n, 1) + edges[:, 1]
+    return bool((edges[:, 0] < edges[:, 1]).all() and (np.diff(keys) > 0).all()
+                and edges[:, 0].min() >= 0 and edges[:, 1].max() < n)
+
+
+def _csr(n, edges):
+    # (indptr, indices) listing every node's neighbors, for canonical edges
+    src = np.concatenate([edges[:, 0], edges[:, 1]])
+    dst = np.concatenate([edges[:, 1], edges[:, 0]])
+    order = np.argsort(src, kind="stable")
+    indices = dst[order].astype(np.int32 if n < 2 ** 31 else np.int64)
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+    return indptr, indices
+
+
+class CompactGraph:
+    """
+    Simple undirected graph over integer node IDs ``0..n-1`` with CSR adjacency.
+
+    ``labels[i]`` is the label of node ``i``; ``edges`` holds each edge once as a
+    sorted ``(u, v)`` row with ``u < v``; ``indptr``/``indices`` list every node's
+    neighbors; ``loops`` holds the nodes carrying a self-loop. This uses roughly
+    24 bytes per edge instead of NetworkX's dict-of-dict adjacency, and a
+    ``networkx.Graph`` is only built on demand by ``to_networkx``.
+    """
+
+    def __init__(self, edges, labels, loops=None):
+        self.labels = list(labels)
+        n = len(self.labels)
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+
+        is_loop = edges[:, 0] == edges[:, 1]
+        loop_nodes = edges[is_loop, 0]
+        if loops is not None:
+            loop_nodes = np.concatenate([loop_nodes, np.asarray(loops, dtype=np.int64)])
+        self.loops = np.unique(loop_nodes)
+
+        edges = np.sort(edges[~is_loop], axis=1)
+        keys = np.unique(edges[:, 0] * max(n, 1) + edges[:, 1])
+        self.edges = np.column_stack([keys // max(n, 1), keys % max(n, 1)])
+        self.indptr, self.indices = _csr(n, self.edges)
+
+    @classmethod
+    def from_labeled_edges(cls, edges, nodes=()):
+        """
+        Build from ``(u, v)`` label pairs; ``nodes`` adds (possibly isolated) vertices first.
+        """
+        interner = LabelInterner(nodes)
+        buffer = EdgeBuffer(interner)
+        for u, v in edges:
+            buffer.add(u, v)
+        return cls(buffer.to_numpy(), interner.labels)
+
+    @classmethod
+    def from_arrays(cls, labels, edges, loops, indptr, indices, content_hash=None, components=None):
+        """
+        Wrap arrays that already hold a graph's normalized edges and CSR adjacency, without copying or checking them.
+
+        Used to reopen a stored graph (e.g. memory-mapped ``.npy`` files);
+        ``content_hash`` and ``components`` may be given when they are known.
+        """
+        graph = cls.__new__(cls)
+        graph.labels = labels
+        graph.edges = edges
+        graph.loops = loops
+        graph.indptr = indptr
+        graph.indices = indices
+        if content_hash is not None:
+            graph._content_hash = content_hash
+        if components is not None:
+            graph.components = components
+        return graph
+
+    @classmethod
+    def from_canonical_edges(cls, edges, labels, loops=()):
+        """
+        Build from an ``int64`` edge array that ``is_canonical``, keeping the array itself (e.g. a memory map).
+
+        Other edge arrays go through the normalizing constructor.
+        """
+        labels = list(labels)
+        edges = np.asarray(edges).reshape(-1, 2)
+        if edges.dtype != np.int64 or not is_canonical(edges, len(labels)):
+            return cls(edges, labels, loops)
+        indptr, indices = _csr(len(labels), edges)
+        return cls.from_arrays(labels, edges, np.unique(np.asarray(loops, dtype=np.int64)), indptr, indices)
+
+    @classmethod
+    def from_buffer(cls, buffer):
+        return cls(buffer.to_numpy(), buffer.interner.labels)
+
+    @classmethod
+    def from_networkx(cls, graph):
+        return cls.from_labeled_edges(graph.edges(), nodes=graph.nodes())
+
+    @property
+    def n(self):
+        return len(self.labels)
+
+    @property
+    def m(self):
+        """
+        Number of distinct non-loop edges.
+        """
+        return len(self.edges)
+
+    def number_of_nodes(self):
+        return self.n
+
+    def number_of_edges(self):
+        """
+        Edge count including self-loops, matching ``networkx.Graph.number_of_edges``.
+        """
+        return self.m + len(self.loops)
+
+    def degree(self):
+        return np.diff(self.indptr)
+
+    def neighbors(self, node_id):
+        return self.indices[self.indptr[node_id]:self.indptr[node_id + 1]]
+
+    def to_scipy(self):
+        """
+        Symmetric adjacency as a ``scipy.sparse.csr_array`` sharing the CSR buffers.
+        """
+        import scipy.sparse as sp
+
+        data = np.ones(len(self.indices), dtype=np.int8)
+        return sp.csr_array((data, self.indices, self.indptr), shape=(self.n, self.n))
+
+    @cached_property
+    def components(self):
+        """
+        ``(count, component_id_per_node)`` of the connected components (isolated nodes count).
+        """
+        from scipy.sparse.csgraph import connected_components
+
+        return connected_components(self.to_scipy(), directed=False)
+
+    def is_bipartite(self):
+        """
+        Two-colorability test: the bipartite double cover of a graph has twice as many
+        components as the graph exactly when every component is bipartite.
+        """
+        from scipy.sparse.csgraph import connected_components
+        import scipy.sparse as sp
+
+        n = self.n
+        u, v = self.edges[:, 0], self.edges[:, 1]
+        rows = np.concatenate([u, u + n])
+        cols = np.concatenate([v + n, v])
+        cover = sp.coo_array((np.ones(len(rows), dtype=np.int8), (rows, cols)), shape=(2 * n, 2 * n))
+        count, _ = connected_components(cover, directed=False)
+        return count == 2 * self.components[0]
+
+    @cached_property
+    def index(self):
+        return {label: i for i, label in enumerate(self.labels)}
+
+    def __iter__(self):
+        return iter(self.labels)
+
+    def __len__(self):
+        return self.n
+
+    def __contains__(self, label):
+        return label in self.index
+
+    def content_hash(self):
+        """
+        Hash of the graph's content, independent of node IDs, edge order and edge direction.
+
+        Nodes are ranked by label so two inputs listing the same edges in any order
+        produce the same digest.
+        """
+        return self._content_hash
+
+    @cached_property
+    def _content_hash(self):
+        order = sorted(range(self.n), key=self.labels.__getitem__)
+        rank = np.empty(self.n, dtype=np.int64)
+        rank[order] = np.arange(self.n)
+        edges = np.sort(rank[self.edges], axis=1)
+        edges = edges[np.lexsort((edges[:, 1], edges[:, 0]))]
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update("\0".join(self.labels[i] for i in order).encode("utf-8"))
+        digest.update(b"\1")
+        digest.update(np.ascontiguousarray(edges, dtype="<i8").tobytes())
+        digest.update(b"\1")
+        digest.update(np.sort(rank[self.loops]).astype("<i8").tobytes())
+        return digest.hexdigest()
+
+    @cached_property
+    def _networkx(self):
+        import networkx as nx
+
+        graph = nx.Graph()
+        graph.add_nodes_from(self.labels)
+        graph.add_edges_from(iter_labeled_edges(self.edges, self.labels))
+        graph.add_edges_from((self.labels[i], self.labels[i]) for i in self.loops.tolist())
+        return graph
+
+    def to_networkx(self):
+        """
+        Equivalent ``networkx.Graph``, built on first use and then reused.
+        """
+        return self._networkx
@@ -0,0 +1,267 @@
+"""
+Deterministic synthetic graphs for load tests and benchmarks.
+
+Every generator takes a target node count ``n`` and a ``seed``, is vectorized
+with NumPy (no per-edge Python objects), and returns a ``CompactGraph`` whose
+labels are the node numbers as strings:
+
+    python generators.py delaunay 1000000 -o big.csv
+    python generators.py crossings 100000 --crossings 5 --count 50 -o graphs.jsonl
+
+The JSONL form (one ``{"id": ..., "edges": [...]}`` per line, seeds ``seed``,
+``seed + 1``, ...) is what ``batch.py`` reads.
+"""
+import argparse
+import json
+import sys
+
+import numpy as np
+
+from compact import CompactGraph
+
+
+def _compact(n, edges):
+    return CompactGraph(edges, np.arange(n).astype(str).tolist())
+
+
+def _triangle_edges(triangles):
+    return np.concatenate([triangles[:, [0, 1]], triangles[:, [1, 2]], triangles[:, [0, 2]]])
+
+
+def grid(n, seed=0):
+    """
+    Square grid with ``floor(sqrt(n))**2`` nodes.
+    """
+    side = max(int(np.sqrt(n)), 2)
+    ids = np.arange(side * side).reshape(side, side)
+    edges = np.concatenate([
+        np.column_stack([ids[:, :-1].ravel(), ids[:, 1:].ravel()]),
+        np.column_stack([ids[:-1, :].ravel(), ids[1:, :].ravel()]),
+    ])
+    return _compact(side * side, edges)
+
+
+def triangulated_grid(n, seed=0):
+    """
+    Square grid with one diagonal per cell, its direction chosen at random.
+    """
+    rng = np.random.default_rng(seed)
+    side = max(int(np.sqrt(n)), 2)
+    ids = np.arange(side * side).reshape(side, side)
+    top_left, top_right = ids[:-1, :-1].ravel(), ids[:-1, 1:].ravel()
+    bottom_left, bottom_right = ids[1:, :-1].ravel(), ids[1:, 1:].ravel()
+    flip = rng.random(len(top_left)) < 0.5
+    diagonals = np.where(flip[:, None],
+                         np.column_stack([top_right, bottom_left]),
+                         np.column_stack([top_left, bottom_right]))
+    edges = np.concatenate([
+        np.column_stack([ids[:, :-1].ravel(), ids[:, 1:].ravel()]),
+        np.column_stack([ids[:-1, :].ravel(), ids[1:, :].ravel()]),
+        diagonals,
+    ])
+    return _compact(side * side, edges)
+
+
+def _delaunay(n, rng):
+    from scipy.spatial import Delaunay
+
+    return Delaunay(rng.random((max(n, 3), 2)))
+
+
+def delaunay(n, seed=0):
+    """
+    Delaunay triangulation of ``n`` uniform random points in the unit square.
+    """
+    tri = _delaunay(n, np.random.default_rng(seed))
+    return _compact(len(tri.points), _triangle_edges(tri.simplices))
+
+
+def apollonian(n, seed=0):
+    """
+    Random Apollonian network: a maximal planar graph grown from a triangle by
+    placing new vertices into faces and joining them to the three corners.
+
+    Vertices are added in rounds, each splitting a random half of the current faces
+    at once, so the whole graph takes ``O(log n)`` vectorized steps.
+    """
+    rng = np.random.default_rng(seed)
+    n = max(n, 3)
+    faces = np.array([[0, 1, 2]], dtype=np.int64)
+    edges = [np.array([[0, 1], [1, 2], [0, 2]], dtype=np.int64)]
+    v = 3
+    while v < n:
+        k = min(n - v, max(len(faces) // 2, 1))
+        chosen = rng.choice(len(faces), size=k, replace=False)
+        new = np.arange(v, v + k)
+        a, b, c = faces[chosen].T
+        edges.append(np.concatenate([np.column_stack([a, new]), np.column_stack([b, new]),
+                                     np.column_stack([c, new])]))
+        faces[chosen] = np.column_stack([a, b, new])
+        faces = np.concatenate([faces, np.column_stack([b, c, new]), np.column_stack([a, c, new])])
+        v += k
+    return _compact(n, np.concatenate(edges))
+
+
+def with_crossings(n, crossings=1, seed=0):
+    """
+    Delaunay graph plus ``crossings`` extra edges, each the other diagonal of a convex
+    quadrilateral formed by two adjacent triangles.
+
+    In the Delaunay drawing every extra edge crosses exactly one edge, so the graph
+    has crossing number at most ``crossings``. The ends of an extra edge are never
+    both on the convex hull, so they share no face of the triangulation, which
+    makes the graph non-planar whenever the triangulation is 3-connected (for
+    random points, practically always). With fewer crossings than hull vertices it stays below the ``3n - 6`` edge
+    bound, so the planarity test cannot shortcut it.
+    """
+    rng = np.random.default_rng(seed)
+    tri = _delaunay(n, rng)
+    points, simplices, neighbors = tri.points, tri.simplices, tri.neighbors
+    on_hull = np.zeros(len(points), dtype=bool)
+    on_hull[tri.convex_hull.ravel()] = True
+
+    # Triangle s and its neighbor t across the edge opposite corner i of s
+    s, i = np.nonzero(neighbors > np.arange(len(simplices))[:, None])
+    t = neighbors[s, i]
+    c = simplices[s, i]
+    d = simplices[t, np.argmax(neighbors[t] == s[:, None], axis=1)]
+    a, b = simplices[s, (i + 1) % 3], simplices[s, (i + 2) % 3]
+
+    def side(p, q, r):
+        return np.sign((points[q, 0] - points[p, 0]) * (points[r, 1] - points[p, 1])
+                       - (points[q, 1] - points[p, 1]) * (points[r, 0] - points[p, 0]))
+
+    convex = side(c, d, a) * side(c, d, b) < 0
+    candidates = np.flatnonzero(convex & ~(on_hull[c] & on_hull[d]))
+    extra, used = [], set()
+    for j in rng.permutation(candidates).tolist():
+        if len(extra) == crossings:
+            break
+        # Disjoint quadrilaterals keep the extra edges from crossing each other
+        if s[j] in used or t[j] in used:
+            continue
+        used.update((s[j], t[j]))
+        extra.append((c[j], d[j]))
+    if len(extra) < crossings:
+        raise ValueError(f"Only {len(extra)} crossings fit into a {len(points)}-node triangulation")
+    edges = np.concatenate([_triangle_edges(simplices), np.array(extra, dtype=np.int64).reshape(-1, 2)])
+    return _compact(len(points), edges)
+
+
+def complete(n, seed=0):
+    u, v = np.triu_indices(n, k=1)
+    return _compact(n, np.column_stack([u, v]))
+
+
+def _pairs_from_index(index, n):
+    """
+    The pairs ``u < v`` at positions ``index`` of the row-major upper triangle of an ``n`` x ``n`` matrix.
+    """
+    b = 2 * n - 1
+    u = ((b - np.sqrt(b * b - 8.0 * index)) // 2).astype(np.int64)
+    # The square root can land one row off for large n
+    for _ in range(2):
+        u -= u * (b - u) // 2 > index
+        u += (u + 1) * (b - u - 1) // 2 <= index
+    return np.column_stack([u, index - u * (b - u) // 2 + u + 1])
+
+
+def gnp(n, seed=0, mean_degree=3.0):
+    """
+    Sparse G(n, p) with ``p = mean_degree / (n - 1)``: a binomial number of distinct pairs
+    ``u < v``, drawn as positions in the list of all pairs without replacement.
+    """
+    rng = np.random.default_rng(seed)
+    pairs = n * (n - 1) // 2
+    p = min(mean_degree / max(n - 1, 1), 1.0)
+    m = rng.binomial(pairs, p)
+    index = np.sort(rng.choice(pairs, size=m, replace=False)) if m else np.zeros(0, dtype=np.int64)
+    return _compact(n, _pairs_from_index(index, n))
+
+
+def random_tree(n, seed=0):
+    """
+    Random recursive tree: node ``i`` hangs off a uniformly chosen earlier node.
+    """
+    rng = np.random.default_rng(seed)
+    child = np.arange(1, n)
+    parent = (rng.random(n - 1) * child).astype(np.int64)
+    return _compact(n, np.column_stack([parent, child]))
+
+
+GENERATORS = {
+    "grid": grid,
+    "triangulated-grid": triangulated_grid,
+    "delaunay": delaunay,
+    "apollonian": apollonian,
+    "crossings": with_crossings,
+    "complete": complete,
+    "gnp": gnp,
+    "tree": random_tree,
+}
+
+
+def generate(name, n, seed=0, **options):
+    """
+    Function to generate a graph of family ``name`` with about ``n`` nodes.
+    """
+    if name not in GENERATORS:
+        raise ValueError(f"Unknown graph family '{name}'. Use one of {tuple(GENERATORS)}.")
+    return GENERATORS[name](n, seed=seed, **options)
+
+
+def estimate_edges(name, n, **options):
+    """
+    Function to bound the number of edges ``generate(name, n, **options)`` produces, without generating it.
+    """
+    if name not in GENERATORS:
+        raise ValueError(f"Unknown graph family '{name}'. Use one of {tuple(GENERATORS)}.")
+    if name == "complete":
+        return n * (n - 1) // 2
+    if name == "gnp":
+        # Binomial around mean_degree * n / 2; a few standard deviations cover it
+        mean = options.get("mean_degree", 3.0) * n / 2
+        return int(mean + 4 * np.sqrt(mean))
+    if name == "tree":
+        return max(n - 1, 0)
+    if name == "grid":
+        return 2 * n
+    return 3 * n + options.get("crossings", 1)
+
+
+def write_edge_list(compact, stream):
+    np.savetxt(stream, compact.edges, fmt="%d", delimiter=",")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic graphs for load tests.")
+    parser.add_argument("family", choices=GENERATORS)
+    parser.add_argument("nodes", type=lambda s: int(float(s)), help="target node count, e.g. 1e6")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--crossings", type=int, default=1, help="extra crossing edges (crossings family)")
+    parser.add_argument("--count", type=int, default=1, help="graphs to write (JSONL output only)")
+    parser.add_argument("-o", "--output", default="-", help="edge-list CSV, or .jsonl for batch.py (default: stdout)")
+    args = parser.parse_args(argv)
+
+    options = {"crossings": args.crossings} if args.family == "crossings" else {}
+    jsonl = args.output.endswith(".jsonl")
+    if args.count > 1 and not jsonl:
+        parser.error("--count needs a .jsonl output")
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        for i in range(args.count):
+            compact = generate(args.family, args.nodes, seed=args.seed + i, **options)
+            if jsonl:
+                out.write(json.dumps({"id": f"{args.family}-{args.nodes}-{args.seed + i}",
+                                      "edges": compact.edges.tolist()}, separators=(",", ":")))
+                out.write("\n")
+            else:
+                write_edge_list(compact, out)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
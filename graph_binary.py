@@ -0,0 +1,464 @@
+"""
+Compact binary graph files (``.pgb``), an alternative to JSON edge lists.
+
+A file is a fixed header followed by a body of typed sections:
+
+    header   magic "PGBF", version, compression, flags, node/edge/loop counts, section count
+    LABL     node labels, UTF-8, NUL-separated (omitted when the labels are "0".."n-1")
+    EDU/EDV  the sorted edge array, delta- and varint-encoded (about 2-3 bytes per edge)
+    EDGE     or the same array as raw little-endian int64 rows, for zero-copy reading,
+    ADJP/ADJI  with the CSR adjacency (``indptr``/``indices``) alongside it
+    LOOP     nodes carrying a self-loop
+    XY       optional layout coordinates, one (x, y) row per node
+    ROTO/ROTT  optional planar rotation system (offsets and clockwise targets per node)
+
+Every section starts with its tag, NumPy dtype and byte length, and is padded to
+8 bytes, so an uncompressed file can be memory-mapped and every array viewed in
+place with ``np.frombuffer``. The body may be compressed with gzip, or with zstd
+when the ``zstandard`` package is installed; a compressed file is decompressed
+once and its arrays are views of that buffer. The raw encoding with no
+compression is the zero-copy one (it also stores the CSR adjacency, so the
+graph opens without any array work), and the delta encoding (the default) is the
+compact one: a million-edge planar graph takes a few MB instead of the
+hundreds of MB of its JSON export.
+
+Files are untrusted input (uploads, the API): every count in the header is
+checked against the data behind it, and node IDs against the node count, before
+anything is allocated from it, and a file that would decode to more than
+``MAX_DECODED_BYTES`` (``PLANAR_PGB_MAX_BYTES``) is refused, so a corrupt or
+forged file fails with ``ValueError`` instead of exhausting memory.
+
+    write_graph(compact, "graph.pgb", layout=layout, rotation=embedding, compression="gzip")
+    read("graph.pgb").compact
+
+    python graph_binary.py convert graph.json graph.pgb --compression gzip
+    python graph_binary.py convert graph.pgb graph.graphml
+    python graph_binary.py info graph.pgb
+
+``convert`` reads anything ``ingest.load_graph`` does (edge lists, GraphML,
+``.pgb``) and writes ``.pgb``, GraphML or a CSV edge list by the output's extension.
+"""
+import argparse
+import csv
+import gzip
+import mmap
+import os
+import struct
+import sys
+import zlib
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from compact import CompactGraph, is_canonical, iter_labeled_edges
+
+MAGIC = b"PGBF"
+FORMAT_VERSION = 1
+COMPRESSIONS = ("none", "gzip", "zstd")
+EDGE_ENCODINGS = ("delta", "raw")
+
+# Header flags
+LABELS_ARE_RANGE = 1
+
+_HEADER = struct.Struct("<4sHBBQQQI4x")
+_SECTION = struct.Struct("<4s4sQ")
+# Dtypes a section may have; other tags are skipped
+_SECTION_DTYPES = {
+    b"LABL": ("|u1",), b"EDU": ("|u1",), b"EDV": ("|u1",), b"EDGE": ("<i8",), b"ADJP": ("<i8",),
+    b"ADJI": ("<i4", "<i8"), b"LOOP": ("<i8",), b"XY": ("<f8",), b"ROTO": ("<i8",), b"ROTT": ("<i4", "<i8"),
+}
+
+# Largest decoded graph accepted: the decompressed body, and the declared counts
+# at about NODE_BYTES per node (label string, CSR row) and EDGE_BYTES per edge or loop
+MAX_DECODED_BYTES = int(os.environ.get("PLANAR_PGB_MAX_BYTES", 1 << 30))
+NODE_BYTES = 64
+EDGE_BYTES = 48
+
+
+@dataclass(eq=False)
+class BinaryGraph:
+    """
+    Contents of a ``.pgb`` file: the graph and, when the file has them, its layout and rotation system.
+
+    ``coords`` is aligned with ``compact.labels``; the rotation system is
+    ``targets[offsets[u]:offsets[u + 1]]``, the clockwise neighbors of node ``u``.
+    """
+    compact: CompactGraph
+    coords: np.ndarray = field(default=None, repr=False)
+    offsets: np.ndarray = field(default=None, repr=False)
+    targets: np.ndarray = field(default=None, repr=False)
+
+    @property
+    def positions(self):
+        """
+        The stored layout as a ``LayoutResult``, or ``None``.
+        """
+        from layout import LayoutResult
+
+        if self.coords is None:
+            return None
+        return LayoutResult(self.compact.labels, self.coords, "given", 0.0, self.compact.index, self.compact.edges)
+
+
+def _varint_encode(values):
+    # LEB128: 7 bits per byte, high bit set on every byte but a value's last
+    values = np.asarray(values, dtype=np.uint64)
+    nbytes = np.ones(len(values), dtype=np.int64)
+    rest = values >> np.uint64(7)
+    while rest.any():
+        nbytes += rest > 0
+        rest >>= np.uint64(7)
+    ends = np.cumsum(nbytes)
+    starts = ends - nbytes
+    out = np.empty(int(ends[-1]) if len(values) else 0, dtype=np.uint8)
+    for k in range(int(nbytes.max()) if len(values) else 0):
+        has = nbytes > k
+        chunk = (values[has] >> np.uint64(7 * k)) & np.uint64(0x7F)
+        out[starts[has] + k] = chunk.astype(np.uint8) | ((nbytes[has] > k + 1).astype(np.uint8) << 7)
+    return out
+
+
+def _varint_decode(data, count):
+    data = np.asarray(data, dtype=np.uint8)
+    last = data < 0x80
+    ends = np.flatnonzero(last)
+    if len(ends) != count or (len(data) and not last[-1]):
+        raise ValueError("Corrupt varint stream")
+    if not count:
+        return np.zeros(0, dtype=np.uint64)
+    starts = np.concatenate([[0], ends[:-1] + 1])
+    owner = np.cumsum(last) - last
+    shift = ((np.arange(len(data)) - starts[owner]) * 7).astype(np.uint64)
+    return np.add.reduceat((data & 0x7F).astype(np.uint64) << shift, starts)
+
+
+def join_labels(labels):
+    """
+    Node labels as NUL-separated UTF-8; ``ValueError`` if a label contains a NUL itself, which would split it.
+    """
+    blob = "\0".join(labels).encode("utf-8")
+    if blob.count(b"\0") != max(len(labels) - 1, 0):
+        raise ValueError("Node labels may not contain NUL characters")
+    return blob
+
+
+def encode_edges(edges):
+    """
+    Delta-encode a canonical edge array into two varint streams ``(du, dv)``.
+
+    ``du`` is the step of the first endpoint from the previous row; ``dv`` is the
+    gap to the previous second endpoint in the same row (to ``u`` in a new row), minus one.
+    """
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    u, v = edges[:, 0], edges[:, 1]
+    du = np.diff(u, prepend=0)
+    new_row = np.ones(len(edges), dtype=bool)
+    new_row[1:] = du[1:] != 0
+    previous = np.where(new_row, u, np.concatenate([[0], v[:-1]]))
+    return _varint_encode(du), _varint_encode(v - previous - 1)
+
+
+def decode_edges(du, dv, m):
+    """
+    Inverse of ``encode_edges``: the ``(m, 2)`` int64 edge array.
+    """
+    du = _varint_decode(du, m).astype(np.int64)
+    gaps = _varint_decode(dv, m).astype(np.int64) + 1
+    u = np.cumsum(du)
+    new_row = np.ones(m, dtype=bool)
+    new_row[1:] = du[1:] != 0
+    total = np.cumsum(gaps)
+    row_start = np.maximum.accumulate(np.where(new_row, np.arange(m), 0))
+    v = u + total - (total[row_start] - gaps[row_start])
+    return np.column_stack([u, v])
+
+
+def _compress(body, compression, level):
+    if compression == "gzip":
+        return gzip.compress(body, compresslevel=6 if level is None else level, mtime=0)
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.ZstdCompressor(level=3 if level is None else level).compress(body)
+    return body
+
+
+def _decompress(body, compression, limit):
+    # Decompress at most ``limit`` bytes, so a small file cannot expand without bound
+    if compression == "gzip":
+        inflater = zlib.decompressobj(wbits=31)
+        try:
+            out = inflater.decompress(body, limit + 1)
+        except zlib.error as e:
+            raise ValueError(f"Corrupt gzip body: {e}") from e
+        if len(out) > limit:
+            raise ValueError(f"Binary graph body exceeds the {limit}-byte decode limit")
+        if not inflater.eof:
+            raise ValueError("Truncated gzip body")
+        return out
+    if compression == "zstd":
+        import zstandard
+
+        chunks, size = [], 0
+        try:
+            with zstandard.ZstdDecompressor().stream_reader(bytes(body)) as reader:
+                while size <= limit:
+                    chunk = reader.read(min(1 << 20, limit + 1 - size))
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+                    size += len(chunk)
+        except zstandard.ZstdError as e:
+            raise ValueError(f"Corrupt zstd body: {e}") from e
+        if size > limit:
+            raise ValueError(f"Binary graph body exceeds the {limit}-byte decode limit")
+        return b"".join(chunks)
+    return body
+
+
+def _check_ids(ids, n, what):
+    if len(ids) and (ids.min() < 0 or ids.max() >= n):
+        raise ValueError(f"{what} refer to nodes outside 0..{n - 1}")
+
+
+def _is_offsets(offsets, n, total):
+    # CSR-style row offsets: n + 1 of them, from 0 up to ``total``, never decreasing
+    return (len(offsets) == n + 1 and offsets[0] == 0 and offsets[-1] == total
+            and bool((np.diff(offsets) >= 0).all()))
+
+
+def _coords_for(compact, layout):
+    if hasattr(layout, "coords"):
+        if list(layout.nodes) == compact.labels:
+            return np.asarray(layout.coords, dtype="<f8")
+        return np.asarray(layout.coords, dtype="<f8")[[layout.index[label] for label in compact.labels]]
+    if isinstance(layout, dict):
+        return np.array([layout[label] for label in compact.labels], dtype="<f8").reshape(-1, 2)
+    return np.asarray(layout, dtype="<f8").reshape(-1, 2)
+
+
+def encode(graph, layout=None, rotation=None, encoding="delta", compression="none", level=None):
+    """
+    Function to serialize a graph to ``.pgb`` bytes.
+
+    ``graph`` is a ``CompactGraph`` or a list of label pairs. ``layout`` (a
+    ``LayoutResult``, ``{node: (x, y)}`` or an ``(n, 2)`` array aligned with the
+    labels) and ``rotation`` (a ``PlanarEmbedding`` or ``(offsets, targets)``)
+    are stored when given. ``encoding`` is one of ``EDGE_ENCODINGS`` and
+    ``compression`` one of ``COMPRESSIONS``.
+    """
+    if encoding not in EDGE_ENCODINGS:
+        raise ValueError(f"Unknown edge encoding '{encoding}'. Use one of {EDGE_ENCODINGS}.")
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown compression '{compression}'. Use one of {COMPRESSIONS}.")
+    compact = graph if isinstance(graph, CompactGraph) else CompactGraph.from_labeled_edges(graph)
+    n, flags = compact.n, 0
+
+    sections = []
+    if compact.labels == [str(i) for i in range(n)]:
+        flags |= LABELS_ARE_RANGE
+    else:
+        sections.append((b"LABL", np.frombuffer(join_labels(compact.labels), dtype=np.uint8)))
+    if encoding == "delta":
+        du, dv = encode_edges(compact.edges)
+        sections += [(b"EDU", du), (b"EDV", dv)]
+    else:
+        sections += [(b"EDGE", compact.edges.astype("<i8")), (b"ADJP", compact.indptr.astype("<i8")),
+                     (b"ADJI", compact.indices.astype(compact.indices.dtype.newbyteorder("<")))]
+    if len(compact.loops):
+        sections.append((b"LOOP", compact.loops.astype("<i8")))
+    if layout is not None:
+        sections.append((b"XY", _coords_for(compact, layout)))
+    if rotation is not None:
+        if not isinstance(rotation, tuple):
+            from metrics import rotation_arrays
+
+            rotation = rotation_arrays(compact, rotation)
+        offsets, targets = rotation
+        sections += [(b"ROTO", np.asarray(offsets, dtype="<i8")),
+                     (b"ROTT", np.asarray(targets).astype(compact.indices.dtype.newbyteorder("<")))]
+
+    parts = []
+    for tag, array in sections:
+        data = np.ascontiguousarray(array).tobytes()
+        parts.append(_SECTION.pack(tag, array.dtype.str.encode("ascii"), len(data)))
+        parts.append(data)
+        parts.append(b"\0" * (-len(data) % 8))
+    body = _compress(b"".join(parts), compression, level)
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, COMPRESSIONS.index(compression), flags, n, compact.m,
+                          len(compact.loops), len(sections))
+    return header + body
+
+
+def decode(data, max_bytes=MAX_DECODED_BYTES):
+    """
+    Function to read ``.pgb`` bytes (``bytes``, ``memoryview`` or ``mmap``) into a ``BinaryGraph``.
+
+    The arrays are views of ``data`` (or of its decompressed body) where the
+    encoding allows; a raw edge array is used as the graph's ``edges`` as is.
+    Raises ``ValueError`` for a malformed file, or one that would take more than
+    ``max_bytes`` to decode.
+    """
+    data = memoryview(data)
+    if len(data) < _HEADER.size or bytes(data[:4]) != MAGIC:
+        raise ValueError("Not a binary graph file")
+    _, version, compression, flags, n, m, loop_count, count = _HEADER.unpack_from(data)
+    if version > FORMAT_VERSION:
+        raise ValueError(f"Binary graph format version {version} is newer than this reader ({FORMAT_VERSION})")
+    if compression >= len(COMPRESSIONS):
+        raise ValueError(f"Unknown compression code {compression}")
+    if n * NODE_BYTES + (m + loop_count) * EDGE_BYTES > max_bytes:
+        raise ValueError(f"Binary graph of {n} nodes and {m} edges exceeds the {max_bytes}-byte decode limit")
+    try:
+        body = data[_HEADER.size:]
+        if compression:
+            body = memoryview(_decompress(body, COMPRESSIONS[compression], max_bytes))
+        sections, offset = {}, 0
+        for _ in range(count):
+            tag, dtype, length = _SECTION.unpack_from(body, offset)
+            offset += _SECTION.size
+            tag, dtype = tag.rstrip(b"\0"), dtype.rstrip(b"\0").decode("ascii")
+            if tag in _SECTION_DTYPES:
+                if dtype not in _SECTION_DTYPES[tag]:
+                    raise ValueError(f"section {tag.decode('ascii')} has dtype {dtype}")
+                itemsize = np.dtype(dtype).itemsize
+                if length % itemsize or offset + length > len(body):
+                    raise ValueError(f"section {tag.decode('ascii')} has a bad length")
+                sections[tag] = np.frombuffer(body, dtype=dtype, count=length // itemsize, offset=offset)
+            offset += length + (-length % 8)
+    except (struct.error, EOFError, OSError, TypeError, UnicodeDecodeError) as e:
+        raise ValueError(f"Corrupt binary graph file: {e}") from e
+
+    required = [b"EDGE"] if b"EDGE" in sections else [b"EDU", b"EDV"]
+    if not flags & LABELS_ARE_RANGE:
+        required.append(b"LABL")
+    missing = [tag.decode("ascii") for tag in required if tag not in sections]
+    if missing:
+        raise ValueError(f"Binary graph file lacks the {', '.join(missing)} section(s)")
+
+    # Check every count against the data behind it before building anything from it
+    if not flags & LABELS_ARE_RANGE:
+        separators = int(np.count_nonzero(sections[b"LABL"] == 0))
+        found = separators + 1 if n or len(sections[b"LABL"]) else 0
+        if found != n:
+            raise ValueError(f"Expected {n} node labels, found {found}")
+    if b"EDGE" in sections:
+        if len(sections[b"EDGE"]) != 2 * m:
+            raise ValueError(f"Expected {m} edges, found {len(sections[b'EDGE']) / 2:g}")
+        edges = sections[b"EDGE"].reshape(m, 2)
+    else:
+        edges = decode_edges(sections[b"EDU"], sections[b"EDV"], m)  # checks the varint counts first
+    _check_ids(edges, n, "Edges")
+    loops = sections.get(b"LOOP", np.zeros(0, dtype=np.int64))
+    if len(loops) != loop_count:
+        raise ValueError(f"Expected {loop_count} self-loops, found {len(loops)}")
+    _check_ids(loops, n, "Self-loops")
+    coords = sections.get(b"XY")
+    if coords is not None:
+        if len(coords) != 2 * n:
+            raise ValueError(f"Expected {n} layout rows, found {len(coords) / 2:g}")
+        coords = coords.reshape(n, 2)
+    offsets, targets = sections.get(b"ROTO"), sections.get(b"ROTT")
+    if (offsets is None) != (targets is None) or offsets is not None and (
+            not _is_offsets(offsets, n, len(targets)) or len(targets) and (targets.min() < 0 or targets.max() >= n)):
+        raise ValueError("Corrupt rotation system")
+
+    if flags & LABELS_ARE_RANGE:
+        labels = np.arange(n).astype(str).tolist()
+    else:
+        labels = sections[b"LABL"].tobytes().decode("utf-8").split("\0") if n else []
+    indptr, indices = sections.get(b"ADJP"), sections.get(b"ADJI")
+    if (indptr is not None and indices is not None and len(indices) == 2 * m and _is_offsets(indptr, n, 2 * m)
+            and is_canonical(edges, n) and (not m or 0 <= indices.min() and indices.max() < n)):
+        compact = CompactGraph.from_arrays(labels, edges, loops, indptr, indices)
+    else:
+        compact = CompactGraph.from_canonical_edges(edges, labels, loops)
+    return BinaryGraph(compact, coords, offsets, targets)
+
+
+def read(source, max_bytes=MAX_DECODED_BYTES):
+    """
+    Function to read a ``.pgb`` file (path, bytes or binary file object) into a ``BinaryGraph``.
+
+    A path is memory-mapped, so the arrays of an uncompressed file are never copied.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            return decode(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), max_bytes)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return decode(source, max_bytes)
+    return decode(source.read(), max_bytes)
+
+
+def is_binary_graph(head):
+    return bytes(head[:len(MAGIC)]) == MAGIC
+
+
+def write_graph(graph, path, **options):
+    """
+    Function to write a graph by the extension of ``path``: ``.pgb``, ``.graphml`` or a CSV edge list.
+
+    ``options`` are passed to ``encode`` for ``.pgb`` files.
+    """
+    compact = graph if isinstance(graph, CompactGraph) else CompactGraph.from_labeled_edges(graph)
+    lowered = str(path).lower()
+    if lowered.endswith(".pgb"):
+        data = encode(compact, **options)
+        with open(path, "wb") as f:
+            f.write(data)
+    elif lowered.endswith((".graphml", ".graphml.gz")):
+        import networkx as nx
+
+        nx.write_graphml(compact.to_networkx(), path)
+    else:
+        opener = gzip.open if lowered.endswith(".gz") else open
+        with opener(path, "wt", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["source", "target"])
+            writer.writerows(iter_labeled_edges(compact.edges, compact.labels))
+            writer.writerows((compact.labels[u], compact.labels[u]) for u in compact.loops.tolist())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert graphs to and from the binary .pgb format.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    convert = commands.add_parser("convert", help="convert between .pgb, GraphML and edge lists")
+    convert.add_argument("source")
+    convert.add_argument("target")
+    convert.add_argument("--encoding", choices=EDGE_ENCODINGS, default="delta")
+    convert.add_argument("--compression", choices=COMPRESSIONS, default="none")
+    info = commands.add_parser("info", help="describe a .pgb file")
+    info.add_argument("path")
+    args = parser.parse_args(argv)
+
+    if args.command == "info":
+        with open(args.path, "rb") as f:
+            _, version, compression, flags, n, m, loops, count = _HEADER.unpack(f.read(_HEADER.size))
+        graph = read(args.path)
+        print(f"version {version}, {COMPRESSIONS[compression]} compression, {n} nodes, {m} edges, {loops} loops, "
+              f"layout: {'yes' if graph.coords is not None else 'no'}, "
+              f"rotation system: {'yes' if graph.offsets is not None else 'no'}")
+        return 0
+
+    options = {}
+    if args.target.lower().endswith(".pgb"):
+        options = {"encoding": args.encoding, "compression": args.compression}
+    with open(args.source, "rb") as f:
+        binary = is_binary_graph(f.read(len(MAGIC)))
+    if binary:
+        # Keep the layout and rotation system when converting between .pgb files
+        loaded = read(args.source)
+        graph = loaded.compact
+        if options:
+            options.update(layout=loaded.coords,
+                           rotation=(loaded.offsets, loaded.targets) if loaded.offsets is not None else None)
+    else:
+        from ingest import load_graph
+
+        graph = load_graph(args.source)
+    write_graph(graph, args.target, **options)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
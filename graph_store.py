@@ -0,0 +1,360 @@
+"""
+Persistent store of analysed graphs, shared between sessions by short IDs.
+
+A graph saved here keeps its compact integer edge array together with
+everything the app derived from it (planarity result, rotation system, layout,
+Kuratowski witness and, when one was computed, the planarization), so opening
+it again costs no parsing and no graph computation:
+
+    store = GraphStore()
+    graph_id = store.save(compact, result=result, layout=layout)   # e.g. "3f9a0c2b71d4"
+    stored = store.open(graph_id)                                # StoredGraph
+
+    python graph_store.py save big.csv
+    python graph_store.py list
+
+Graphs are keyed by ``CompactGraph.content_hash``, so saving the same graph twice
+yields the same ID; the ID is a prefix of the hash, lengthened only if two graphs
+share it. ``index.sqlite`` maps IDs to hashes and holds the small analysis
+results as JSON; the arrays are ``.npy`` files under ``<hash>/``, written to a
+temporary directory that is renamed into place, and are memory-mapped when the
+graph is opened, so a million-edge graph reopens in milliseconds and every
+process shares the same pages. The store lives in ``.cache/graphs`` or
+``PLANAR_GRAPH_STORE``.
+"""
+import argparse
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import time
+import uuid
+from contextlib import closing
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+
+import numpy as np
+
+from compact import CompactGraph
+from graph_binary import join_labels
+from instrument import span
+
+GRAPH_STORE_DIR = Path(os.environ.get("PLANAR_GRAPH_STORE", Path(__file__).resolve().parent / ".cache" / "graphs"))
+FORMAT_VERSION = 1
+
+# Hex digits of the content hash used as the shareable ID
+SHARE_ID_LENGTH = 12
+
+# Arrays of the graph itself, always present
+GRAPH_ARRAYS = ("edges", "loops", "indptr", "indices", "components")
+# Arrays of the analysis, present when it produced them
+ANALYSIS_ARRAYS = ("coords", "offsets", "targets", "removed", "planarization_coords")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS graphs (
+    id TEXT PRIMARY KEY,
+    hash TEXT NOT NULL UNIQUE,
+    name TEXT,
+    nodes INTEGER NOT NULL,
+    edges INTEGER NOT NULL,
+    created REAL NOT NULL,
+    analysis TEXT NOT NULL
+)
+"""
+
+
+@dataclass(eq=False)
+class StoredGraph:
+    """
+    A graph opened from the store, with its saved analysis.
+
+    Reads like a ``PlanarityResult`` (``is_planar``, ``V``, ``E``, ``F``, ``C``,
+    ``tier``, ``compact``, ``kuratowski``), with ``positions`` being the saved
+    ``LayoutResult``. The graph's arrays are memory-mapped; the rotation system is
+    ``targets[offsets[u]:offsets[u + 1]]`` (empty for non-planar graphs) and is
+    turned into a ``PlanarEmbedding`` only when ``embedding`` is asked for.
+    """
+    id: str
+    hash: str
+    name: str
+    created: float
+    compact: CompactGraph
+    analysis: dict
+    arrays: dict = field(repr=False)
+
+    @property
+    def is_planar(self):
+        return self.analysis["is_planar"]
+
+    @property
+    def tier(self):
+        return self.analysis["tier"]
+
+    @property
+    def V(self):
+        return self.analysis["V"]
+
+    @property
+    def E(self):
+        return self.analysis["E"]
+
+    @property
+    def F(self):
+        return self.analysis["F"]
+
+    @property
+    def C(self):
+        return self.analysis["C"]
+
+    @cached_property
+    def positions(self):
+        """
+        The saved ``LayoutResult`` (aligned with ``compact``), or ``None``.
+        """
+        from layout import LayoutResult
+
+        if "coords" not in self.arrays:
+            return None
+        return LayoutResult(self.compact.labels, self.arrays["coords"], self.analysis["layout_method"], 0.0,
+                            self.compact.index, self.compact.edges)
+
+    @cached_property
+    def embedding(self):
+        """
+        ``PlanarEmbedding`` rebuilt from the saved rotation system, or ``None`` for non-planar graphs.
+        """
+        import networkx as nx
+
+        if not self.is_planar or "offsets" not in self.arrays:
+            return None
+        labels, offsets, targets = self.compact.labels, self.arrays["offsets"], self.arrays["targets"]
+        embedding = nx.PlanarEmbedding()
+        embedding.add_nodes_from(labels)
+        embedding.set_data({labels[u]: [labels[v] for v in targets[offsets[u]:offsets[u + 1]].tolist()]
+                            for u in range(len(labels))})
+        return embedding
+
+    @cached_property
+    def kuratowski(self):
+        from kuratowski import KuratowskiWitness
+
+        witness = self.analysis.get("kuratowski")
+        if witness is None:
+            return None
+        return KuratowskiWitness(witness["kind"], witness["branch_vertices"], witness["paths"],
+                                 [tuple(edge) for edge in witness["edges"]],
+                                 tuple(tuple(side) for side in witness["sides"]) if witness["sides"] else None)
+
+    @cached_property
+    def planarization(self):
+        """
+        The saved ``PlanarizationResult``, or ``None`` if none was saved.
+        """
+        from layout import LayoutResult
+        from planarize import PlanarizationResult
+
+        saved = self.analysis.get("planarization")
+        if saved is None:
+            return None
+        compact, removed = self.compact, np.asarray(self.arrays["removed"]).reshape(-1, 2)
+        n = max(compact.n, 1)
+        kept = compact.edges[~np.isin(compact.edges[:, 0] * n + compact.edges[:, 1], removed[:, 0] * n + removed[:, 1])]
+        labels = compact.labels
+        layout = LayoutResult(labels, self.arrays["planarization_coords"], saved["layout_method"], saved["elapsed"],
+                              compact.index, compact.edges)
+        return PlanarizationResult(
+            [(labels[u], labels[v]) for u, v in kept.tolist()],
+            [(labels[u], labels[v]) for u, v in removed.tolist()],
+            layout, saved["crossings"], saved["maximal"], saved["complete"], saved["elapsed"])
+
+
+def _aligned_coords(compact, layout):
+    # Layout coordinates reordered to compact's node IDs
+    if list(layout.nodes) == compact.labels:
+        return np.asarray(layout.coords, dtype=np.float64)
+    return np.asarray(layout.coords, dtype=np.float64)[[layout.index[label] for label in compact.labels]]
+
+
+class GraphStore:
+    """
+    Saved graphs under ``root``: an SQLite index plus one directory of ``.npy`` arrays per graph.
+
+    Safe to use from several threads and processes: every operation opens its own
+    SQLite connection, and a graph's directory is complete before its row exists.
+    """
+
+    def __init__(self, root=GRAPH_STORE_DIR):
+        self.root = Path(root)
+
+    def _connect(self):
+        self.root.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(self.root / "index.sqlite", timeout=30)
+        db.row_factory = sqlite3.Row
+        db.execute(_SCHEMA)
+        return db
+
+    def _row(self, db, graph_id):
+        row = db.execute("SELECT * FROM graphs WHERE id = ?", (graph_id,)).fetchone()
+        if row is None and len(graph_id) == 32:
+            row = db.execute("SELECT * FROM graphs WHERE hash = ?", (graph_id,)).fetchone()
+        return row
+
+    def lookup(self, graph):
+        """
+        ID of ``graph`` (a ``CompactGraph`` or its content hash) if it is saved, else ``None``.
+        """
+        key = graph.content_hash() if isinstance(graph, CompactGraph) else graph
+        with closing(self._connect()) as db:
+            row = db.execute("SELECT id FROM graphs WHERE hash = ?", (key,)).fetchone()
+        return row["id"] if row is not None else None
+
+    def save(self, graph, result=None, layout=None, planarization=None, name=None):
+        """
+        Function to save ``graph`` with its analysis; returns the shareable ID.
+
+        ``result`` (a ``PlanarityResult``), ``layout`` (a ``LayoutResult`` or
+        ``{node: (x, y)}``) and ``planarization`` are the analysis already at hand;
+        the result and layout are computed when missing. A graph that is already
+        saved is not written again.
+        """
+        from planarity import as_compact, check_planarity_and_euler
+
+        compact = as_compact(graph)
+        key = compact.content_hash()
+        saved = self.lookup(key)
+        if saved is not None:
+            return saved
+        labels = join_labels(compact.labels)
+
+        with span("store", op="save", edges=compact.m):
+            if result is None:
+                result = check_planarity_and_euler(compact)
+            analysis, arrays = self._analyse(compact, result, layout, planarization)
+            arrays.update(edges=compact.edges, loops=compact.loops, indptr=compact.indptr, indices=compact.indices,
+                          components=compact.components[1])
+            self._write_arrays(key, labels, arrays)
+            with closing(self._connect()) as db, db:
+                for length in (SHARE_ID_LENGTH, 16, 32):
+                    graph_id = key[:length]
+                    row = db.execute("SELECT hash FROM graphs WHERE id = ?", (graph_id,)).fetchone()
+                    if row is None:
+                        db.execute("INSERT OR IGNORE INTO graphs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                   (graph_id, key, name, compact.n, compact.number_of_edges(), time.time(),
+                                    json.dumps(analysis, separators=(",", ":"))))
+                        break
+                    if row["hash"] == key:
+                        break
+        # Another process may have saved the same graph under its ID in the meantime
+        return self.lookup(key)
+
+    def _analyse(self, compact, result, layout, planarization):
+        from layout import compute_layout
+
+        analysis = {"version": FORMAT_VERSION, "is_planar": bool(result.is_planar), "tier": result.tier,
+                    "V": result.V, "E": result.E, "F": result.F, "C": int(result.C)}
+        arrays = {}
+        if layout is None:
+            layout = compute_layout(compact, embedding=result.embedding if result.is_planar else None)
+        elif isinstance(layout, dict):
+            from plotting import resolve_layout
+
+            layout = resolve_layout(compact, layout)
+        arrays["coords"] = _aligned_coords(compact, layout)
+        analysis["layout_method"] = layout.method
+
+        if result.is_planar:
+            from metrics import rotation_arrays
+
+            offsets, targets = rotation_arrays(compact, result.embedding)
+            arrays["offsets"], arrays["targets"] = offsets, targets.astype(compact.indices.dtype)
+        else:
+            witness = result.kuratowski
+            analysis["kuratowski"] = witness.to_dict() if witness is not None else None
+        if planarization is not None:
+            index = compact.index
+            arrays["removed"] = np.array([(index[u], index[v]) for u, v in planarization.removed_edges],
+                                         dtype=np.int64).reshape(-1, 2)
+            arrays["planarization_coords"] = _aligned_coords(compact, planarization.layout)
+            analysis["planarization"] = {"crossings": planarization.crossings, "maximal": planarization.maximal,
+                                         "complete": planarization.complete, "elapsed": planarization.elapsed,
+                                         "layout_method": planarization.layout.method}
+        return analysis, arrays
+
+    def _write_arrays(self, key, labels, arrays):
+        target = self.root / key
+        if (target / "labels.bin").exists():
+            return
+        tmp = self.root / f".{key}.{uuid.uuid4().hex}.tmp"
+        tmp.mkdir(parents=True)
+        try:
+            # NUL-separated labels (see graph_binary.join_labels) decode with a single split
+            (tmp / "labels.bin").write_bytes(labels)
+            for name, value in arrays.items():
+                np.save(tmp / f"{name}.npy", np.ascontiguousarray(value))
+            os.replace(tmp, target)
+        except OSError:
+            # A concurrent save of the same graph won the rename
+            if not (target / "labels.bin").exists():
+                raise
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def open(self, graph_id):
+        """
+        Function to open the saved graph ``graph_id`` (an ID or full hash); returns a ``StoredGraph`` or ``None``.
+        """
+        with span("store", op="open"):
+            with closing(self._connect()) as db:
+                row = self._row(db, graph_id)
+            if row is None:
+                return None
+            directory = self.root / row["hash"]
+            arrays = {}
+            for name in GRAPH_ARRAYS + ANALYSIS_ARRAYS:
+                path = directory / f"{name}.npy"
+                if path.exists():
+                    arrays[name] = np.load(path, mmap_mode="r")
+            text = (directory / "labels.bin").read_bytes().decode("utf-8")
+            labels = text.split("\0") if row["nodes"] else []
+            analysis = json.loads(row["analysis"])
+            compact = CompactGraph.from_arrays(
+                labels, arrays["edges"], arrays["loops"], arrays["indptr"], arrays["indices"],
+                content_hash=row["hash"], components=(analysis["C"], arrays["components"]))
+            return StoredGraph(row["id"], row["hash"], row["name"], row["created"], compact, analysis, arrays)
+
+    def list(self, limit=50):
+        """
+        The most recently saved graphs as ``{"id", "hash", "name", "nodes", "edges", "created"}`` dicts.
+        """
+        with closing(self._connect()) as db:
+            rows = db.execute("SELECT id, hash, name, nodes, edges, created FROM graphs "
+                              "ORDER BY created DESC LIMIT ?", (limit,)).fetchall()
+        return [dict(row) for row in rows]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Save graphs to the persistent graph store, or list them.")
+    parser.add_argument("--root", default=str(GRAPH_STORE_DIR), help="store directory")
+    commands = parser.add_subparsers(dest="command", required=True)
+    save = commands.add_parser("save", help="analyse and save an edge-list file")
+    save.add_argument("path", help="edge list, GraphML or .pgb file")
+    save.add_argument("--name", help="display name (defaults to the file name)")
+    commands.add_parser("list", help="list the saved graphs")
+    args = parser.parse_args(argv)
+
+    store = GraphStore(args.root)
+    if args.command == "save":
+        from ingest import load_graph
+
+        compact = load_graph(args.path)
+        print(store.save(compact, name=args.name or Path(args.path).name))
+        return 0
+    for entry in store.list():
+        print(f"{entry['id']}  {entry['nodes']:>9} nodes  {entry['edges']:>9} edges  {entry['name'] or ''}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,407 @@
+import networkx as nx
+
+from compact import CompactGraph, normalize_label
+from planarity import check_planarity_and_euler
+
+# Edits larger than this (edges plus nodes changed at once) are rechecked from scratch
+INCREMENTAL_MAX_CHANGES = 64
+# Half-edges walked while looking for a face shared by both endpoints before giving up
+FACE_SEARCH_LIMIT = 50000
+# Half-edges followed along each face when placing a new node with add_star
+STAR_WALK_LIMIT = 64
+
+
+class IncrementalPlanarity:
+    """
+    Planarity of a graph that is edited a few edges at a time.
+
+    Keeps a ``PlanarEmbedding`` of the current graph and updates it in place:
+
+    * adding an edge between two components (or to a new vertex) is always planar,
+      and the half-edges can go anywhere in the rotations;
+    * adding an edge inside a component is planar in this embedding when both
+      endpoints lie on a common face, found by walking only the faces around one
+      endpoint, and the edge is then drawn through that face;
+    * removing an edge keeps a planar graph planar, and the edge is a bridge
+      (so a component splits) exactly when both of its sides lie on the same face;
+    * adding to a non-planar graph keeps it non-planar.
+
+    Everything else (an edge whose endpoints share no face in this embedding, a
+    removal from a non-planar graph, a large batch of edits) is settled by a full
+    ``check_planarity_and_euler`` pass. ``last_update`` says which path the latest
+    ``sync`` took. Components are tracked with a union-find that is rebuilt only
+    after a component may have split.
+    """
+
+    def __init__(self, nodes=(), edges=()):
+        self.full_checks = 0
+        self.incremental_updates = 0
+        self.rebuild(nodes, edges)
+
+    @property
+    def V(self):
+        return len(self.nodes)
+
+    @property
+    def E(self):
+        return len(self.edges) + len(self.loops)
+
+    @property
+    def C(self):
+        if self._components_dirty:
+            self._rebuild_components()
+        return self._C
+
+    @property
+    def F(self):
+        """
+        Faces of the whole drawing, ``E - V + C + 1``; ``None`` when the graph is not planar.
+        """
+        return self.E - self.V + self.C + 1 if self.is_planar else None
+
+    # -- full recheck -----------------------------------------------------
+
+    def rebuild(self, nodes, edges):
+        """
+        Replace the graph and recheck it from scratch.
+        """
+        self.nodes = {}
+        self.edges = {}
+        self.loops = {}
+        for node in nodes:
+            self.nodes[normalize_label(node)] = None
+        for u, v in edges:
+            u, v = normalize_label(u), normalize_label(v)
+            self.nodes.setdefault(u)
+            self.nodes.setdefault(v)
+            if u == v:
+                self.loops[u] = None
+            else:
+                self.edges.setdefault(_key(u, v))
+        self._full_check()
+
+    def _full_check(self):
+        result = check_planarity_and_euler(self.to_compact())
+        self.is_planar = result.is_planar
+        self.embedding = result.embedding.copy() if result.is_planar else None
+        self._rebuild_components(result.compact)
+        self.full_checks += 1
+        self.last_update = "full"
+
+    def _undecided(self):
+        # Planarity is unknown until the full check; later edits only update the edge sets
+        self.is_planar = False
+        self.embedding = None
+
+    def to_compact(self):
+        """
+        The current graph as a ``CompactGraph`` (node order is insertion order).
+        """
+        edges = list(self.edges) + [(node, node) for node in self.loops]
+        return CompactGraph.from_labeled_edges(edges, nodes=self.nodes)
+
+    # -- edits ------------------------------------------------------------
+
+    def sync(self, nodes, edges):
+        """
+        Bring the structure in line with a new node and edge list, applying only the difference.
+        Returns ``last_update`` (``"incremental"``, ``"full"`` or ``"unchanged"``).
+        """
+        target_nodes = dict.fromkeys(normalize_label(node) for node in nodes)
+        target_edges, target_loops = {}, {}
+        for u, v in edges:
+            u, v = normalize_label(u), normalize_label(v)
+            target_nodes.setdefault(u)
+            target_nodes.setdefault(v)
+            if u == v:
+                target_loops[u] = None
+            else:
+                target_edges.setdefault(_key(u, v))
+
+        removed_edges = [e for e in self.edges if e not in target_edges]
+        added_edges = [e for e in target_edges if e not in self.edges]
+        removed_loops = [u for u in self.loops if u not in target_loops]
+        added_loops = [u for u in target_loops if u not in self.loops]
+        removed_nodes = [u for u in self.nodes if u not in target_nodes]
+        added_nodes = [u for u in target_nodes if u not in self.nodes]
+        changes = (len(removed_edges) + len(added_edges) + len(removed_loops) + len(added_loops)
+                   + len(removed_nodes) + len(added_nodes))
+        if changes == 0:
+            self.last_update = "unchanged"
+            return self.last_update
+        if changes > INCREMENTAL_MAX_CHANGES:
+            self.rebuild(target_nodes, list(target_edges) + [(u, u) for u in target_loops])
+            return self.last_update
+
+        decided = True
+        for u in removed_loops:
+            del self.loops[u]
+        for u, v in removed_edges:
+            decided = self.remove_edge(u, v) and decided
+            if not decided:
+                self._undecided()
+        for u in removed_nodes:
+            decided = self.remove_node(u) and decided
+        for u in added_nodes:
+            self.add_node(u)
+        for u in added_loops:
+            self.loops[u] = None
+        for u, v in added_edges:
+            decided = self.add_edge(u, v) and decided
+            if not decided:
+                self._undecided()
+
+        if decided:
+            self.incremental_updates += 1
+            self.last_update = "incremental"
+        else:
+            self._full_check()
+        return self.last_update
+
+    def add_node(self, u):
+        u = normalize_label(u)
+        if u in self.nodes:
+            return True
+        self.nodes[u] = None
+        if self.is_planar:
+            self.embedding.add_node(u)
+        if not self._components_dirty:
+            self._parent[u] = u
+            self._C += 1
+        return True
+
+    def remove_node(self, u):
+        """
+        Remove ``u`` with its edges. Returns ``False`` when planarity has to be rechecked.
+        """
+        u = normalize_label(u)
+        if u not in self.nodes:
+            return True
+        decided = True
+        self.loops.pop(u, None)
+        for edge in [e for e in self.edges if u in e]:
+            decided = self.remove_edge(*edge) and decided
+        del self.nodes[u]
+        if self.is_planar and decided:
+            self.embedding.remove_node(u)
+            # u is isolated now; a stale union-find may still route other nodes through it
+            self._components_dirty = True
+        return decided
+
+    def add_edge(self, u, v):
+        """
+        Add the edge ``u``-``v``. Returns ``False`` when planarity has to be rechecked.
+        """
+        u, v = normalize_label(u), normalize_label(v)
+        self.add_node(u)
+        self.add_node(v)
+        if u == v:
+            self.loops[u] = None
+            return True
+        key = _key(u, v)
+        if key in self.edges:
+            return True
+        if self.is_planar and self._components_dirty:
+            # Before the edge is recorded, or it would already join u's and v's components
+            self._rebuild_components()
+        self.edges[key] = None
+        if not self.is_planar:
+            self._components_dirty = True
+            return True
+
+        if self._find(u) != self._find(v):
+            self._attach(u, v)
+            self._attach(v, u)
+            self._parent[self._find(u)] = self._find(v)
+            self._C -= 1
+            return True
+
+        corners = self._shared_face(u, v)
+        if corners is None:
+            return False
+        before_u, before_v = corners
+        self.embedding.add_half_edge(u, v, cw=before_u)
+        self.embedding.add_half_edge(v, u, cw=before_v)
+        return True
+
+    def try_add_edge(self, u, v):
+        """
+        Add ``u``-``v`` only if it fits into the current embedding; otherwise leave the graph unchanged.
+        Returns whether the edge was added.
+        """
+        u, v = normalize_label(u), normalize_label(v)
+        if u == v or _key(u, v) in self.edges:
+            return self.add_edge(u, v)
+        if self.add_edge(u, v):
+            return True
+        del self.edges[_key(u, v)]
+        return False
+
+    def add_star(self, w, neighbors):
+        """
+        Add the new node ``w`` inside the face of the current embedding that has the most of
+        ``neighbors`` on its boundary, joined to those. Returns the neighbors joined.
+
+        Picking the face first keeps ``w`` from being committed to a corner that its
+        other edges cannot reach, which is what adding its edges one at a time risks.
+        Faces are only followed for ``STAR_WALK_LIMIT`` half-edges from each neighbor,
+        so a long outer face does not make every insertion walk all of it.
+        """
+        w = normalize_label(w)
+        # In the given order, so the chosen face does not depend on string hashing
+        targets = {u: None for u in map(normalize_label, neighbors) if u in self.nodes and u != w}
+        if w in self.nodes or not self.is_planar or not targets:
+            self.add_node(w)
+            return [u for u in targets if self.try_add_edge(w, u)]
+
+        embedding = self.embedding
+        best, seen = None, set()
+        for p in targets:
+            if embedding.out_degree(p) == 0:
+                if best is None:
+                    best = ((0, 0), p, None, [])
+                continue
+            for x in embedding.neighbors_cw_order(p):
+                if (p, x) in seen:
+                    continue
+                # Other neighbors met along this face, each with the neighbor the walk arrived from
+                corners, met, a, b = [], {p}, p, x
+                for length in range(1, STAR_WALK_LIMIT + 1):
+                    seen.add((a, b))
+                    if b in targets and b not in met:
+                        met.add(b)
+                        corners.append((b, a))
+                    a, b = embedding.next_face_half_edge(a, b)
+                    if (a, b) == (p, x):
+                        break
+                # Among equally good faces the longest, usually the outer one, leaves most room
+                if best is None or (len(corners), length) > best[0]:
+                    best = ((len(corners), length), p, embedding[p][x]["cw"], corners)
+
+        _, p, before, corners = best
+        self.add_node(w)
+        root_w, root_p = self._find(w), self._find(p)
+        self._parent[root_w] = root_p
+        self._C -= 1
+        embedding.add_half_edge(w, p)
+        if before is None:
+            embedding.add_half_edge(p, w)
+        else:
+            embedding.add_half_edge(p, w, cw=before)
+        self.edges[_key(w, p)] = None
+        previous = p
+        for u, before_u in corners:
+            embedding.add_half_edge(u, w, cw=before_u)
+            embedding.add_half_edge(w, u, ccw=previous)
+            self.edges[_key(w, u)] = None
+            previous = u
+        return [p] + [u for u, _ in corners]
+
+    def remove_edge(self, u, v):
+        """
+        Remove the edge ``u``-``v``. Returns ``False`` when planarity has to be rechecked.
+        """
+        u, v = normalize_label(u), normalize_label(v)
+        if u == v:
+            self.loops.pop(u, None)
+            return True
+        key = _key(u, v)
+        if key not in self.edges:
+            return True
+        del self.edges[key]
+        if not self.is_planar:
+            return False  # the graph may have just become planar
+
+        if not self._components_dirty:
+            bridge = self._is_bridge(u, v)
+            if bridge is None:
+                self._components_dirty = True
+            elif bridge:
+                # The component splits; the union-find cannot undo a union
+                self._components_dirty = True
+        self.embedding.remove_edge(u, v)
+        return True
+
+    # -- embedding helpers ------------------------------------------------
+
+    def _attach(self, u, v):
+        if self.embedding.out_degree(u) == 0:
+            self.embedding.add_half_edge(u, v)
+        else:
+            self.embedding.add_half_edge(u, v, cw=next(iter(self.embedding[u])))
+
+    def _shared_face(self, u, v):
+        """
+        Find a face with both ``u`` and ``v`` on its boundary, walking the faces around ``u``.
+
+        Returns ``(before_u, before_v)``, the neighbors the face boundary arrives
+        from at ``u`` and at ``v`` (the new edge goes right after them), or ``None``
+        when no such face exists or the walk exceeds ``FACE_SEARCH_LIMIT``.
+        """
+        embedding = self.embedding
+        visited = set()
+        steps = 0
+        for w in embedding.neighbors_cw_order(u):
+            if (u, w) in visited:
+                continue
+            before_v = None
+            a, b = u, w
+            while True:
+                visited.add((a, b))
+                if b == v and before_v is None:
+                    before_v = a
+                steps += 1
+                if steps > FACE_SEARCH_LIMIT:
+                    return None
+                nxt = embedding.next_face_half_edge(a, b)
+                if nxt == (u, w):
+                    break
+                a, b = nxt
+            if before_v is not None:
+                return a, before_v  # the walk ends on the half-edge (a, u)
+        return None
+
+    def _is_bridge(self, u, v):
+        """
+        ``True`` when both sides of edge ``u``-``v`` bound the same face, ``None`` if the walk is too long.
+        """
+        embedding = self.embedding
+        a, b = u, v
+        for _ in range(FACE_SEARCH_LIMIT):
+            a, b = embedding.next_face_half_edge(a, b)
+            if (a, b) == (v, u):
+                return True
+            if (a, b) == (u, v):
+                return False
+        return None
+
+    def _find(self, u):
+        if self._components_dirty:
+            self._rebuild_components()
+        parent = self._parent
+        while parent[u] != u:
+            parent[u] = parent[parent[u]]
+            u = parent[u]
+        return u
+
+    def _rebuild_components(self, compact=None):
+        compact = compact if compact is not None else self.to_compact()
+        count, component = compact.components
+        roots = {}
+        self._parent = {}
+        for label, comp in zip(compact.labels, component.tolist()):
+            self._parent[label] = roots.setdefault(comp, label)
+        self._C = int(count)
+        self._components_dirty = False
+
+    def positions(self):
+        """
+        Crossing-free straight-line positions from the maintained embedding, or ``None``.
+        """
+        if not self.is_planar or not self.nodes:
+            return None
+        return nx.combinatorial_embedding_to_pos(self.embedding)
+
+
+def _key(u, v):
+    return (u, v) if u <= v else (v, u)
@@ -0,0 +1,265 @@
+import csv
+import gzip
+import io
+import json
+import os
+import re
+
+from compact import CompactGraph, EdgeBuffer
+from graph_binary import is_binary_graph, read as read_binary_graph
+from instrument import timed
+
+EDGE_FORMATS = ("json", "ndjson", "csv", "lines")
+
+_EXTENSIONS = {
+    ".json": "json",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".csv": "csv",
+    ".tsv": "csv",
+    ".txt": "lines",
+    ".edges": "lines",
+}
+
+_HEADER_NAMES = {"source", "target", "u", "v", "from", "to", "node1", "node2"}
+
+CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = re.compile(r"\s*")
+# Characters no edge-list label contains; one of them means mangled JSON, not an edge line
+_NOT_LABEL = re.compile(r'[\[\]{}",]')
+
+
+def open_edge_stream(source):
+    """
+    Open a path, binary file object or text stream for reading edges, transparently un-gzipping it.
+
+    The data is read incrementally; nothing here loads the whole input into memory.
+    """
+    if isinstance(source, io.TextIOBase):
+        return source
+    if isinstance(source, (str, os.PathLike)):
+        source = open(source, "rb")
+    elif isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    if not hasattr(source, "peek"):
+        source = io.BufferedReader(source)
+    if source.peek(2)[:2] == b"\x1f\x8b":
+        source = gzip.GzipFile(fileobj=source, mode="rb")
+    return io.TextIOWrapper(source, encoding="utf-8-sig", newline="")
+
+
+def detect_format(stream, name=None):
+    """
+    Edge format from a file name (``.gz`` suffixes ignored), else sniffed from the first characters.
+    """
+    if name:
+        lowered = name.lower()
+        if lowered.endswith(".gz"):
+            lowered = lowered[:-3]
+        for ext, fmt in _EXTENSIONS.items():
+            if lowered.endswith(ext):
+                return fmt
+
+    head = _peek_text(stream).lstrip()
+    if head.startswith("["):
+        # A JSON array of edges nests a list or object; an NDJSON line is a single [u, v] pair
+        if head[1:].lstrip()[:1] in ("[", "{"):
+            return "json"
+        try:
+            first = json.loads(head.split("\n", 1)[0])
+        except ValueError:
+            return "json"
+        return "ndjson" if isinstance(first, list) and len(first) == 2 else "json"
+    if head.startswith("{"):
+        return "ndjson"
+    first_line = head.split("\n", 1)[0]
+    return "csv" if ("," in first_line or "\t" in first_line) else "lines"
+
+
+def _peek_text(stream, size=512):
+    if hasattr(stream, "buffer") and hasattr(stream.buffer, "peek"):
+        return stream.buffer.peek(size)[:size].decode("utf-8-sig", errors="ignore")
+    position = stream.tell()
+    head = stream.read(size)
+    stream.seek(position)
+    return head
+
+
+def edge_from_item(item):
+    if isinstance(item, dict):
+        u, v = item["source"], item["target"]
+    elif isinstance(item, (list, tuple)) and len(item) >= 2:
+        u, v = item[0], item[1]
+    else:
+        raise ValueError("Invalid edge format. Use a list of dictionaries or a list of lists.")
+    if isinstance(u, (list, tuple, dict)) or isinstance(v, (list, tuple, dict)):
+        raise ValueError("Invalid edge format. Node labels must be strings or numbers.")
+    return u, v
+
+
+def _iter_json_array(stream, chunk_size=CHUNK_SIZE):
+    """
+    Yield the elements of a top-level JSON array one at a time, reading ``chunk_size`` characters at a time.
+
+    The array must be well-formed: elements separated by single commas and
+    nothing but whitespace after the closing bracket.
+    """
+    decoder = json.JSONDecoder()
+    buffer = stream.read(chunk_size).lstrip()
+    if not buffer.startswith("["):
+        raise ValueError("Expected a JSON array of edges")
+    # "first": after "[", "item": after a comma, "next": after an element
+    pos, eof, state = 1, False, "first"
+    while True:
+        pos = _WHITESPACE.match(buffer, pos).end()
+        if pos == len(buffer) or not eof and len(buffer) - pos < 256:
+            # Refill before decoding so an element is never split at the chunk boundary
+            chunk = "" if eof else stream.read(chunk_size)
+            eof = not chunk
+            buffer, pos = buffer[pos:] + chunk, 0
+            if not buffer:
+                raise ValueError("Unterminated JSON array")
+            continue
+        if buffer[pos] == "]" and state != "item":
+            rest = buffer[pos + 1:] + ("" if eof else stream.read(chunk_size))
+            if rest.strip():
+                raise ValueError("Unexpected data after the JSON array")
+            return
+        if state == "next":
+            if buffer[pos] != ",":
+                raise ValueError(f"Expected ',' or ']' in the JSON array, found {buffer[pos]!r}")
+            pos, state = pos + 1, "item"
+            continue
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            chunk = stream.read(chunk_size)
+            eof = not chunk
+            buffer, pos = buffer[pos:] + chunk, 0
+            continue
+        yield item
+        pos, state = end, "next"
+
+
+def _iter_ndjson(stream):
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def _iter_csv(stream):
+    sample = _peek_text(stream, 2048)
+    delimiter = "\t" if "\t" in sample.split("\n", 1)[0] else ","
+    for i, row in enumerate(csv.reader(stream, delimiter=delimiter)):
+        if len(row) < 2:
+            continue
+        if i == 0 and {row[0].strip().lower(), row[1].strip().lower()} <= _HEADER_NAMES:
+            continue
+        yield row[0], row[1]
+
+
+def parse_edge_line(line):
+    """
+    Parse one ``A-B`` (or whitespace separated ``A B``) line into a label pair, or ``None``.
+
+    The line must hold exactly two labels, without JSON brackets, braces, quotes or commas.
+    """
+    parts = line.split("-") if "-" in line else line.split()
+    if len(parts) != 2:
+        return None
+    u, v = parts[0].strip(), parts[1].strip()
+    if not u or not v or _NOT_LABEL.search(u) or _NOT_LABEL.search(v):
+        return None
+    return u, v
+
+
+def _iter_lines(stream):
+    for number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        edge = parse_edge_line(line)
+        if edge is None:
+            raise ValueError(f"Line {number} is not an edge: expected 'A-B' or 'A B', got {line.strip()[:40]!r}")
+        yield edge
+
+
+def iter_edges(stream, fmt):
+    """
+    Yield ``(u, v)`` label pairs from a text stream in one of ``EDGE_FORMATS``.
+    """
+    if fmt == "json":
+        return (edge_from_item(item) for item in _iter_json_array(stream))
+    if fmt == "ndjson":
+        return (edge_from_item(item) for item in _iter_ndjson(stream))
+    if fmt == "csv":
+        return _iter_csv(stream)
+    if fmt == "lines":
+        return _iter_lines(stream)
+    raise ValueError(f"Unknown edge format '{fmt}'. Use one of {EDGE_FORMATS}.")
+
+
+@timed("parse")
+def load_edges(source, fmt=None, name=None):
+    """
+    Stream an edge list into a compact ``EdgeBuffer``.
+
+    ``source`` is a path, a binary file object (e.g. a Streamlit upload), raw bytes or
+    a text stream; gzip input is detected by its magic bytes. Each edge is interned
+    and appended as two integers as soon as it is parsed, so the raw text and a list
+    of Python tuples are never held at the same time.
+    """
+    stream = open_edge_stream(source)
+    if fmt is None:
+        fmt = detect_format(stream, name or getattr(source, "name", None))
+    buffer = EdgeBuffer()
+    try:
+        for u, v in iter_edges(stream, fmt):
+            buffer.add(u, v)
+    finally:
+        if isinstance(source, (str, os.PathLike)):
+            stream.close()
+    return buffer
+
+
+def _peek_bytes(source, size=512):
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            return f.read(size)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source[:size])
+    if hasattr(source, "peek"):
+        return source.peek(size)[:size]
+    position = source.tell()
+    head = source.read(size)
+    source.seek(position)
+    return head
+
+
+def load_graph(source, name=None):
+    """
+    Function to load a ``CompactGraph`` from a binary ``.pgb`` graph, GraphML, or any edge list ``load_edges`` reads.
+
+    The kind is recognized by the first bytes of the input (or a ``.graphml`` name);
+    text streams are always read as edge lists.
+    """
+    name = name or getattr(source, "name", None)
+    if not isinstance(source, io.TextIOBase):
+        head = _peek_bytes(source)
+        if is_binary_graph(head):
+            return read_binary_graph(source).compact
+        if (name and str(name).lower().endswith((".graphml", ".graphml.gz"))
+                or head.lstrip().startswith((b"<?xml", b"<graphml"))):
+            import networkx as nx
+            from xml.etree.ElementTree import ParseError
+
+            if isinstance(source, (bytes, bytearray, memoryview)):
+                source = io.BytesIO(source)
+            try:
+                return CompactGraph.from_networkx(nx.read_graphml(source))
+            except (ParseError, nx.NetworkXError) as e:
+                raise ValueError(f"Invalid GraphML: {e}") from e
+    return CompactGraph.from_buffer(load_edges(source, name=name))
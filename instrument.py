@@ -0,0 +1,302 @@
+"""
+Lightweight timing spans for the hot paths.
+
+Stages are timed with a context manager or a decorator:
+
+    with span("parse"):
+        ...
+
+    @timed("planarity")
+    def check_planarity_and_euler(...):
+
+A span costs a few microseconds when nothing listens. Every finished span goes
+into the process-wide ``REGISTRY`` (count, total and a latency histogram per
+stage, exported as Prometheus text by ``prometheus_text``), and into the
+current ``Trace``, if there is one. A trace collects the spans of one unit of
+work (a Streamlit run, a batch graph, an API request) with their nesting, and
+can also capture a cProfile profile and the tracemalloc peak memory of every
+span:
+
+    with trace("request", profile=True, memory=True) as t:
+        ...
+    t.to_dict()       # {"name", "seconds", "spans": [...], "profile": "..."}
+
+Capture defaults to the ``PLANAR_PROFILE`` environment variable, a
+comma-separated subset of ``cpu,memory``. ``JsonlExporter`` appends finished
+traces to a file, one JSON object per line.
+"""
+import cProfile
+import io
+import json
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+# Upper bounds (seconds) of the Prometheus latency histogram buckets
+BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 60.0)
+# Functions listed in a trace's cProfile summary
+PROFILE_LINES = 25
+
+_PROFILE = {flag.strip() for flag in os.environ.get("PLANAR_PROFILE", "").lower().split(",") if flag.strip()}
+PROFILE_CPU = "cpu" in _PROFILE
+PROFILE_MEMORY = "memory" in _PROFILE
+
+_current = ContextVar("planar_trace", default=None)
+
+
+class Span:
+    __slots__ = ("name", "attrs", "start", "seconds", "depth", "peak_bytes", "_peak_seen")
+
+    def __init__(self, name, attrs, depth):
+        self.name = name
+        self.attrs = attrs
+        self.depth = depth
+        self.start = time.perf_counter()
+        self.seconds = None
+        self.peak_bytes = None
+        self._peak_seen = 0
+
+    def to_dict(self, origin=0.0):
+        entry = {"name": self.name, "depth": self.depth, "offset": round(self.start - origin, 6),
+                 "seconds": round(self.seconds, 6)}
+        if self.peak_bytes is not None:
+            entry["peak_bytes"] = self.peak_bytes
+        if self.attrs:
+            entry.update(attrs=self.attrs)
+        return entry
+
+
+class Trace:
+    """
+    The spans of one unit of work, in the order they started.
+
+    With ``memory`` each span's ``peak_bytes`` is the peak memory traced by
+    ``tracemalloc`` while it was open (nested spans included), measured from the
+    allocations in place when it started. tracemalloc is process-wide, so the
+    figures are only exact while a single trace runs at a time.
+    """
+
+    def __init__(self, name, profile=False, memory=False):
+        self.name = name
+        self.spans = []
+        self.start = time.perf_counter()
+        self.seconds = None
+        self.memory = memory
+        self.profile = None
+        self._profiler = cProfile.Profile() if profile else None
+        self._open = []
+        self._started_tracemalloc = False
+
+    def _begin(self):
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        if self._profiler is not None:
+            try:
+                self._profiler.enable()
+            except ValueError:
+                self._profiler = None  # an enclosing trace is already profiling this thread
+
+    def _end(self):
+        if self._profiler is not None:
+            self._profiler.disable()
+            out = io.StringIO()
+            pstats.Stats(self._profiler, stream=out).sort_stats("cumulative").print_stats(PROFILE_LINES)
+            self.profile = out.getvalue()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+        self.seconds = time.perf_counter() - self.start
+
+    def _push(self, span):
+        if self.memory and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            if self._open:
+                self._open[-1]._peak_seen = max(self._open[-1]._peak_seen, peak)
+            tracemalloc.reset_peak()
+            span._peak_seen = current
+            span.peak_bytes = current  # baseline until the span closes
+        self.spans.append(span)
+        self._open.append(span)
+
+    def _pop(self, span):
+        self._open.remove(span)
+        if self.memory and tracemalloc.is_tracing():
+            peak = max(span._peak_seen, tracemalloc.get_traced_memory()[1])
+            span.peak_bytes = max(peak - span.peak_bytes, 0)
+            if self._open:
+                self._open[-1]._peak_seen = max(self._open[-1]._peak_seen, peak)
+
+    def stages(self):
+        """
+        Total seconds per span name (nested spans are also counted in their parents).
+        """
+        totals = {}
+        for s in self.spans:
+            if s.seconds is not None:
+                totals[s.name] = totals.get(s.name, 0.0) + s.seconds
+        return totals
+
+    def to_dict(self):
+        entry = {"name": self.name, "seconds": round(self.seconds or 0.0, 6),
+                 "spans": [s.to_dict(self.start) for s in self.spans if s.seconds is not None]}
+        if self.profile:
+            entry["profile"] = self.profile
+        return entry
+
+
+class Registry:
+    """
+    Per-stage counters, totals and latency histograms across the whole process.
+    """
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = tuple(buckets)
+        self._stages = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name, seconds, peak_bytes=None):
+        with self._lock:
+            stage = self._stages.get(name)
+            if stage is None:
+                stage = self._stages[name] = {"count": 0, "sum": 0.0, "buckets": [0] * len(self.buckets),
+                                              "peak_bytes": None}
+            stage["count"] += 1
+            stage["sum"] += seconds
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    stage["buckets"][i] += 1
+            if peak_bytes is not None:
+                stage["peak_bytes"] = max(stage["peak_bytes"] or 0, peak_bytes)
+
+    def observe_trace(self, trace_dict):
+        """
+        Record the spans of a trace finished elsewhere (e.g. in a worker process).
+        """
+        for s in trace_dict.get("spans", ()):
+            self.observe(s["name"], s["seconds"], s.get("peak_bytes"))
+
+    def snapshot(self):
+        with self._lock:
+            return {name: dict(stage, buckets=list(stage["buckets"])) for name, stage in self._stages.items()}
+
+    def reset(self):
+        with self._lock:
+            self._stages.clear()
+
+
+REGISTRY = Registry()
+
+
+@contextmanager
+def span(name, **attrs):
+    """
+    Function to time the enclosed block as stage ``name``; yields the ``Span`` (``attrs`` may be added to).
+    """
+    t = _current.get()
+    s = Span(name, attrs, len(t._open) if t is not None else 0)
+    if t is not None:
+        t._push(s)
+    try:
+        yield s
+    finally:
+        s.seconds = time.perf_counter() - s.start
+        if t is not None:
+            t._pop(s)
+        REGISTRY.observe(name, s.seconds, s.peak_bytes if t is not None and t.memory else None)
+
+
+def timed(name):
+    """
+    Decorator timing every call of the function as stage ``name``.
+    """
+    def decorate(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def annotate(**attrs):
+    """
+    Attach ``attrs`` to the innermost open span of the current trace, if any.
+    """
+    t = _current.get()
+    if t is not None and t._open:
+        t._open[-1].attrs.update(attrs)
+
+
+@contextmanager
+def trace(name, profile=None, memory=None):
+    """
+    Function to collect the spans of the enclosed block into a ``Trace``; yields the trace.
+
+    ``profile`` (cProfile) and ``memory`` (tracemalloc) default to ``PLANAR_PROFILE``.
+    """
+    t = Trace(name, PROFILE_CPU if profile is None else profile, PROFILE_MEMORY if memory is None else memory)
+    token = _current.set(t)
+    t._begin()
+    try:
+        yield t
+    finally:
+        t._end()
+        _current.reset(token)
+
+
+def call_traced(fn, *args, **kwargs):
+    """
+    Run ``fn`` inside a fresh trace; returns ``(result, trace_dict)``.
+
+    Picklable, so a process pool can run it and hand the spans back to the parent,
+    which records them with ``REGISTRY.observe_trace``.
+    """
+    with trace(getattr(fn, "__name__", "call")) as t:
+        result = fn(*args, **kwargs)
+    return result, t.to_dict()
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus_text(registry=REGISTRY, prefix="planar"):
+    """
+    Function to export the registry in the Prometheus text exposition format.
+    """
+    stages = registry.snapshot()
+    lines = [f"# HELP {prefix}_stage_seconds Time spent per instrumented stage.",
+             f"# TYPE {prefix}_stage_seconds histogram"]
+    for name, stage in sorted(stages.items()):
+        label = _label(name)
+        for bound, count in zip(registry.buckets, stage["buckets"]):
+            lines.append(f'{prefix}_stage_seconds_bucket{{stage="{label}",le="{bound}"}} {count}')
+        lines.append(f'{prefix}_stage_seconds_bucket{{stage="{label}",le="+Inf"}} {stage["count"]}')
+        lines.append(f'{prefix}_stage_seconds_sum{{stage="{label}"}} {stage["sum"]:.6f}')
+        lines.append(f'{prefix}_stage_seconds_count{{stage="{label}"}} {stage["count"]}')
+    peaks = [(name, stage["peak_bytes"]) for name, stage in sorted(stages.items()) if stage["peak_bytes"] is not None]
+    if peaks:
+        lines += [f"# HELP {prefix}_stage_peak_bytes Largest traced memory peak per stage.",
+                  f"# TYPE {prefix}_stage_peak_bytes gauge"]
+        lines += [f'{prefix}_stage_peak_bytes{{stage="{_label(name)}"}} {peak}' for name, peak in peaks]
+    return "\n".join(lines) + "\n"
+
+
+class JsonlExporter:
+    """
+    Appends finished traces to ``path``, one JSON object per line.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, trace_dict, **fields):
+        line = json.dumps(dict(trace_dict, **fields), separators=(",", ":"))
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
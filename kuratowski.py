@@ -0,0 +1,198 @@
+from collections import deque
+from dataclasses import dataclass
+
+import networkx as nx
+import numpy as np
+
+from compact import CompactGraph
+from instrument import timed
+
+
+@dataclass
+class KuratowskiWitness:
+    """
+    A subdivision of K5 or K3,3 contained in a non-planar graph.
+
+    ``branch_vertices`` are the five (K5) or six (K3,3) vertices of degree 4 or 3;
+    for K3,3 ``sides`` holds the two classes of three. ``paths`` are the vertex
+    sequences between branch vertices (10 for K5, 9 for K3,3), internally disjoint,
+    and ``edges`` lists every edge of the subdivision.
+    """
+    kind: str
+    branch_vertices: list
+    paths: list
+    edges: list
+    sides: tuple = None
+
+    def to_dict(self):
+        return {
+            "kind": self.kind,
+            "branch_vertices": self.branch_vertices,
+            "sides": [list(side) for side in self.sides] if self.sides else None,
+            "paths": self.paths,
+            "edges": [list(edge) for edge in self.edges],
+        }
+
+
+def _chain_units(edges):
+    """
+    Group edge rows into chains: edges joined through degree-2 vertices form one unit.
+
+    Deleting any edge of a chain has the same effect on planarity as deleting all
+    of it (the rest only dangles), so chains are kept or dropped as a whole.
+    """
+    from scipy.sparse import coo_array
+    from scipy.sparse.csgraph import connected_components
+
+    m = len(edges)
+    n = int(edges.max()) + 1
+    ends = edges.ravel()
+    degree = np.bincount(ends, minlength=n)
+    incident = np.argsort(ends, kind="stable") // 2
+    two = np.flatnonzero(degree == 2)
+    offsets = np.concatenate([[0], np.cumsum(degree)])
+    first, second = incident[offsets[two]], incident[offsets[two] + 1]
+    links = coo_array((np.ones(len(two), dtype=np.int8), (first, second)), shape=(m, m))
+    count, unit = connected_components(links, directed=False)
+    order = np.argsort(unit, kind="stable")
+    return np.split(order, np.cumsum(np.bincount(unit, minlength=count))[:-1])
+
+
+def minimal_nonplanar_edges(edges):
+    """
+    Shrink a non-planar integer edge array to a minimal non-planar subset.
+
+    Deletes chains of edges in halving groups (a group is dropped whenever the
+    rest stays non-planar), re-peeling leaves and regrouping chains after every
+    successful deletion. This needs O(k log(m / k)) planarity tests for a witness
+    of ``k`` chains, each on a kernel of the remaining edges, instead of the ``m``
+    full-size tests of deleting one edge at a time. A minimal non-planar graph is
+    a Kuratowski subdivision.
+    """
+    from planarity import _peel_leaves, is_planar_edges
+
+    def regroup(kept):
+        kept = _peel_leaves(int(kept.max()) + 1, kept)
+        return kept, _chain_units(kept)
+
+    keep, units = regroup(np.asarray(edges))
+    chunk = max(len(units) // 2, 1)
+    while True:
+        i, deleted = 0, False
+        while i < len(units):
+            rest = units[:i] + units[i + chunk:]
+            trial = keep[np.concatenate(rest)] if rest else keep[:0]
+            if len(trial) and not is_planar_edges(trial):
+                keep, units = regroup(trial)
+                deleted = True
+            else:
+                i += chunk
+        if chunk == 1 and not deleted:
+            return keep
+        chunk = max(chunk // 2, 1)
+
+
+def _smallest_nonplanar_block(kernel):
+    from planarity import biconnected_blocks, is_planar_edges
+
+    for block in sorted(biconnected_blocks(kernel), key=len):
+        if len(block) >= 9 and not is_planar_edges(block):
+            return block
+    return None
+
+
+def _expand_edge(compact, kernel_nodes, a, b):
+    """
+    Path from ``a`` to ``b`` in ``compact`` whose inner vertices were all reduced away by the kernel.
+    """
+    parent = {a: None}
+    queue = deque([a])
+    while queue:
+        x = queue.popleft()
+        for y in compact.neighbors(x).tolist():
+            if y in parent:
+                continue
+            parent[y] = x
+            if y == b:
+                path = [b]
+                while parent[path[-1]] is not None:
+                    path.append(parent[path[-1]])
+                return path[::-1]
+            if not kernel_nodes[y]:
+                queue.append(y)
+    raise ValueError(f"No reduced path between {a} and {b}")
+
+
+def _classify(compact, edges):
+    adjacency = {}
+    for u, v in edges:
+        adjacency.setdefault(u, []).append(v)
+        adjacency.setdefault(v, []).append(u)
+    branch = sorted(x for x, nbrs in adjacency.items() if len(nbrs) >= 3)
+    is_branch = set(branch)
+
+    # Walk from every branch vertex along each of its edges to the next branch vertex
+    paths, walked = [], set()
+    for start in branch:
+        for x in adjacency[start]:
+            if (start, x) in walked:
+                continue
+            path, prev = [start], start
+            while x not in is_branch:
+                path.append(x)
+                prev, x = x, next(y for y in adjacency[x] if y != prev)
+            path.append(x)
+            walked.add((x, path[-2]))
+            paths.append(path)
+
+    labels = compact.labels
+    sides = None
+    if len(branch) == 5:
+        kind = "K5"
+    else:
+        # In K3,3 a branch vertex is joined exactly to the branch vertices of the other side
+        kind = "K3,3"
+        joined = {path[-1] for path in paths if path[0] == branch[0]}
+        joined |= {path[0] for path in paths if path[-1] == branch[0]}
+        sides = (sorted(labels[b] for b in branch if b not in joined),
+                 sorted(labels[b] for b in branch if b in joined))
+    return KuratowskiWitness(
+        kind,
+        [labels[b] for b in branch],
+        [[labels[x] for x in path] for path in paths],
+        [(labels[u], labels[v]) for u, v in edges],
+        sides,
+    )
+
+
+@timed("kuratowski")
+def find_kuratowski_subgraph(graph):
+    """
+    Function to extract a K5 or K3,3 subdivision from a non-planar graph.
+
+    Works on the smallest non-planar biconnected block of the planarity kernel
+    (degree-1 vertices stripped, degree-2 chains contracted), shrinks it with
+    ``minimal_nonplanar_edges`` and expands each remaining kernel edge back into
+    its chain of original vertices. Returns ``None`` for planar graphs.
+    ``nx.check_planarity(..., counterexample=True)`` deletes one edge per planarity
+    test over the whole graph, which is quadratic; this stays near-linear.
+    """
+    from planarity import as_compact, planarity_kernel
+
+    compact = graph if isinstance(graph, CompactGraph) else (
+        CompactGraph.from_networkx(graph) if isinstance(graph, nx.Graph) else as_compact(graph))
+    kernel = planarity_kernel(compact)
+    block = _smallest_nonplanar_block(kernel)
+    if block is None:
+        return None
+    witness = minimal_nonplanar_edges(block)
+
+    index = compact.index
+    to_original = np.array([index[label] for label in kernel.labels], dtype=np.int64)
+    kernel_nodes = np.zeros(compact.n, dtype=bool)
+    kernel_nodes[to_original] = True
+    edges = []
+    for a, b in to_original[witness].tolist():
+        path = _expand_edge(compact, kernel_nodes, a, b)
+        edges.extend(zip(path, path[1:]))
+    return _classify(compact, edges)
@@ -0,0 +1,475 @@
+import time
+import warnings
+from dataclasses import dataclass, field
+
+import networkx as nx
+import numpy as np
+
+from compact import CompactGraph
+from instrument import annotate, timed
+
+# Size thresholds used by the "auto" engine
+SPRING_MAX_NODES = 500
+PLANAR_MAX_NODES = 2000
+
+# Wall-clock budget (seconds) per layout method
+LAYOUT_BUDGETS = {
+    "planar": 5.0,
+    "spring": 2.0,
+    "multilevel": 5.0,
+    "spectral": 2.0,
+}
+
+LAYOUT_METHODS = ("auto", "planar", "spring", "multilevel", "spectral", "random")
+
+
+@dataclass
+class LayoutResult:
+    """
+    Node positions as an ``(n, 2)`` array aligned with ``nodes``, plus the integer
+    edge array the layout was computed on.
+
+    ``method`` is the algorithm that actually produced the positions, which may
+    differ from the requested one after a fallback.
+    """
+    nodes: list
+    coords: np.ndarray
+    method: str
+    elapsed: float = 0.0
+    index: dict = field(default=None, repr=False)
+    edges: np.ndarray = field(default=None, repr=False)
+
+    def __post_init__(self):
+        if self.index is None:
+            self.index = {node: i for i, node in enumerate(self.nodes)}
+
+    @property
+    def pos(self):
+        """
+        Positions as a NetworkX-style ``{node: (x, y)}`` dict.
+        """
+        return dict(zip(self.nodes, self.coords))
+
+
+def graph_to_arrays(graph):
+    """
+    Integer edge array for ``graph``: returns ``(nodes, index, edges)`` with ``edges`` of shape ``(m, 2)``.
+    Self-loops are dropped since they carry no layout information.
+    A ``CompactGraph`` already stores exactly this and is returned without conversion.
+    """
+    if isinstance(graph, CompactGraph):
+        return graph.labels, graph.index, graph.edges
+    nodes = list(graph.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = np.array([(index[u], index[v]) for u, v in graph.edges() if u != v],
+                     dtype=np.int64).reshape(-1, 2)
+    return nodes, index, edges
+
+
+def choose_method(n, embedding=None):
+    """
+    Layout algorithm the "auto" engine picks for a graph with ``n`` nodes.
+    """
+    if embedding is not None and n <= PLANAR_MAX_NODES:
+        return "planar"
+    if n <= SPRING_MAX_NODES:
+        return "spring"
+    return "multilevel"
+
+
+@timed("layout")
+def compute_layout(graph, method="auto", embedding=None, budget=None, seed=42):
+    """
+    Lay out ``graph`` with the requested method, or pick one by graph size.
+
+    ``planar`` draws a crossing-free straight-line layout from ``embedding``,
+    ``spring`` is NetworkX's force-directed layout for small graphs,
+    ``multilevel`` is a coarsening force-directed layout with grid-based repulsion
+    for large graphs, and ``spectral`` uses sparse Laplacian eigenvectors.
+    If a method fails or overruns its budget the engine falls back to spectral,
+    then to random placement.
+    """
+    if method not in LAYOUT_METHODS:
+        raise ValueError(f"Unknown layout method '{method}'. Use one of {LAYOUT_METHODS}.")
+
+    start = time.perf_counter()
+    nodes, index, edges = graph_to_arrays(graph)
+    n = len(nodes)
+    if method == "auto":
+        method = choose_method(n, embedding)
+    if n == 0:
+        return LayoutResult(nodes, np.zeros((0, 2)), method, 0.0, index, edges)
+
+    chain = [method] + [m for m in ("spectral", "random") if m != method]
+    for candidate in chain:
+        limit = budget if budget is not None else LAYOUT_BUDGETS.get(candidate, 1.0)
+        try:
+            coords = _run_method(candidate, graph, nodes, index, edges, embedding, limit, seed)
+        except (nx.NetworkXException, ValueError, ImportError):
+            continue
+        annotate(method=candidate, nodes=n)
+        return LayoutResult(nodes, coords, candidate, time.perf_counter() - start, index, edges)
+    raise RuntimeError("No layout method succeeded")  # random placement cannot fail
+
+
+def _run_method(method, graph, nodes, index, edges, embedding, budget, seed):
+    n = len(nodes)
+    if method == "planar":
+        if embedding is None:
+            raise ValueError("Planar layout needs a planar embedding")
+        pos = nx.combinatorial_embedding_to_pos(embedding)
+        coords = np.zeros((n, 2))
+        placed = np.zeros(n, dtype=bool)
+        for node, xy in pos.items():
+            if node in index:
+                coords[index[node]] = xy
+                placed[index[node]] = True
+        if not placed.all():
+            raise ValueError("Embedding does not cover every node")
+        return coords
+    if method == "spring":
+        if isinstance(graph, CompactGraph):
+            graph = graph.to_networkx()
+        pos = nx.spring_layout(graph, seed=seed)
+        return np.array([pos[node] for node in nodes], dtype=float)
+    if method == "multilevel":
+        return multilevel_layout(n, edges, budget=budget, seed=seed)
+    if method == "spectral":
+        return sparse_spectral_layout(n, edges, budget=budget, seed=seed)
+    return np.random.default_rng(seed).random((n, 2))
+
+
+def _coarsen(n, edges, rng):
+    """
+    One level of matching-based coarsening.
+
+    Edges are visited in random order and matched greedily; each node left
+    unmatched then joins a matched neighbor, so stars and trees shrink too.
+    Returns the fine-to-coarse map and the number of coarse nodes.
+    """
+    mapping = np.full(n, -1, dtype=np.int64)
+    count = 0
+    for u, v in edges[rng.permutation(len(edges))].tolist():
+        if mapping[u] < 0 and mapping[v] < 0:
+            mapping[u] = mapping[v] = count
+            count += 1
+    for u, v in edges.tolist():
+        if mapping[u] < 0 and mapping[v] >= 0:
+            mapping[u] = mapping[v]
+        elif mapping[v] < 0 and mapping[u] >= 0:
+            mapping[v] = mapping[u]
+    unmatched = mapping < 0
+    mapping[unmatched] = np.arange(count, count + unmatched.sum())
+    return mapping, count + int(unmatched.sum())
+
+
+def _coarse_edges(edges, mapping, n_coarse):
+    coarse = mapping[edges]
+    coarse = coarse[coarse[:, 0] != coarse[:, 1]]
+    coarse.sort(axis=1)
+    keys = np.unique(coarse[:, 0] * n_coarse + coarse[:, 1])
+    return np.stack([keys // n_coarse, keys % n_coarse], axis=1)
+
+
+def _grid_pairs(coords, cell):
+    """
+    All node pairs lying in the same or adjacent grid cells, each pair once.
+    """
+    cells = np.floor(coords / cell).astype(np.int64)
+    cells -= cells.min(axis=0) - 1
+    width = cells[:, 1].max() + 2
+    keys = cells[:, 0] * width + cells[:, 1]
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    n = len(order)
+
+    # Work in cell-sorted order so every searchsorted query batch is itself sorted
+    rows, cols = [], []
+    for dx, dy in ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1)):
+        target = sorted_keys + (dx * width + dy)
+        end = np.searchsorted(sorted_keys, target, side="right")
+        if dx == 0 and dy == 0:
+            begin = np.arange(1, n + 1)
+        else:
+            begin = np.searchsorted(sorted_keys, target, side="left")
+        counts = np.maximum(end - begin, 0)
+        total = int(counts.sum())
+        if total == 0:
+            continue
+        starts = np.cumsum(counts) - counts
+        rows.append(np.repeat(order, counts))
+        cols.append(order[np.repeat(begin - starts, counts) + np.arange(total)])
+    if not rows:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(rows), np.concatenate(cols)
+
+
+def _force_directed(coords, edges, iterations, temperature, deadline, exact=False, k=1.0, fixed=None):
+    """
+    Fruchterman-Reingold iterations over integer edge arrays.
+
+    Repulsion is exact for small graphs and otherwise restricted to nodes within
+    ``2k`` of each other using a cell grid, as in Walshaw's multilevel variant.
+    The grid neighbor pairs are rebuilt every few iterations rather than every step.
+    Nodes flagged in the boolean mask ``fixed`` exert forces but do not move.
+    """
+    n = len(coords)
+    x, y = coords[:, 0].copy(), coords[:, 1].copy()
+    u, v = (edges[:, 0], edges[:, 1]) if len(edges) else (None, None)
+    i = j = None
+    for step in range(iterations):
+        if time.perf_counter() > deadline:
+            break
+        if exact:
+            dx = x[:, None] - x[None, :]
+            dy = y[:, None] - y[None, :]
+            scale = k * k / np.maximum(dx * dx + dy * dy, 1e-9)
+            disp_x = (dx * scale).sum(axis=1)
+            disp_y = (dy * scale).sum(axis=1)
+        else:
+            if step % 4 == 0:
+                i, j = _grid_pairs(np.column_stack([x, y]), 2 * k)
+            dx = x[i] - x[j]
+            dy = y[i] - y[j]
+            dist2 = np.maximum(dx * dx + dy * dy, 1e-9)
+            scale = np.where(dist2 < 4 * k * k, k * k / dist2, 0.0)
+            fx, fy = dx * scale, dy * scale
+            disp_x = np.bincount(i, fx, minlength=n) - np.bincount(j, fx, minlength=n)
+            disp_y = np.bincount(i, fy, minlength=n) - np.bincount(j, fy, minlength=n)
+
+        if u is not None:
+            dx = x[u] - x[v]
+            dy = y[u] - y[v]
+            scale = np.sqrt(dx * dx + dy * dy) / k
+            fx, fy = dx * scale, dy * scale
+            disp_x -= np.bincount(u, fx, minlength=n) - np.bincount(v, fx, minlength=n)
+            disp_y -= np.bincount(u, fy, minlength=n) - np.bincount(v, fy, minlength=n)
+
+        if fixed is not None:
+            disp_x[fixed] = 0.0
+            disp_y[fixed] = 0.0
+        length = np.maximum(np.sqrt(disp_x * disp_x + disp_y * disp_y), 1e-9)
+        step_scale = np.minimum(length, temperature) / length
+        x += disp_x * step_scale
+        y += disp_y * step_scale
+        temperature *= 0.9
+    return np.column_stack([x, y])
+
+
+def multilevel_layout(n, edges, budget=5.0, seed=42, coarsest_size=50):
+    """
+    Multilevel force-directed layout for large sparse graphs.
+
+    The graph is coarsened by matching until it is small, the coarsest level is
+    laid out exactly, and each finer level inherits its parent positions and is
+    refined with a few grid-accelerated force iterations. Refinement stops early
+    when ``budget`` seconds have passed; the result is still a complete layout.
+    """
+    deadline = time.perf_counter() + budget
+    rng = np.random.default_rng(seed)
+
+    levels = []
+    level_n, level_edges = n, edges
+    while level_n > coarsest_size and len(level_edges):
+        mapping, coarse_n = _coarsen(level_n, level_edges, rng)
+        if coarse_n > 0.95 * level_n:
+            break
+        levels.append((level_n, level_edges, mapping))
+        level_edges = _coarse_edges(level_edges, mapping, coarse_n)
+        level_n = coarse_n
+
+    coords = rng.random((level_n, 2)) * np.sqrt(level_n)
+    coords = _force_directed(coords, level_edges, 100, np.sqrt(level_n) / 4, deadline,
+                             exact=level_n <= 1000)
+
+    for fine_n, fine_edges, mapping in reversed(levels):
+        coords = coords[mapping] * np.sqrt(fine_n / len(coords))
+        coords += rng.normal(scale=0.1, size=coords.shape)
+        coords = _force_directed(coords, fine_edges, 30, 2.0, deadline, exact=fine_n <= 1000)
+    return coords
+
+
+def sparse_spectral_layout(n, edges, budget=2.0, seed=42):
+    """
+    Layout from the two smallest non-trivial eigenvectors of the sparse graph Laplacian.
+    """
+    import scipy.sparse as sp
+    from scipy.sparse.linalg import lobpcg
+
+    if n < 3:
+        return np.random.default_rng(seed).random((n, 2))
+    data = np.ones(len(edges))
+    adj = sp.coo_array((data, (edges[:, 0], edges[:, 1])), shape=(n, n)).tocsr()
+    adj = adj + adj.T
+    degree = np.asarray(adj.sum(axis=1)).ravel()
+    laplacian = sp.diags_array(degree) - adj
+
+    rng = np.random.default_rng(seed)
+    guess = rng.standard_normal((n, 3))
+    guess[:, 0] = 1.0
+    # lobpcg cannot be interrupted, so the budget bounds its iteration count instead
+    maxiter = max(20, min(500, int(budget * 2e6 / max(n + len(edges), 1))))
+    with warnings.catch_warnings():
+        # Stopping at maxiter before full convergence is expected and still yields a usable layout
+        warnings.simplefilter("ignore", UserWarning)
+        _, vectors = lobpcg(laplacian, guess, largest=False, maxiter=maxiter, tol=1e-4)
+    coords = vectors[:, 1:3]
+    coords += rng.normal(scale=1e-3 * (np.abs(coords).max() or 1.0), size=coords.shape)
+    return coords
+
+
+def refine_layout(coords, edges, movable, iterations=20, k=None, budget=0.5):
+    """
+    Move only the ``movable`` nodes with a few force iterations; every other node stays put.
+
+    Only the neighborhood takes part: the movable nodes, their graph neighbors and
+    the nodes within ``2k`` of them (``k`` defaults to the median edge length), so
+    the cost depends on the size of the edit rather than the size of the graph.
+    """
+    coords = np.array(coords, dtype=float)
+    movable = np.asarray(movable, dtype=np.int64)
+    if len(movable) == 0 or len(coords) == 0:
+        return coords
+    if k is None:
+        k = _edge_length(coords, edges)
+
+    is_movable = np.zeros(len(coords), dtype=bool)
+    is_movable[movable] = True
+    lo = coords[movable].min(axis=0) - 2 * k
+    hi = coords[movable].max(axis=0) + 2 * k
+    local = np.all((coords >= lo) & (coords <= hi), axis=1) | is_movable
+    if len(edges):
+        touching = is_movable[edges[:, 0]] | is_movable[edges[:, 1]]
+        local[edges[touching].ravel()] = True
+
+    ids = np.flatnonzero(local)
+    remap = np.full(len(coords), -1, dtype=np.int64)
+    remap[ids] = np.arange(len(ids))
+    sub_edges = remap[edges] if len(edges) else edges
+    if len(sub_edges):
+        sub_edges = sub_edges[(sub_edges >= 0).all(axis=1)]
+    deadline = time.perf_counter() + budget
+    coords[ids] = _force_directed(coords[ids], sub_edges, iterations, k, deadline,
+                                  exact=len(ids) <= 1000, k=k, fixed=~is_movable[ids])
+    return coords
+
+
+def _edge_length(coords, edges):
+    if len(edges) == 0:
+        return 1.0
+    lengths = np.linalg.norm(coords[edges[:, 0]] - coords[edges[:, 1]], axis=1)
+    return float(np.median(lengths)) or 1.0
+
+
+class LayoutCache:
+    """
+    Keeps the last layout of an edited graph so a redraw only moves what changed.
+
+    ``layout(graph)`` reuses the previous position of every node that is still
+    present, places new nodes next to their placed neighbors, and refines the
+    nodes within ``hops`` of a changed edge with ``refine_layout``. A full
+    ``compute_layout`` runs the first time, and whenever more than
+    ``max_changed_fraction`` of the nodes would have to move. ``last_update``
+    reports which of ``"full"``, ``"incremental"`` or ``"unchanged"`` happened.
+    Store one instance per view in ``st.session_state``.
+    """
+
+    def __init__(self, method="auto", seed=42, hops=1, iterations=20, max_changed_fraction=0.25):
+        self.method = method
+        self.seed = seed
+        self.hops = hops
+        self.iterations = iterations
+        self.max_changed_fraction = max_changed_fraction
+        self.result = None
+        self.last_update = None
+
+    def layout(self, graph, embedding=None):
+        nodes, index, edges = graph_to_arrays(graph)
+        previous = self.result
+        if previous is None or not len(previous.nodes):
+            return self._full(graph, embedding)
+
+        # Old node ID of every current node (-1 for new nodes)
+        old_id = np.array([previous.index.get(node, -1) for node in nodes], dtype=np.int64).reshape(-1)
+        new = old_id < 0
+        n_old = len(previous.nodes)
+        moved = new.copy()
+
+        if len(edges):
+            mapped = np.sort(old_id[edges], axis=1)
+            known = (mapped >= 0).all(axis=1)
+            keys = mapped[:, 0] * n_old + mapped[:, 1]
+            old_edges = np.sort(previous.edges, axis=1)
+            old_keys = old_edges[:, 0] * n_old + old_edges[:, 1]
+            added = ~known | ~np.isin(keys, old_keys)
+            moved[edges[added].ravel()] = True
+        else:
+            keys, known = np.zeros(0, dtype=np.int64), np.zeros(0, dtype=bool)
+            old_keys = np.zeros(0, dtype=np.int64)
+        if len(old_keys):
+            # Endpoints of removed edges that are still in the graph
+            removed = previous.edges[~np.isin(old_keys, keys[known])]
+            new_id = np.full(n_old, -1, dtype=np.int64)
+            new_id[old_id[~new]] = np.flatnonzero(~new)
+            ends = new_id[removed.ravel()]
+            moved[ends[ends >= 0]] = True
+
+        if not moved.any() and len(nodes) == n_old:
+            self.last_update = "unchanged"
+            self.result = LayoutResult(nodes, previous.coords[old_id], "incremental", 0.0, index, edges)
+            return self.result
+        for _ in range(self.hops):
+            if len(edges):
+                reach = moved[edges[:, 0]] | moved[edges[:, 1]]
+                moved[edges[reach].ravel()] = True
+        if new.all() or (moved.sum() > self.max_changed_fraction * len(nodes) and len(nodes) > 20):
+            return self._full(graph, embedding)
+
+        start = time.perf_counter()
+        coords = np.zeros((len(nodes), 2))
+        coords[~new] = previous.coords[old_id[~new]]
+        k = _edge_length(previous.coords, previous.edges)
+        self._place_new(coords, new, edges, k)
+        coords = refine_layout(coords, edges, np.flatnonzero(moved), iterations=self.iterations, k=k)
+        self.last_update = "incremental"
+        self.result = LayoutResult(nodes, coords, "incremental", time.perf_counter() - start, index, edges)
+        return self.result
+
+    def _full(self, graph, embedding):
+        self.result = compute_layout(graph, method=self.method, embedding=embedding, seed=self.seed)
+        self.last_update = "full"
+        return self.result
+
+    def _place_new(self, coords, new, edges, k):
+        """
+        Put each new node at the mean of its already placed neighbors, or beside the drawing.
+        """
+        rng = np.random.default_rng(self.seed)
+        placed = ~new
+        for _ in range(3):
+            pending = ~placed
+            if not pending.any() or not len(edges):
+                break
+            u, v = edges[:, 0], edges[:, 1]
+            use = np.concatenate([placed[v] & pending[u], placed[u] & pending[v]])
+            target = np.concatenate([u, v])[use]
+            source = np.concatenate([v, u])[use]
+            if not len(target):
+                break
+            count = np.bincount(target, minlength=len(coords))
+            for axis in (0, 1):
+                total = np.bincount(target, coords[source, axis], minlength=len(coords))
+                hit = count > 0
+                coords[hit, axis] = total[hit] / count[hit]
+            hit = count > 0
+            coords[hit] += rng.normal(scale=0.3 * k, size=(int(hit.sum()), 2))
+            placed = placed | hit
+        pending = ~placed
+        if pending.any():
+            if placed.any():
+                lo, hi = coords[placed].min(axis=0), coords[placed].max(axis=0)
+            else:
+                lo, hi = np.zeros(2), np.ones(2)
+            count = int(pending.sum())
+            coords[pending, 0] = hi[0] + k
+            coords[pending, 1] = lo[1] + (hi[1] - lo[1]) * rng.random(count)
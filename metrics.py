@@ -0,0 +1,115 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from instrument import timed
+
+
+@dataclass
+class FaceMetrics:
+    """
+    Component-aware face statistics of a planar embedding.
+
+    ``F`` is the face count of the whole drawing, ``E - V + C + 1`` (all components
+    share one outer face). ``component_faces[i]`` counts the faces of component ``i``
+    drawn on its own, its outer face included, so an isolated vertex has one face.
+    ``face_sizes`` lists the boundary length of every face found by walking the
+    embedding, per component (each component contributes its own outer face; a
+    bridge is walked twice), and ``face_component`` says which component it belongs to.
+    """
+    V: int
+    E: int
+    C: int
+    F: int
+    component_faces: np.ndarray
+    face_sizes: np.ndarray
+    face_component: np.ndarray
+
+    def size_distribution(self):
+        """
+        ``counts[k]`` is the number of faces bounded by ``k`` edge sides.
+        """
+        return np.bincount(self.face_sizes) if len(self.face_sizes) else np.zeros(0, dtype=np.int64)
+
+
+def rotation_arrays(compact, embedding):
+    """
+    Flatten a ``PlanarEmbedding`` into integer arrays over ``compact``'s node IDs.
+
+    Returns ``(offsets, targets)``: half-edges leaving node ``u`` are
+    ``offsets[u]:offsets[u + 1]`` and point to ``targets[...]`` in clockwise order.
+    """
+    index = compact.index
+    rotation = embedding.get_data()
+    degree = np.zeros(compact.n, dtype=np.int64)
+    for node, neighbors in rotation.items():
+        degree[index[node]] = len(neighbors)
+    offsets = np.concatenate([[0], np.cumsum(degree)])
+    targets = np.empty(offsets[-1], dtype=np.int64)
+    for node, neighbors in rotation.items():
+        u = index[node]
+        targets[offsets[u]:offsets[u + 1]] = [index[v] for v in neighbors]
+    return offsets, targets
+
+
+def face_cycles(offsets, targets):
+    """
+    Label every half-edge with the face it bounds.
+
+    The successor of half-edge ``(v, w)`` is ``(w, x)`` where ``x`` precedes ``v``
+    in ``w``'s clockwise rotation (the same rule as ``PlanarEmbedding.traverse_face``).
+    Faces are the cycles of this permutation, found as connected components.
+    Returns ``(face_count, face_of_half_edge)``.
+    """
+    from scipy.sparse import coo_array
+    from scipy.sparse.csgraph import connected_components
+
+    h = len(targets)
+    if h == 0:
+        return 0, np.zeros(0, dtype=np.int64)
+    n = len(offsets) - 1
+    sources = np.repeat(np.arange(n), np.diff(offsets))
+    local = np.arange(h) - offsets[sources]
+
+    # Position of each half-edge's twin (w, v) within w's rotation
+    keys = sources * n + targets
+    order = np.argsort(keys)
+    twin = order[np.searchsorted(keys[order], targets * n + sources)]
+    twin_local = local[twin]
+
+    degree = np.diff(offsets)
+    successor = offsets[targets] + (twin_local - 1) % degree[targets]
+    graph = coo_array((np.ones(h, dtype=np.int8), (np.arange(h), successor)), shape=(h, h))
+    return connected_components(graph, directed=True, connection="weak")
+
+
+@timed("faces")
+def face_metrics(compact, embedding):
+    """
+    Compute ``FaceMetrics`` for ``compact`` from a planar ``embedding`` of it.
+
+    Components come from the CSR adjacency and faces from one vectorized walk of
+    the rotation system; no per-component NetworkX calls are made.
+    """
+    C, component = compact.components
+    V, E = compact.number_of_nodes(), compact.number_of_edges()
+    loops = len(compact.loops)
+
+    offsets, targets = rotation_arrays(compact, embedding)
+    face_count, face_of = face_cycles(offsets, targets)
+    face_sizes = np.bincount(face_of, minlength=face_count)
+    sources = np.repeat(np.arange(compact.n), np.diff(offsets))
+    face_component = np.zeros(face_count, dtype=np.int64)
+    face_component[face_of] = component[sources]
+
+    # Faces per component drawn alone: E_i - V_i + 2, which the walk confirms for
+    # components with edges; self-loops (not in the embedding) each add one face
+    comp_vertices = np.bincount(component, minlength=C)
+    comp_edges = np.bincount(component[compact.edges[:, 0]], minlength=C)
+    comp_edges += np.bincount(component[compact.loops], minlength=C)
+    component_faces = comp_edges - comp_vertices + 2
+    if loops:
+        face_sizes = np.concatenate([face_sizes, np.ones(loops, dtype=np.int64)])
+        face_component = np.concatenate([face_component, component[compact.loops]])
+
+    return FaceMetrics(V, E, C, E - V + C + 1, component_faces, face_sizes, face_component)
@@ -0,0 +1,433 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import cached_property
+
+import networkx as nx
+import numpy as np
+
+from compact import CompactGraph
+from instrument import timed
+from kuratowski import find_kuratowski_subgraph
+from metrics import face_metrics
+
+
+def as_compact(edges):
+    """
+    ``CompactGraph`` for an edge list of label pairs (or the graph itself if it already is one).
+    """
+    if isinstance(edges, CompactGraph):
+        return edges
+    return CompactGraph.from_labeled_edges(edges)
+
+
+def graph_hash(edges):
+    """
+    Content hash of an edge list, independent of edge order, edge direction and label formatting.
+    """
+    return as_compact(edges).content_hash()
+
+
+class GraphResultCache:
+    """
+    Bounded LRU cache of planarity results keyed by ``graph_hash``.
+
+    The cache lives at module level, so every Streamlit session served by the
+    same process shares it. Cached graphs are shared too and must not be mutated.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "size": len(self._data), "maxsize": self.maxsize}
+
+    def __len__(self):
+        return len(self._data)
+
+
+_result_cache = GraphResultCache(maxsize=128)
+
+
+def cache_info():
+    """
+    Hit/miss counters and current size of the shared planarity result cache.
+    """
+    return _result_cache.info()
+
+
+def clear_cache():
+    _result_cache.clear()
+
+
+@dataclass(eq=False)
+class PlanarityResult:
+    """
+    Outcome of one planarity test.
+
+    Keeps the ``PlanarEmbedding`` produced by ``nx.check_planarity`` so faces and a
+    crossing-free drawing can be derived from the same pass instead of being recomputed.
+    ``V``, ``E`` and ``F`` are ``None`` for non-planar graphs. ``tier`` names the
+    check that decided the result (see ``check_planarity_and_euler``); when a fast
+    tier decided it, the embedding is computed only once something asks for it.
+    """
+    is_planar: bool
+    V: int
+    E: int
+    F: int
+    compact: CompactGraph
+    tier: str = "full"
+    _embedding: nx.PlanarEmbedding = field(default=None, repr=False)
+
+    @property
+    def embedding(self):
+        if self._embedding is None and self.is_planar:
+            _, self._embedding = nx.check_planarity(self.graph)
+        return self._embedding
+
+    @property
+    def graph(self):
+        """
+        The graph as a ``networkx.Graph``, converted from ``compact`` on first use.
+        """
+        return self.compact.to_networkx()
+
+    @property
+    def C(self):
+        """
+        Number of connected components (isolated vertices included).
+        """
+        return self.compact.components[0]
+
+    @cached_property
+    def metrics(self):
+        """
+        Component-aware ``FaceMetrics`` (per-component face counts, face boundary lengths).
+        """
+        if not self.is_planar:
+            return None
+        return face_metrics(self.compact, self.embedding)
+
+    @cached_property
+    def faces(self):
+        """
+        Face boundaries of the embedding as vertex lists, one per face.
+        """
+        if not self.is_planar:
+            return None
+        faces = []
+        visited = set()
+        for u, v in self.embedding.edges():
+            if (u, v) not in visited:
+                faces.append(self.embedding.traverse_face(u, v, mark_half_edges=visited))
+        return faces
+
+    @cached_property
+    def kuratowski(self):
+        """
+        ``KuratowskiWitness`` (a K5 or K3,3 subdivision) proving non-planarity, or ``None`` for planar graphs.
+        """
+        if self.is_planar:
+            return None
+        return find_kuratowski_subgraph(self.compact)
+
+    @cached_property
+    def positions(self):
+        """
+        Straight-line, crossing-free node positions derived from the embedding.
+        """
+        if not self.is_planar or self.compact.n == 0:
+            return None
+        return nx.combinatorial_embedding_to_pos(self.embedding)
+
+
+def _peel_leaves(n, edges):
+    """
+    Remove degree-0/1 vertices repeatedly (the 2-core); returns the surviving edges.
+    """
+    degree = np.bincount(edges.ravel(), minlength=n)
+    stack = np.flatnonzero(degree == 1).tolist()
+    if not stack:
+        return edges
+    src = np.concatenate([edges[:, 0], edges[:, 1]])
+    dst = np.concatenate([edges[:, 1], edges[:, 0]])
+    order = np.argsort(src, kind="stable")
+    neighbors = dst[order].tolist()
+    indptr = np.concatenate([[0], np.cumsum(np.bincount(src, minlength=n))]).tolist()
+
+    degree = degree.tolist()
+    removed = bytearray(n)
+    while stack:
+        x = stack.pop()
+        if removed[x]:
+            continue
+        removed[x] = 1
+        for y in neighbors[indptr[x]:indptr[x + 1]]:
+            if not removed[y]:
+                degree[y] -= 1
+                if degree[y] <= 1:
+                    stack.append(y)
+    alive = np.frombuffer(bytes(removed), dtype=np.uint8) == 0
+    return edges[alive[edges[:, 0]] & alive[edges[:, 1]]]
+
+
+def _suppress_chains(n, edges):
+    """
+    Replace every maximal path of degree-2 vertices by one edge between its end vertices.
+
+    Cycles made only of degree-2 vertices disappear; resulting self-loops and
+    parallel edges are dropped since they never affect planarity.
+    """
+    from scipy.sparse import coo_array
+    from scipy.sparse.csgraph import connected_components
+
+    degree = np.bincount(edges.ravel(), minlength=n)
+    two = degree == 2
+    if not two.any():
+        return edges
+    ends_two = two[edges]
+    kept = edges[~ends_two[:, 0] & ~ends_two[:, 1]]
+
+    inner = edges[ends_two[:, 0] & ends_two[:, 1]]
+    chains = coo_array((np.ones(len(inner), dtype=np.int8), (inner[:, 0], inner[:, 1])), shape=(n, n))
+    _, chain_id = connected_components(chains, directed=False)
+
+    # Each chain has exactly two edges leaving it, to its two end vertices
+    mixed = edges[ends_two[:, 0] != ends_two[:, 1]]
+    chain_vertex = np.where(two[mixed[:, 0]], mixed[:, 0], mixed[:, 1])
+    end_vertex = np.where(two[mixed[:, 0]], mixed[:, 1], mixed[:, 0])
+    order = np.argsort(chain_id[chain_vertex], kind="stable")
+    bridged = end_vertex[order].reshape(-1, 2)
+
+    merged = np.sort(np.concatenate([kept, bridged]), axis=1)
+    merged = merged[merged[:, 0] != merged[:, 1]]
+    keys = np.unique(merged[:, 0] * n + merged[:, 1])
+    return np.column_stack([keys // n, keys % n])
+
+
+def planarity_kernel(compact, max_rounds=16):
+    """
+    Reduce a graph to a smaller one with the same planarity.
+
+    Alternately strips degree-1 vertices and suppresses degree-2 chains until
+    nothing changes; every remaining vertex has degree at least 3. Both steps run
+    in O(V + E) over the integer edge array.
+    """
+    n, edges = compact.n, compact.edges
+    for _ in range(max_rounds):
+        before = len(edges)
+        edges = _suppress_chains(n, _peel_leaves(n, edges))
+        if len(edges) == before:
+            break
+    used = np.unique(edges)
+    remap = np.full(n, -1, dtype=np.int64)
+    remap[used] = np.arange(len(used))
+    return CompactGraph(remap[edges], [compact.labels[i] for i in used.tolist()])
+
+
+def is_planar_edges(edges):
+    """
+    Planarity of an integer ``(m, 2)`` edge array, tested on its kernel (see ``planarity_kernel``).
+    Cheap enough to call many times on subsets of one graph.
+    """
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    n = int(edges.max()) + 1 if len(edges) else 0
+    for _ in range(16):
+        before = len(edges)
+        edges = _suppress_chains(n, _peel_leaves(n, edges))
+        if len(edges) == before:
+            break
+    if len(edges) == 0:
+        return True
+    if _exceeds_edge_bound(len(np.unique(edges)), len(edges)):
+        return False
+    graph = nx.Graph()
+    graph.add_edges_from(edges.tolist())
+    return nx.check_planarity(graph)[0]
+
+
+def _exceeds_edge_bound(n, m, bipartite=False):
+    # Simple planar graphs on n >= 3 vertices have at most 3n - 6 edges (2n - 4 if bipartite)
+    return n >= 3 and m > (2 * n - 4 if bipartite else 3 * n - 6)
+
+
+def _fast_decision(compact):
+    """
+    Settle planarity with O(V + E) checks when possible; returns ``(is_planar, tier)`` or ``(None, None)``.
+    """
+    n, m = compact.n, compact.m
+    if _exceeds_edge_bound(n, m):
+        return False, "edge-bound"
+    if _exceeds_edge_bound(n, m, bipartite=True) and compact.is_bipartite():
+        return False, "bipartite-bound"
+    if m == 0 or compact.degree().max() <= 2:
+        return True, "max-degree-2"
+    if m == n - compact.components[0]:
+        return True, "forest"
+    return None, None
+
+
+# Blocks with at most this many edges are tested inline instead of being sent to the pool
+INLINE_BLOCK_EDGES = 64
+
+
+def _block_rotation(block_edges):
+    """
+    Planarity test of one biconnected block given as an integer edge array.
+    Returns ``(is_planar, rotation)`` where ``rotation`` maps node -> clockwise neighbor list.
+    """
+    block = nx.Graph()
+    block.add_edges_from(np.asarray(block_edges).tolist())
+    is_planar, embedding = nx.check_planarity(block)
+    return is_planar, embedding.get_data() if is_planar else None
+
+
+def biconnected_blocks(compact):
+    """
+    Edge arrays of the biconnected components (bridges are single-edge blocks), largest first.
+    """
+    graph = nx.Graph()
+    graph.add_nodes_from(range(compact.n))
+    graph.add_edges_from(compact.edges.tolist())
+    blocks = [np.array(block, dtype=np.int64) for block in nx.biconnected_component_edges(graph)]
+    blocks.sort(key=len, reverse=True)
+    return blocks
+
+
+def check_blocks(compact, workers=None):
+    """
+    Test planarity block by block in a process pool.
+
+    A graph is planar iff each biconnected component is. Blocks violating the
+    edge bound reject immediately; the others are tested largest first, small
+    ones inline, and the first non-planar block cancels the remaining work.
+    Per-block rotation systems are concatenated at cut vertices, which yields a
+    planar embedding of the whole graph. Returns ``(is_planar, embedding)``.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    blocks = biconnected_blocks(compact)
+    for block in blocks:
+        if _exceeds_edge_bound(len(np.unique(block)), len(block)):
+            return False, None
+
+    rotations = []
+    large = [block for block in blocks if len(block) > INLINE_BLOCK_EDGES]
+    small = [block for block in blocks if len(block) <= INLINE_BLOCK_EDGES]
+    if len(large) > 1:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = [pool.submit(_block_rotation, block) for block in large]
+            for future in as_completed(futures):
+                is_planar, rotation = future.result()
+                if not is_planar:
+                    return False, None
+                rotations.append(rotation)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+    else:
+        small = large + small
+    for block in small:
+        is_planar, rotation = _block_rotation(block)
+        if not is_planar:
+            return False, None
+        rotations.append(rotation)
+
+    labels = compact.labels
+    merged = {labels[i]: [] for i in range(compact.n)}
+    for rotation in rotations:
+        for node, neighbors in rotation.items():
+            merged[labels[node]].extend(labels[i] for i in neighbors)
+    embedding = nx.PlanarEmbedding()
+    embedding.set_data(merged)
+    return True, embedding
+
+
+# Fraction of edges the kernel must shed before it is tested instead of the full graph
+KERNEL_MIN_REDUCTION = 0.1
+
+
+def _compute_planarity(compact, parallel=False, workers=None):
+    is_planar, tier = _fast_decision(compact)
+    embedding = None
+    if is_planar is None and parallel:
+        is_planar, embedding = check_blocks(compact, workers)
+        tier = "blocks"
+    elif is_planar is None:
+        kernel = planarity_kernel(compact)
+        if kernel.m == 0:
+            is_planar, tier = True, "reduced"
+        elif _exceeds_edge_bound(kernel.n, kernel.m):
+            is_planar, tier = False, "reduced-edge-bound"
+        elif kernel.m > (1 - KERNEL_MIN_REDUCTION) * compact.m:
+            # Barely reduced: test the original so the embedding comes for free
+            is_planar, embedding = nx.check_planarity(compact.to_networkx())
+            tier = "full"
+        else:
+            is_planar, _ = nx.check_planarity(kernel.to_networkx())
+            tier = "reduced-full"
+    if is_planar:
+        V = compact.number_of_nodes()
+        E = compact.number_of_edges()
+        F = E - V + compact.components[0] + 1  # Euler's formula V - E + F = 1 + C
+        return PlanarityResult(is_planar, V, E, F, compact, tier, embedding)
+    return PlanarityResult(is_planar, None, None, None, compact, tier)
+
+
+# Check planarity and Euler's formula
+@timed("planarity")
+def check_planarity_and_euler(edges, use_cache=True, parallel=False, workers=None):
+    """
+    Function to check if a graph is planar and calculate Euler's formula components.
+    Returns a ``PlanarityResult``.
+
+    Cheap tiers run first: the edge bounds E > 3V - 6 (E > 2V - 4 for bipartite
+    graphs) reject, forests and graphs of maximum degree 2 are accepted, and the
+    rest is reduced by stripping degree-1 vertices and suppressing degree-2 chains
+    before the full left-right test. ``PlanarityResult.tier`` reports which one decided.
+
+    With ``parallel=True`` the undecided case is split into biconnected components
+    that are tested in a pool of ``workers`` processes (see ``check_blocks``).
+
+    ``edges`` is a list of label pairs or a ``CompactGraph``. Results are memoized
+    by the graph's content hash, so resubmitting the same graph (in any edge order
+    or label formatting) skips the planarity test.
+    """
+    compact = as_compact(edges)
+    if not use_cache:
+        return _compute_planarity(compact, parallel, workers)
+
+    key = compact.content_hash()
+    result = _result_cache.get(key)
+    if result is None:
+        result = _compute_planarity(compact, parallel, workers)
+        _result_cache.put(key, result)
+    return result
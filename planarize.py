@@ -0,0 +1,265 @@
+import heapq
+import time
+from dataclasses import dataclass
+
+import networkx as nx
+import numpy as np
+
+from incremental import IncrementalPlanarity
+from instrument import timed
+from layout import LayoutResult, compute_layout
+from planarity import as_compact, is_planar_edges
+
+# Default wall-clock budget (seconds) for planarize()
+PLANARIZE_BUDGET = 5.0
+# Pairs of segments compared per vectorized step when counting crossings
+CROSSING_CHUNK = 1_000_000
+# Nodes plus edges per second that _subgraph_drawing gets through; it cannot be
+# interrupted, so this decides up front whether it fits the remaining budget
+DRAWING_RATE = 20_000
+
+
+@dataclass
+class PlanarizationResult:
+    """
+    A planar subgraph of a (usually non-planar) graph and a drawing of the whole graph.
+
+    ``removed_edges`` are the edges left out of the planar subgraph; when
+    ``maximal`` is true, adding any one of them back makes it non-planar.
+    ``layout`` draws every edge, the planar subgraph as drawn crossing-free where
+    possible, and ``crossings`` counts the edge crossings of that drawing, or is
+    ``None`` when counting them did not fit the time budget. ``complete`` is
+    false when the time budget ran out first; the result is then still a valid
+    planar subgraph and drawing, only possibly not maximal or not the best
+    candidate.
+    """
+    planar_edges: list
+    removed_edges: list
+    layout: LayoutResult
+    crossings: int
+    maximal: bool
+    complete: bool
+    elapsed: float
+
+    @property
+    def edges(self):
+        # Lets the result be passed as ``highlight=`` to plot_interactive_graph
+        return self.removed_edges
+
+    @property
+    def branch_vertices(self):
+        return []
+
+    def to_dict(self):
+        return {
+            "removed_edges": [list(edge) for edge in self.removed_edges],
+            "removed": len(self.removed_edges),
+            "crossings": self.crossings,
+            "maximal": self.maximal,
+            "complete": self.complete,
+            "layout_method": self.layout.method,
+            "nodes": self.layout.nodes,
+            "positions": np.round(self.layout.coords, 6).tolist(),
+        }
+
+
+def _vertex_insertion(compact, deadline):
+    """
+    Planar subgraph grown one vertex at a time.
+
+    The next vertex is always one with the most neighbors already placed (maximum
+    cardinality search, starting from the highest-degree vertex of each component),
+    so vertices rarely arrive by a single edge with nothing to fix where they go.
+    Each goes into the face of the maintained embedding that holds most of its
+    placed neighbors (``IncrementalPlanarity.add_star``) and keeps its edges to
+    those; the other edges are rejected. Once the deadline passes, remaining
+    vertices are attached by a single edge, which keeps every further step cheap.
+    Returns ``(kept, rejected)``.
+    """
+    labels, index = compact.labels, compact.index
+    indptr, indices = compact.indptr, compact.indices
+    placed = np.zeros(compact.n, dtype=bool)
+    count = np.zeros(compact.n, dtype=np.int64)
+    starts = iter(np.argsort(-compact.degree(), kind="stable").tolist())
+    heap = []
+    inc = IncrementalPlanarity()
+    kept, rejected, late = [], [], False
+    for step in range(compact.n):
+        while heap and placed[heap[0][1]]:
+            heapq.heappop(heap)
+        if heap:
+            w = heapq.heappop(heap)[1]
+        else:
+            w = next(u for u in starts if not placed[u])  # first vertex of a new component
+        nbrs = indices[indptr[w]:indptr[w + 1]]
+        placed[w] = True
+        late = late or time.perf_counter() > deadline
+        targets = nbrs[placed[nbrs]].tolist()
+        if late:
+            # A pendant edge to a new vertex fits anywhere, no face search needed
+            joined = set(targets[:1])
+            inc.add_node(labels[w])
+            if targets:
+                inc.add_edge(labels[w], labels[targets[0]])
+        else:
+            joined = {index[u] for u in inc.add_star(labels[w], [labels[u] for u in targets])}
+        for u in targets:
+            (kept if u in joined else rejected).append((min(u, w), max(u, w)))
+        for u in nbrs[~placed[nbrs]].tolist():
+            count[u] += 1
+            heapq.heappush(heap, (-count[u], u))
+    return (np.array(kept, dtype=np.int64).reshape(-1, 2),
+            np.array(rejected, dtype=np.int64).reshape(-1, 2))
+
+
+def maximal_planar_subgraph(graph, budget=PLANARIZE_BUDGET, deadline=None):
+    """
+    Greedy maximal planar subgraph of ``graph``.
+
+    The subgraph is grown vertex by vertex in a maintained embedding (see
+    ``_vertex_insertion``), then the rejected edges are retried against the whole
+    subgraph in halving groups, since a different embedding may still accept
+    them. Returns ``(kept, removed, maximal)`` as integer edge arrays over
+    ``compact`` node IDs; ``maximal`` is false when the deadline stopped the
+    insertion or the retries early.
+    """
+    compact = as_compact(graph)
+    deadline = deadline if deadline is not None else time.perf_counter() + budget
+    edges = compact.edges
+    if is_planar_edges(edges):
+        return edges, edges[:0], True
+
+    kept, deferred = _vertex_insertion(compact, deadline)
+
+    removed, maximal = [], True
+    pending = [deferred] if len(deferred) else []
+    while pending:
+        batch = pending.pop()
+        if time.perf_counter() > deadline:
+            removed.append(batch)
+            maximal = False
+            continue
+        trial = np.concatenate([kept, batch])
+        if is_planar_edges(trial):
+            kept = trial
+        elif len(batch) == 1:
+            removed.append(batch)
+        else:
+            half = len(batch) // 2
+            pending.extend([batch[half:], batch[:half]])
+    removed = np.concatenate(removed) if removed else edges[:0]
+    return kept, removed, maximal
+
+
+def count_crossings(coords, edges, subset=None, deadline=None):
+    """
+    Number of pairs of edges whose straight segments intersect.
+
+    Touching and overlapping segments count too (an edge drawn through a vertex is
+    as unreadable as a crossing); only segments sharing an endpoint never count.
+    With ``subset`` (edge row indices) only pairs involving at least one of those
+    edges are counted, e.g. the removed edges of a drawing whose other edges are
+    known not to cross. Returns ``None`` if ``deadline`` passes before the count
+    is finished.
+    """
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    m = len(edges)
+    if m < 2:
+        return 0
+    p, q = coords[edges[:, 0]], coords[edges[:, 1]]
+    rows = np.arange(m) if subset is None else np.unique(np.asarray(subset, dtype=np.int64))
+    in_rows = np.zeros(m, dtype=bool)
+    in_rows[rows] = True
+    lo, hi = np.minimum(p, q), np.maximum(p, q)
+
+    def orient(a, b, c):
+        return (b[..., 0] - a[..., 0]) * (c[..., 1] - a[..., 1]) - (b[..., 1] - a[..., 1]) * (c[..., 0] - a[..., 0])
+
+    total = 0
+    step = max(CROSSING_CHUNK // m, 1)
+    for start in range(0, len(rows), step):
+        if deadline is not None and time.perf_counter() > deadline:
+            return None
+        i = rows[start:start + step, None]
+        j = np.arange(m)[None, :]
+        # Each unordered pair once: pairs inside ``rows`` only with i < j. With the
+        # bounding boxes overlapping, the non-strict orientation test is exact
+        # for collinear segments as well.
+        candidate = (~in_rows[j] | (j > i))
+        candidate &= (lo[i, 0] <= hi[j, 0]) & (lo[j, 0] <= hi[i, 0])
+        candidate &= (lo[i, 1] <= hi[j, 1]) & (lo[j, 1] <= hi[i, 1])
+        shared = ((edges[i, 0] == edges[j, 0]) | (edges[i, 0] == edges[j, 1])
+                  | (edges[i, 1] == edges[j, 0]) | (edges[i, 1] == edges[j, 1]))
+        candidate &= ~shared
+        a, b = np.nonzero(candidate)
+        if not len(a):
+            continue
+        ia, jb = rows[start + a], b
+        d1 = orient(p[ia], q[ia], p[jb])
+        d2 = orient(p[ia], q[ia], q[jb])
+        d3 = orient(p[jb], q[jb], p[ia])
+        d4 = orient(p[jb], q[jb], q[ia])
+        total += int(np.count_nonzero((d1 * d2 <= 0) & (d3 * d4 <= 0)))
+    return total
+
+
+def _subgraph_drawing(compact, kept):
+    """
+    Straight-line positions with the planar subgraph ``kept`` drawn crossing-free.
+    """
+    graph = nx.Graph()
+    graph.add_nodes_from(range(compact.n))
+    graph.add_edges_from(kept.tolist())
+    _, embedding = nx.check_planarity(graph)
+    pos = nx.combinatorial_embedding_to_pos(embedding)
+    return np.array([pos[i] for i in range(compact.n)], dtype=float).reshape(-1, 2)
+
+
+@timed("planarize")
+def planarize(graph, budget=PLANARIZE_BUDGET):
+    """
+    Function to find a maximal planar subgraph and a low-crossing drawing within ``budget`` seconds.
+
+    Anytime: the greedy subgraph is computed first, then candidate drawings are
+    scored by their crossing count while time remains, keeping the best one.
+    Candidates are a straight-line drawing in which the planar subgraph has no
+    crossings (so only removed edges can cross), when it fits the remaining
+    time, and the regular force-directed layout of the whole graph. The subgraph
+    search gets half the budget. When no count finishes in time the drawing
+    without crossings in the subgraph is preferred and ``crossings`` is ``None``.
+    """
+    start = time.perf_counter()
+    deadline = start + budget
+    compact = as_compact(graph)
+    kept, removed, maximal = maximal_planar_subgraph(compact, deadline=start + budget / 2)
+
+    keys = compact.edges[:, 0] * compact.n + compact.edges[:, 1]
+    removed_rows = np.flatnonzero(np.isin(keys, removed[:, 0] * compact.n + removed[:, 1]))
+    labels = compact.labels
+
+    best = None
+    drawn = (compact.n + len(kept)) / DRAWING_RATE < deadline - time.perf_counter()
+    if compact.n and drawn:
+        coords = _subgraph_drawing(compact, kept)
+        crossings = count_crossings(coords, compact.edges, subset=removed_rows, deadline=deadline)
+        best = (crossings, LayoutResult(labels, coords, "planar-subgraph", 0.0, compact.index, compact.edges))
+    if compact.n and (best is None or best[0] is not None and time.perf_counter() < deadline):
+        candidate = compute_layout(compact, budget=max(deadline - time.perf_counter(), 0.1))
+        crossings = count_crossings(candidate.coords, compact.edges, deadline=deadline)
+        if best is None or crossings is not None and crossings < best[0]:
+            best = (crossings, candidate)
+    if best is None:
+        best = (0, compute_layout(compact))
+    complete = drawn and best[0] is not None and time.perf_counter() < deadline
+
+    crossings, layout = best
+    layout.elapsed = time.perf_counter() - start
+    return PlanarizationResult(
+        [(labels[u], labels[v]) for u, v in kept.tolist()],
+        [(labels[u], labels[v]) for u, v in removed.tolist()],
+        layout,
+        crossings,
+        maximal,
+        complete and maximal,
+        time.perf_counter() - start,
+    )
@@ -0,0 +1,253 @@
+import networkx as nx
+import numpy as np
+import plotly.graph_objects as go
+
+from compact import CompactGraph
+from instrument import timed
+from layout import LayoutResult, compute_layout, graph_to_arrays
+
+# Above this many nodes + edges the traces are drawn with WebGL (go.Scattergl)
+WEBGL_THRESHOLD = 5000
+
+# Level of detail: hard cap on glyphs (markers + edge segments) sent to the browser,
+# the node count above which nodes are clustered into super-nodes, and the largest
+# graph drawn with node labels
+MAX_GLYPHS = 20000
+LOD_NODE_THRESHOLD = 2000
+LABEL_MAX_NODES = 200
+
+
+def resolve_layout(graph, pos=None, layout_method="auto"):
+    """
+    Turn an optional ``{node: (x, y)}`` dict into a ``LayoutResult``, computing a layout when none is given.
+    Nodes missing from ``pos`` (isolated nodes) are placed by a spring layout around the fixed ones.
+    A ``LayoutResult`` (e.g. from a ``LayoutCache``) is used as is.
+    """
+    if isinstance(pos, LayoutResult):
+        return pos
+    if pos is None:
+        return compute_layout(graph, method=layout_method)
+    if any(node not in pos for node in graph):
+        nx_graph = graph.to_networkx() if isinstance(graph, CompactGraph) else graph
+        pos = nx.spring_layout(nx_graph, pos=pos, fixed=list(pos), seed=42)
+    nodes, index, edges = graph_to_arrays(graph)
+    coords = np.array([pos[node] for node in nodes], dtype=float).reshape(-1, 2)
+    return LayoutResult(nodes, coords, "given", 0.0, index, edges)
+
+
+def edge_coordinates(coords, edges):
+    """
+    Flat x/y buffers for a single line trace: ``x0, x1, NaN`` per edge, NaN breaking the line between edges.
+    """
+    segments = np.full((len(edges), 3, 2), np.nan)
+    segments[:, 0] = coords[edges[:, 0]]
+    segments[:, 1] = coords[edges[:, 1]]
+    segments = segments.reshape(-1, 2)
+    return segments[:, 0], segments[:, 1]
+
+
+def _bbox(coords):
+    if len(coords) == 0:
+        return np.zeros(2), np.ones(2)
+    low, high = coords.min(axis=0), coords.max(axis=0)
+    return low, np.maximum(high - low, 1e-9)
+
+
+def aggregate_graph(coords, edges, max_nodes):
+    """
+    Cluster nodes into at most ``max_nodes`` super-nodes by binning the layout on a square grid.
+
+    Returns ``(centroids, sizes, super_edges, weights)``: each super-node sits at the
+    centroid of its members, intra-cell edges disappear and parallel inter-cell edges
+    are bundled into one edge whose weight is the number of original edges.
+    """
+    membership, centroids, sizes = _cluster(coords, max_nodes)
+    super_edges, weights = _bundle(edges, membership, len(sizes))
+    return centroids, sizes, super_edges, weights
+
+
+def _cluster(coords, max_nodes):
+    # Grid cell of every node, with the centroid and member count of each occupied cell
+    low, span = _bbox(coords)
+    side = max(int(np.sqrt(max_nodes)), 1)
+    cells = np.minimum(((coords - low) / span * side).astype(np.int64), side - 1)
+    keys = cells[:, 0] * side + cells[:, 1]
+    occupied, membership = np.unique(keys, return_inverse=True)
+    k = len(occupied)
+
+    sizes = np.bincount(membership, minlength=k)
+    centroids = np.column_stack([
+        np.bincount(membership, coords[:, 0], minlength=k),
+        np.bincount(membership, coords[:, 1], minlength=k),
+    ]) / sizes[:, None]
+    return membership, centroids, sizes
+
+
+def _bundle(edges, membership, k):
+    # Edges between the k super-nodes, parallel ones merged and counted
+    if len(edges) == 0:
+        return np.empty((0, 2), dtype=np.int64), np.empty(0, dtype=np.int64)
+    ends = np.sort(membership[edges], axis=1)
+    ends = ends[ends[:, 0] != ends[:, 1]]
+    pair_keys, weights = np.unique(ends[:, 0] * k + ends[:, 1], return_counts=True)
+    return np.column_stack([pair_keys // k, pair_keys % k]), weights
+
+
+def decimate_edges(edges, weights, limit):
+    """
+    Keep at most ``limit`` edges, heaviest first (unweighted edges are thinned evenly).
+    """
+    if len(edges) <= limit:
+        return edges, weights
+    if weights is None:
+        keep = np.linspace(0, len(edges) - 1, limit).astype(np.int64)
+        return edges[keep], None
+    keep = np.argsort(weights, kind="stable")[::-1][:limit]
+    return edges[keep], weights[keep]
+
+
+# Interactive Plotly graph
+@timed("figure")
+def plot_interactive_graph(graph, pos=None, layout_method="auto", webgl_threshold=WEBGL_THRESHOLD,
+                           lod=True, max_glyphs=MAX_GLYPHS, highlight=None):
+    """
+    Function to create an interactive graph visualization using Plotly.
+
+    ``pos`` is an optional precomputed layout, e.g. ``PlanarityResult.positions``.
+    Without it the layout engine picks an algorithm suited to the graph size.
+    Coordinates are built as NumPy buffers from an integer edge array and handed
+    to Plotly directly; graphs larger than ``webgl_threshold`` (nodes + edges)
+    are drawn with ``Scattergl``.
+
+    Level of detail: above ``LOD_NODE_THRESHOLD`` nodes (when ``lod`` is on) the
+    nodes are clustered into grid super-nodes with bundled edges, and the figure
+    never carries more than ``max_glyphs`` markers plus edge segments. Plotly
+    zooms in the browser without calling back here, so node labels depend on the
+    graph size only: they are drawn for graphs of at most ``LABEL_MAX_NODES`` nodes.
+
+    ``highlight`` (e.g. ``PlanarityResult.kuratowski``) is drawn on top in red:
+    its ``edges`` as lines and its ``branch_vertices`` as markers. It goes through
+    the same clustering and glyph budget as the graph, taking up to half
+    of the edge segments.
+    """
+    layout = resolve_layout(graph, pos, layout_method)
+    coords, edges = layout.coords, layout.edges
+    marked_edges, branch = _highlight_ids(layout, highlight)
+
+    node_budget = max(max_glyphs // 4, 1)
+    aggregated = len(coords) > node_budget or (lod and len(coords) > LOD_NODE_THRESHOLD)
+    weights = marked_weights = None
+    if aggregated:
+        membership, coords, sizes = _cluster(
+            coords, min(node_budget, LOD_NODE_THRESHOLD) if lod else node_budget)
+        edges, weights = _bundle(edges, membership, len(sizes))
+        marked_edges, marked_weights = _bundle(marked_edges, membership, len(sizes))
+        branch = np.unique(membership[branch])
+    edge_budget = max(max_glyphs - len(coords) - len(branch), 0)
+    marked_edges, marked_weights = decimate_edges(marked_edges, marked_weights, edge_budget // 2)
+    edges, weights = decimate_edges(edges, weights, edge_budget - len(marked_edges))
+
+    glyphs = len(coords) + len(edges) + len(marked_edges) + len(branch)
+    scatter = go.Scattergl if glyphs > webgl_threshold else go.Scatter
+
+    edge_traces = []
+    if weights is None or len(weights) == 0:
+        edge_groups = [(edges, 2)]
+    else:
+        # Bundled edges: wider lines for heavier bundles, one trace per width bucket
+        bucket = np.digitize(np.log2(weights), [1, 3])
+        edge_groups = [(edges[bucket == b], width) for b, width in enumerate((1, 2.5, 4))]
+    for group, width in edge_groups:
+        edge_x, edge_y = edge_coordinates(coords, group)
+        edge_traces.append(scatter(
+            x=edge_x, y=edge_y,
+            line=dict(width=width, color="#4287f5"),
+            hoverinfo='none',
+            mode='lines'))
+
+    if aggregated:
+        node_trace = scatter(
+            x=coords[:, 0], y=coords[:, 1],
+            mode='markers',
+            hoverinfo='text',
+            marker=dict(
+                showscale=False,
+                color="#1f77b4",
+                size=np.minimum(6 + 3 * np.log2(sizes), 30),
+                line=dict(width=1, color="#ffffff")),
+            hovertext=[f"{size} nodes" for size in sizes.tolist()],
+        )
+    else:
+        labels = [str(node) for node in layout.nodes]
+        show_labels = len(coords) <= LABEL_MAX_NODES
+        node_trace = scatter(
+            x=coords[:, 0], y=coords[:, 1],
+            mode='markers+text' if show_labels else 'markers',
+            hoverinfo='text',
+            marker=dict(
+                showscale=False,
+                color="#1f77b4",
+                size=30 if show_labels else 10,
+                line=dict(width=2 if show_labels else 1, color="#ffffff")),
+            text=labels if show_labels else None,
+            hovertext=None if show_labels else labels,
+            textposition="top center"
+        )
+
+    title = 'Interactive Graph View'
+    if aggregated:
+        title += f' ({len(layout.nodes)} nodes in {len(coords)} clusters)'
+
+    highlight_traces = []
+    if highlight is not None:
+        names = None if aggregated else [str(layout.nodes[i]) for i in branch.tolist()]
+        highlight_traces = _highlight_traces(scatter, coords, marked_edges, branch, highlight, names)
+    fig = go.Figure(data=[*edge_traces, node_trace, *highlight_traces],
+                    layout=go.Layout(
+                        paper_bgcolor="#f8f9fa",
+                        plot_bgcolor="#f8f9fa",
+                        font=dict(color="#60B5FF", family="Outfit"),
+                        title=dict(
+                            text=title,
+                            font=dict(size=22, family="Outfit", color="#60B5FF")
+                        ),
+                        showlegend=False,
+                        hovermode='closest',
+                        margin=dict(b=20, l=5, r=5, t=60),
+                        xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+                        yaxis=dict(showgrid=False, zeroline=False, showticklabels=False))
+                    )
+    return fig
+
+
+def _highlight_ids(layout, highlight):
+    # The highlighted subgraph as node IDs of the layout, dropping unknown labels
+    if highlight is None:
+        return np.empty((0, 2), dtype=np.int64), np.empty(0, dtype=np.int64)
+    index = layout.index
+    edges = np.array([(index[u], index[v]) for u, v in highlight.edges
+                      if u in index and v in index], dtype=np.int64).reshape(-1, 2)
+    branch = np.array([index[node] for node in highlight.branch_vertices if node in index], dtype=np.int64)
+    return edges, branch
+
+
+def _highlight_traces(scatter, coords, edges, branch, highlight, names=None):
+    """
+    Red overlay traces for the highlighted ``edges`` and ``branch`` vertices (IDs into ``coords``).
+
+    ``names`` labels the branch vertices; without it (clustered views) they are
+    described as clusters.
+    """
+    edge_x, edge_y = edge_coordinates(coords, edges)
+    kind = getattr(highlight, 'kind', 'highlight')
+    if names is None:
+        hovertext = [f"cluster with a {kind} branch vertex"] * len(branch)
+    else:
+        hovertext = [f"{name} ({kind} branch vertex)" for name in names]
+    return [
+        scatter(x=edge_x, y=edge_y, mode='lines', hoverinfo='none',
+                line=dict(width=4, color="#e63946")),
+        scatter(x=coords[branch, 0], y=coords[branch, 1], mode='markers', hoverinfo='text',
+                hovertext=hovertext,
+                marker=dict(size=16, color="#e63946", line=dict(width=2, color="#ffffff"))),
+    ]
@@ -0,0 +1,240 @@
+"""
+Precomputed artifacts for the built-in example graphs of the app.
+
+The K3, C4, K5 and K3,3 examples on the Live Graph and Learn pages never change,
+so their metrics, embedding (rotation system), layout and serialized Plotly
+figure are computed once by a build step and committed:
+
+    python prebuilt.py            # rebuild assets/prebuilt
+    python prebuilt.py --check    # exit 1 if the artifacts are missing or out of date
+
+``assets/prebuilt`` holds ``manifest.json`` (format version, a fingerprint of the
+inputs, and per-example metrics plus row ranges), the arrays of all examples
+concatenated in ``.npy`` files, and the figures' JSON back to back in
+``figures.bin``. ``load_example`` memory-maps those files, so serving an example
+costs no graph computation and every app process shares the same pages. When
+the artifacts are missing or the fingerprint no longer matches (the examples,
+``FORMAT_VERSION`` or the analysis and plotting code changed), the example is
+computed in process instead.
+"""
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+PREBUILT_DIR = Path(__file__).resolve().parent / "assets" / "prebuilt"
+FORMAT_VERSION = 1
+
+# Built-in example graphs shown on the Live Graph and Learn pages
+EXAMPLES = {
+    "K3": [("A", "B"), ("B", "C"), ("C", "A")],
+    "C4": [("A", "B"), ("B", "C"), ("C", "D"), ("D", "A")],
+    "K5": [("1", "2"), ("1", "3"), ("1", "4"), ("1", "5"),
+           ("2", "3"), ("2", "4"), ("2", "5"),
+           ("3", "4"), ("3", "5"),
+           ("4", "5")],
+    "K3,3": [("A", "1"), ("A", "2"), ("A", "3"),
+             ("B", "1"), ("B", "2"), ("B", "3"),
+             ("C", "1"), ("C", "2"), ("C", "3")],
+}
+
+# Modules whose code shapes the artifacts; editing one makes them stale
+SOURCES = ("planarity.py", "metrics.py", "layout.py", "plotting.py")
+
+ARRAYS = ("edges", "coords", "offsets", "targets")
+
+
+@dataclass
+class ExampleArtifact:
+    """
+    Everything the app shows about one example graph.
+
+    ``edges`` index into ``nodes`` and ``coords`` is aligned with ``nodes``. The
+    rotation system is ``targets[offsets[u]:offsets[u + 1]]``, the clockwise
+    neighbors of node ``u`` (both empty for non-planar graphs). ``V``, ``E`` and
+    ``F`` are ``None`` for non-planar graphs, as in ``PlanarityResult``.
+    """
+    name: str
+    is_planar: bool
+    V: int
+    E: int
+    F: int
+    C: int
+    tier: str
+    nodes: list
+    edges: np.ndarray = field(repr=False)
+    coords: np.ndarray = field(repr=False)
+    offsets: np.ndarray = field(repr=False)
+    targets: np.ndarray = field(repr=False)
+    figure_json: bytes = field(repr=False)
+
+    def figure(self):
+        """
+        The Plotly figure, rebuilt from its JSON.
+        """
+        import plotly.io
+
+        return plotly.io.from_json(bytes(self.figure_json).decode("utf-8"))
+
+
+def fingerprint():
+    """
+    Digest of everything the artifacts are derived from.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps([FORMAT_VERSION, EXAMPLES], separators=(",", ":")).encode("utf-8"))
+    root = Path(__file__).resolve().parent
+    for name in SOURCES:
+        digest.update((root / name).read_bytes())
+    return digest.hexdigest()
+
+
+def build_example(name):
+    """
+    Function to compute the artifact of the example ``name`` in process.
+    """
+    from metrics import rotation_arrays
+    from planarity import check_planarity_and_euler
+    from plotting import plot_interactive_graph, resolve_layout
+
+    result = check_planarity_and_euler(EXAMPLES[name], use_cache=False)
+    compact = result.compact
+    layout = resolve_layout(compact, result.positions)
+    if result.is_planar:
+        offsets, targets = rotation_arrays(compact, result.embedding)
+    else:
+        offsets, targets = np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    figure = plot_interactive_graph(compact, layout)
+    return ExampleArtifact(
+        name=name,
+        is_planar=bool(result.is_planar),
+        V=result.V,
+        E=result.E,
+        F=result.F,
+        C=int(result.C),
+        tier=result.tier,
+        nodes=list(compact.labels),
+        edges=np.asarray(layout.edges, dtype=np.int64).reshape(-1, 2),
+        coords=np.asarray(layout.coords, dtype=np.float64).reshape(-1, 2),
+        offsets=np.asarray(offsets, dtype=np.int64),
+        targets=np.asarray(targets, dtype=np.int64),
+        figure_json=figure.to_json().encode("utf-8"),
+    )
+
+
+def build(root=PREBUILT_DIR):
+    """
+    Function to compute every example and write the artifacts to ``root``; returns the manifest.
+    """
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    manifest = {"version": FORMAT_VERSION, "fingerprint": fingerprint(), "examples": {}}
+    arrays = {key: [] for key in ARRAYS}
+    rows = dict.fromkeys(ARRAYS, 0)
+    figures, figure_end = [], 0
+    for name in EXAMPLES:
+        artifact = build_example(name)
+        entry = {key: getattr(artifact, key) for key in ("is_planar", "V", "E", "F", "C", "tier", "nodes")}
+        for key in ARRAYS:
+            value = getattr(artifact, key)
+            arrays[key].append(value)
+            entry[key] = [rows[key], rows[key] + len(value)]
+            rows[key] += len(value)
+        figures.append(artifact.figure_json)
+        entry["figure"] = [figure_end, figure_end + len(artifact.figure_json)]
+        figure_end += len(artifact.figure_json)
+        manifest["examples"][name] = entry
+
+    # The manifest is replaced last, so a reader never pairs it with arrays of another build
+    for key, parts in arrays.items():
+        _replace(root / f"{key}.npy", lambda f, parts=parts: np.save(f, np.concatenate(parts)))
+    _replace(root / "figures.bin", lambda f: f.write(b"".join(figures)))
+    _replace(root / "manifest.json", lambda f: f.write(json.dumps(manifest, indent=1).encode("utf-8") + b"\n"))
+    _open_prebuilt.cache_clear()
+    return manifest
+
+
+def _replace(path, write):
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        write(f)
+    os.replace(tmp, path)
+
+
+def read_manifest(root=PREBUILT_DIR):
+    try:
+        with open(Path(root) / "manifest.json", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def is_current(manifest):
+    return (manifest is not None and manifest.get("version") == FORMAT_VERSION
+            and manifest.get("fingerprint") == fingerprint())
+
+
+@lru_cache(maxsize=None)
+def _open_prebuilt(root):
+    # {name: ExampleArtifact} over memory-mapped files, or None when missing or stale
+    manifest = read_manifest(root)
+    if not is_current(manifest):
+        return None
+    try:
+        arrays = {key: np.load(root / f"{key}.npy", mmap_mode="r") for key in ARRAYS}
+        with open(root / "figures.bin", "rb") as f:
+            figures = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    except (OSError, ValueError):
+        return None
+    examples = {}
+    for name, entry in manifest["examples"].items():
+        parts = {key: arrays[key][slice(*entry[key])] for key in ARRAYS}
+        examples[name] = ExampleArtifact(
+            name=name, is_planar=entry["is_planar"], V=entry["V"], E=entry["E"], F=entry["F"],
+            C=entry["C"], tier=entry["tier"], nodes=entry["nodes"], figure_json=figures[slice(*entry["figure"])],
+            **parts)
+    return examples
+
+
+def load_example(name, root=PREBUILT_DIR):
+    """
+    Function to get the ``ExampleArtifact`` of example ``name``.
+
+    Served from the memory-mapped artifacts in ``root`` when they are current,
+    otherwise computed with ``build_example``.
+    """
+    if name not in EXAMPLES:
+        raise ValueError(f"Unknown example '{name}'. Use one of {tuple(EXAMPLES)}.")
+    examples = _open_prebuilt(Path(root))
+    if examples is None or name not in examples:
+        return build_example(name)
+    return examples[name]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompute the built-in example graphs of the app.")
+    parser.add_argument("--root", default=str(PREBUILT_DIR), help="artifact directory")
+    parser.add_argument("--check", action="store_true", help="only check that the artifacts are current")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        if is_current(read_manifest(args.root)):
+            print(f"{args.root} is up to date")
+            return 0
+        print(f"{args.root} is missing or stale; run python prebuilt.py", file=sys.stderr)
+        return 1
+    manifest = build(args.root)
+    for name, entry in manifest["examples"].items():
+        print(f"{name}: {len(entry['nodes'])} nodes, {entry['figure'][1] - entry['figure'][0]} bytes of figure JSON")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+"""
+Static graph images (PNG/SVG) rendered off the request thread.
+
+Rendering uses Matplotlib's object-oriented API on the Agg canvas (no pyplot
+global state), runs in a process pool, and is memoized in memory and on disk by
+graph hash and render parameters, so a hot graph is served without redrawing.
+"""
+import hashlib
+import io
+import json
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+
+from compact import CompactGraph
+
+RENDER_DIR = Path(os.environ.get("PLANAR_RENDER_CACHE", Path(__file__).resolve().parent / ".cache" / "renders"))
+
+RENDER_FORMATS = {"png": "image/png", "svg": "image/svg+xml"}
+# Labels are drawn only below this many nodes; above it they are unreadable anyway
+LABEL_MAX_NODES = 200
+# Bytes of rendered images kept in memory
+MEMORY_BUDGET = 64 * 1024 * 1024
+RENDER_WORKERS = int(os.environ.get("PLANAR_RENDER_WORKERS", 2))
+
+DEFAULT_PARAMS = {
+    "layout": "auto",
+    "seed": 42,
+    "width": 8.0,
+    "height": 6.0,
+    "dpi": 100,
+    "labels": True,
+}
+
+
+def render_params(**overrides):
+    """
+    Complete, validated render parameters (``DEFAULT_PARAMS`` plus ``overrides``).
+    """
+    unknown = set(overrides) - set(DEFAULT_PARAMS)
+    if unknown:
+        raise ValueError(f"Unknown render parameters: {sorted(unknown)}")
+    params = dict(DEFAULT_PARAMS, **{k: v for k, v in overrides.items() if v is not None})
+    params["width"], params["height"] = float(params["width"]), float(params["height"])
+    params["dpi"], params["seed"] = int(params["dpi"]), int(params["seed"])
+    params["labels"] = bool(params["labels"])
+    if not (0 < params["width"] <= 40 and 0 < params["height"] <= 40 and 10 <= params["dpi"] <= 600):
+        raise ValueError("Image size out of range")
+    return params
+
+
+def render_key(graph_hash, fmt, params):
+    """
+    Cache key for one rendering of a graph: its content hash plus format and parameters.
+    """
+    if fmt not in RENDER_FORMATS:
+        raise ValueError(f"Unknown image format '{fmt}'. Use one of {tuple(RENDER_FORMATS)}.")
+    blob = json.dumps([fmt, sorted(params.items())], separators=(",", ":")).encode("utf-8")
+    return f"{graph_hash}-{hashlib.blake2b(blob, digest_size=8).hexdigest()}.{fmt}"
+
+
+def draw_graph(compact, fmt="png", params=None):
+    """
+    Render ``compact`` to PNG or SVG bytes with a fresh ``Figure`` on the Agg canvas.
+
+    Edges are drawn as one ``LineCollection`` and nodes as one scatter, so the cost
+    grows with the graph but not with the number of Matplotlib artists.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.collections import LineCollection
+    from matplotlib.figure import Figure
+
+    from layout import compute_layout
+    from planarity import check_planarity_and_euler
+
+    params = params or render_params()
+    result = check_planarity_and_euler(compact)
+    embedding = result.embedding if result.is_planar else None
+    layout = compute_layout(compact, method=params["layout"], embedding=embedding, seed=params["seed"])
+    coords = layout.coords
+
+    fig = Figure(figsize=(params["width"], params["height"]), dpi=params["dpi"])
+    FigureCanvasAgg(fig)
+    ax = fig.add_axes([0, 0, 1, 1])
+    ax.set_axis_off()
+    if len(coords):
+        small = compact.n <= LABEL_MAX_NODES
+        ax.add_collection(LineCollection(coords[layout.edges], colors="gray", linewidths=1.0 if small else 0.3))
+        ax.scatter(coords[:, 0], coords[:, 1], s=500 if small else 4, c="lightblue", zorder=2,
+                   edgecolors="none")
+        if params["labels"] and small:
+            for label, (x, y) in zip(layout.nodes, coords):
+                ax.text(x, y, label, ha="center", va="center", fontsize=10, zorder=3)
+        ax.margins(0.08)
+        ax.autoscale_view()
+
+    out = io.BytesIO()
+    fig.savefig(out, format=fmt)
+    return out.getvalue()
+
+
+def _render_worker(edges, loops, labels, fmt, params):
+    return draw_graph(CompactGraph(edges, labels, loops=loops), fmt, params)
+
+
+class RenderCache:
+    """
+    Rendered images in memory (LRU bounded by total bytes) backed by a disk directory.
+    """
+
+    def __init__(self, cache_dir=RENDER_DIR, memory_budget=MEMORY_BUDGET):
+        self.cache_dir = Path(cache_dir)
+        self.memory_budget = memory_budget
+        self._memory = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return data
+        try:
+            data = (self.cache_dir / key).read_bytes()
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+        self._remember(key, data)
+        with self._lock:
+            self.hits += 1
+        return data
+
+    def put(self, key, data):
+        self._remember(key, data)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_dir / f".{key}.{uuid.uuid4().hex}.tmp"
+            tmp.write_bytes(data)
+            os.replace(tmp, self.cache_dir / key)
+        except OSError:
+            pass  # a read-only deployment still has the memory cache
+
+    def _remember(self, key, data):
+        if len(data) > self.memory_budget:
+            return
+        with self._lock:
+            old = self._memory.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            self._memory[key] = data
+            self._size += len(data)
+            while self._size > self.memory_budget:
+                _, evicted = self._memory.popitem(last=False)
+                self._size -= len(evicted)
+
+
+class RenderService:
+    """
+    Renders graph images in a process pool behind a ``RenderCache``.
+
+    ``submit`` returns a ``concurrent.futures.Future`` right away: already-resolved
+    on a cache hit, otherwise shared by every caller asking for the same image
+    while it is being drawn. Request handlers can wait on it (or wrap it with
+    ``asyncio.wrap_future``) without doing any drawing themselves.
+    """
+
+    def __init__(self, cache=None, workers=RENDER_WORKERS):
+        self.cache = cache if cache is not None else RenderCache()
+        self.workers = workers
+        self._pool = None
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    @property
+    def pool(self):
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            return self._pool
+
+    def submit(self, compact, fmt="png", **params):
+        """
+        Future resolving to ``(key, image bytes)`` for ``compact`` rendered with ``params``.
+        """
+        params = render_params(**params)
+        key = render_key(compact.content_hash(), fmt, params)
+        data = self.cache.get(key)
+        if data is not None:
+            done = Future()
+            done.set_result((key, data))
+            return done
+
+        with self._lock:
+            pending = self._inflight.get(key)
+            if pending is not None:
+                return pending
+            pending = self._inflight[key] = Future()
+
+        def finished(task):
+            with self._lock:
+                self._inflight.pop(key, None)
+            error = task.exception()
+            if error is not None:
+                pending.set_exception(error)
+                return
+            self.cache.put(key, task.result())
+            pending.set_result((key, task.result()))
+
+        task = self.pool.submit(_render_worker, compact.edges, compact.loops, compact.labels, fmt, params)
+        task.add_done_callback(finished)
+        return pending
+
+    def render(self, compact, fmt="png", timeout=None, **params):
+        """
+        Blocking convenience wrapper around ``submit``.
+        """
+        return self.submit(compact, fmt, **params).result(timeout)
+
+    def shutdown(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
+_render_service = None
+
+
+def get_render_service():
+    """
+    Process-wide ``RenderService``, created on first use.
+    """
+    global _render_service
+    if _render_service is None:
+        _render_service = RenderService()
+    return _render_service
@@ -1,28 +1,41 @@
-from flask import Flask, request, render_template, redirect, url_for, send_file
-import networkx as nx
+from flask import Flask, request, render_template, redirect, url_for, send_file, abort
 import json
-import matplotlib.pyplot as plt # type: ignore
-import os
+import io
+import threading
+from collections import OrderedDict
+from concurrent import futures
+
+from planarity import check_planarity_and_euler
+from render import RENDER_FORMATS, get_render_service
 
 app = Flask(__name__)
 
-def check_planarity_and_euler(edges):
-    graph = nx.Graph()
-    graph.add_edges_from(edges)
-    is_planar, embedding = nx.check_planarity(graph)
-    if is_planar:
-        V = graph.number_of_nodes()
-        E = graph.number_of_edges()
-        F = E - V + 2  # Euler's formula
-        return is_planar, V, E, F, graph
-    else:
-        return is_planar, None, None, None, graph
-
-def save_graph_image(graph, filename="static/graph.png"):
-    plt.figure(figsize=(8, 6))
-    nx.draw(graph, with_labels=True, node_color="lightblue", edge_color="gray", node_size=500, font_size=10)
-    plt.savefig(filename)
-    plt.close()
+def save_graph_image(compact, fmt="png"):
+    """
+    Function to queue a graph image in the render service and return its URL.
+    Images are keyed by graph hash, so concurrent requests never overwrite each other.
+    """
+    key = remember_graph(compact)
+    get_render_service().submit(compact, fmt)
+    return url_for("graph_image", key=key, fmt=fmt)
+
+
+# Seconds the image route waits for a render before answering 202; browsers do not retry <img> loads
+RENDER_WAIT = 15
+
+# Recently submitted graphs, by content hash, for the image route; the oldest are dropped
+MAX_GRAPHS = 256
+_graphs = OrderedDict()
+_graphs_lock = threading.Lock()
+
+def remember_graph(compact):
+    key = compact.content_hash()
+    with _graphs_lock:
+        _graphs[key] = compact
+        _graphs.move_to_end(key)
+        while len(_graphs) > MAX_GRAPHS:
+            _graphs.popitem(last=False)
+    return key
 
 @app.route("/", methods=["GET", "POST"])
 def index():
@@ -30,14 +43,14 @@ def index():
         edges_input = request.form.get("edges")
         try:
             edges = json.loads(edges_input)
-            is_planar, V, E, F, graph = check_planarity_and_euler(edges)
-            if is_planar:
-                save_graph_image(graph)  # Save the graph visualization
+            planarity = check_planarity_and_euler(edges)
+            if planarity.is_planar:
                 result = {
                     "is_planar": True,
-                    "vertices": V,
-                    "edges": E,
-                    "faces": F,
+                    "vertices": planarity.V,
+                    "edges": planarity.E,
+                    "faces": planarity.F,
+                    "graph_url": save_graph_image(planarity.compact),  # rendered in the background
                 }
             else:
                 result = {"is_planar": False}
@@ -49,7 +62,21 @@ def index():
 @app.route("/result")
 def result():
     result = json.loads(request.args.get("result"))
-    return render_template("result.html", result=result, graph_url="/static/graph.png")
+    return render_template("result.html", result=result, graph_url=result.get("graph_url"))
+
+@app.route("/graph/<key>.<fmt>")
+def graph_image(key, fmt):
+    with _graphs_lock:
+        compact = _graphs.get(key)
+    if compact is None or fmt not in RENDER_FORMATS:
+        abort(404)
+    future = get_render_service().submit(compact, fmt)
+    try:
+        _, data = future.result(timeout=RENDER_WAIT)
+    except futures.TimeoutError:
+        # Still rendering after the wait: let API clients poll this URL
+        return "Rendering, retry shortly", 202, {"Retry-After": "1", "Location": request.path}
+    return send_file(io.BytesIO(data), mimetype=RENDER_FORMATS[fmt], max_age=31536000)
 
 if __name__ == "__main__":
     app.run(debug=True)
\ No newline at end of file
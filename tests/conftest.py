@@ -0,0 +1,7 @@
+import os
+import sys
+from pathlib import Path
+
+# The modules live at the repository root, next to dmgt.py
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("PLANAR_OFFLINE", "1")
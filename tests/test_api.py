@@ -0,0 +1,216 @@
+import gzip
+import json
+import socket
+import threading
+import time
+
+import networkx as nx
+import pytest
+
+from compact import CompactGraph
+
+requests = pytest.importorskip("requests")
+uvicorn = pytest.importorskip("uvicorn")
+
+
+@pytest.fixture(scope="module")
+def api(tmp_path_factory):
+    # Read when api is imported
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv("PLANAR_ARTIFACT_DIR", str(tmp_path_factory.mktemp("artifacts")))
+        patch.setenv("PLANAR_API_WORKERS", "1")
+        patch.setenv("PLANAR_MAX_BODY_BYTES", "4096")
+        import api
+
+    return api
+
+
+@pytest.fixture(scope="module")
+def base(api):
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(api.app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    yield f"http://127.0.0.1:{port}"
+    server.should_exit = True
+    thread.join(10)
+
+
+def post(base, body):
+    return requests.post(f"{base}/api/planarity", data=body, timeout=60)
+
+
+def test_parse_graph_formats(api):
+    import graph_binary
+
+    graph = nx.relabel_nodes(nx.wheel_graph(7), str)
+    compact = CompactGraph.from_networkx(graph)
+    edges = [list(edge) for edge in graph.edges()]
+    bodies = [
+        json.dumps({"edges": edges}).encode(),
+        json.dumps({"edges": [{"source": u, "target": v} for u, v in edges]}).encode(),
+        json.dumps(edges).encode(),
+        "".join(f"{u}-{v}\n" for u, v in edges).encode(),
+        gzip.compress("".join(f"{u},{v}\n" for u, v in edges).encode()),
+        "\n".join(nx.generate_graphml(graph)).encode(),
+        graph_binary.encode(compact, compression="gzip"),
+    ]
+    for body in bodies:
+        assert api.parse_graph(body).content_hash() == compact.content_hash()
+    isolated = api.parse_graph(json.dumps({"edges": [], "nodes": ["x"]}).encode())
+    assert isolated.labels == ["x"]
+
+
+@pytest.mark.parametrize("graph", [nx.wheel_graph(7), nx.petersen_graph(), nx.complete_graph(6)],
+                         ids=["wheel", "petersen", "K6"])
+def test_planarity_matches_networkx(base, graph):
+    edges = [[str(u), str(v)] for u, v in graph.edges()]
+    response = post(base, json.dumps({"edges": edges}))
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["is_planar"] == nx.check_planarity(graph)[0]
+    assert (payload["vertices"], payload["edges"]) == (graph.number_of_nodes(), graph.number_of_edges())
+    assert payload["hash"] == CompactGraph.from_networkx(graph).content_hash()
+    if payload["is_planar"]:
+        assert payload["faces"] == graph.number_of_edges() - graph.number_of_nodes() + 2
+
+    # The stored result is served as is, and a repeated request hits it
+    assert requests.get(f"{base}{payload['artifacts']['result']}", timeout=60).json() == payload
+    assert post(base, json.dumps({"edges": edges[::-1]})).json() == payload
+
+
+def test_stored_graph_keeps_its_labels(api, tmp_path):
+    store = api.ArtifactStore(tmp_path)
+    compact = CompactGraph.from_labeled_edges([("a", "b"), ("b", "\u00fc"), ("", "x y")], nodes=["lone"])
+    key = compact.content_hash()
+    store.save_graph(key, compact)
+    loaded = store.load_graph(key)
+    assert loaded.labels == compact.labels and loaded.content_hash() == key
+    assert (loaded.edges == compact.edges).all()
+
+    empty = CompactGraph.from_labeled_edges([])
+    store.save_graph(empty.content_hash(), empty)
+    assert store.load_graph(empty.content_hash()).labels == []
+
+
+def test_nul_in_label_is_rejected(base):
+    # Two labels differing only by a trailing NUL must not be merged when stored
+    response = post(base, json.dumps({"edges": [["a", "a\u0000"], ["a", "b"]]}))
+    assert response.status_code == 400
+
+
+def test_layout_artifact(base):
+    graph = nx.triangular_lattice_graph(3, 3)
+    payload = post(base, "".join(f"{u} {v}\n" for u, v in
+                                 nx.relabel_nodes(graph, lambda node: f"{node[0]}_{node[1]}").edges())).json()
+    layout = requests.get(f"{base}{payload['artifacts']['layout']}", timeout=60).json()
+    assert layout["hash"] == payload["hash"]
+    assert len(layout["nodes"]) == len(layout["positions"]) == graph.number_of_nodes()
+    assert len(layout["edges"]) == graph.number_of_edges()
+
+
+def test_kuratowski_artifact(base):
+    graph = nx.petersen_graph()
+    payload = post(base, json.dumps([[u, v] for u, v in graph.edges()])).json()
+    witness = requests.get(f"{base}{payload['artifacts']['kuratowski']}", timeout=60).json()
+    assert not witness["is_planar"] and witness["witness"]["kind"] in ("K5", "K3,3")
+    assert {frozenset(edge) for edge in witness["witness"]["edges"]} <= {
+        frozenset(map(str, edge)) for edge in graph.edges()}
+    planar = post(base, b"a b\nb c\nc a\n").json()
+    assert "kuratowski" not in planar["artifacts"]
+
+
+def test_planarization_artifact(base):
+    graph = nx.petersen_graph()
+    payload = post(base, json.dumps([[u, v] for u, v in graph.edges()])).json()
+    planarization = requests.get(f"{base}{payload['artifacts']['planarization']}", timeout=60).json()
+    kept = nx.Graph(graph)
+    kept.remove_edges_from(tuple(map(int, edge)) for edge in planarization["removed_edges"])
+    assert kept.number_of_edges() == graph.number_of_edges() - planarization["removed"]
+    assert nx.check_planarity(kept)[0]
+    assert len(planarization["positions"]) == graph.number_of_nodes()
+
+
+@pytest.mark.parametrize("fmt, magic", [("png", b"\x89PNG"), ("svg", b"<?xml")])
+def test_image(base, fmt, magic):
+    payload = post(base, b"a b\nb c\nc a\n").json()
+    response = requests.get(f"{base}/api/graphs/{payload['hash']}/image.{fmt}", timeout=120)
+    assert response.status_code == 200
+    assert response.content.startswith(magic)
+
+
+def test_image_parameters_are_validated(base):
+    payload = post(base, b"a b\nb c\nc a\n").json()
+    response = requests.get(f"{base}/api/graphs/{payload['hash']}/image.png?dpi=5000", timeout=60)
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("body", [
+    b"",
+    b"[1, 2, 3]",
+    b"[[1, 2] [3, 4]]",
+    b"[[1, 2], [3, 4]] garbage",
+    b"garbage ]]",
+    b"{\"edges\": \"1-2\"}",
+    b"{\"edges\": [[1]]}",
+    b"{\"source\": 1}\n",
+    b"\xff\xfe\x00",
+    b"PGBF\x01\x00garbage",
+], ids=lambda body: repr(body[:20]))
+def test_malformed_body_is_rejected(base, body):
+    response = post(base, body)
+    assert response.status_code == 400
+    assert response.json()["error"]
+
+
+def test_body_limit(base, api):
+    assert api.MAX_BODY_BYTES == 4096
+    assert post(base, b"a b\n" * 1024).status_code == 200
+    assert post(base, b"a b\n" * 1025).status_code == 413
+
+    def chunks():
+        # Streamed without a Content-Length, so only the running count can stop it
+        for _ in range(1025):
+            yield b"a b\n"
+
+    assert post(base, chunks()).status_code == 413
+
+
+@pytest.mark.parametrize("path", [
+    "/api/graphs/" + "0" * 32,
+    "/api/graphs/" + "0" * 32 + "/layout",
+    "/api/graphs/" + "0" * 32 + "/image.png",
+    "/api/graphs/not-a-hash",
+])
+def test_unknown_graph(base, path):
+    response = requests.get(f"{base}{path}", timeout=60)
+    assert response.status_code == 404
+    assert response.json() == {"error": "Unknown graph hash"}
+
+
+def test_busy_server_sheds_load(base, api, monkeypatch):
+    payload = post(base, b"x y\ny z\n").json()
+    monkeypatch.setattr(api, "MAX_PENDING", 0)
+    response = post(base, b"p q\n")
+    assert response.status_code == 503 and response.headers["Retry-After"]
+    assert requests.get(f"{base}{payload['artifacts']['layout']}", timeout=60).status_code == 503
+    response = requests.get(f"{base}/api/graphs/{payload['hash']}/image.svg", timeout=60)
+    assert response.status_code == 503
+    monkeypatch.undo()
+    assert post(base, b"p q\n").status_code == 200
+
+
+def test_metrics(base):
+    payload = post(base, b"m n\nn o\no m\n").json()
+    requests.get(f"{base}{payload['artifacts']['layout']}", timeout=60)
+    response = requests.get(f"{base}/metrics", timeout=60)
+    assert response.status_code == 200 and response.headers["content-type"].startswith("text/plain")
+    text = response.text
+    # Stages timed in the worker processes are recorded by the server, routes with the hash folded away
+    for stage in ("load", "planarity", "layout", "http POST /api/planarity", "http GET /api/graphs/{hash}/layout"):
+        assert f'planar_stage_seconds_count{{stage="{stage}"}}' in text
+    assert payload["hash"] not in text
@@ -0,0 +1,110 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from assets import AssetCache, compile_static, load_script, load_static
+
+ANIMATION = {"v": "5.7", "layers": []}
+
+
+class LottieHandler(BaseHTTPRequestHandler):
+    requests = []
+
+    def do_GET(self):
+        type(self).requests.append((self.path, self.headers.get("If-None-Match")))
+        if self.path == "/missing.json":
+            self.send_response(404)
+            self.end_headers()
+        elif self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+        else:
+            body = json.dumps(ANIMATION).encode()
+            self.send_response(200)
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), LottieHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    bundled = tmp_path / "bundled"
+    bundled.mkdir()
+    (bundled / "fallback.json").write_text(json.dumps({"fallback": True}))
+    return AssetCache(cache_dir=tmp_path / "cache", bundled_dir=bundled, timeout=(1, 1), offline=False)
+
+
+def wait_idle(cache):
+    deadline = time.time() + 10
+    while cache._pending and time.time() < deadline:
+        time.sleep(0.01)
+
+
+def test_offline_serves_the_bundled_fallback(cache, server):
+    cache.offline = True
+    LottieHandler.requests.clear()
+    assert cache.get(f"{server}/a.json") == {"fallback": True}
+    assert not cache._pending and LottieHandler.requests == []
+
+
+def test_missing_asset_is_fetched_in_the_background(cache, server):
+    url = f"{server}/a.json"
+    assert cache.get(url) == {"fallback": True}
+    wait_idle(cache)
+    assert cache.get(url) == ANIMATION
+    # A new process finds it on disk, without the network
+    assert AssetCache(cache.cache_dir, cache.bundled_dir, offline=True).get(url) == ANIMATION
+
+
+def test_stale_asset_is_revalidated_by_etag(cache, server):
+    url = f"{server}/b.json"
+    entry = cache.fetch(url)
+    assert entry["etag"] == '"v1"'
+    LottieHandler.requests.clear()
+    cache.ttl = 0
+    time.sleep(0.01)
+    assert cache.get(url) == ANIMATION
+    wait_idle(cache)
+    assert LottieHandler.requests == [("/b.json", '"v1"')]
+    assert cache._memory[url]["fetched_at"] > entry["fetched_at"]
+    assert cache._memory[url]["data"] == ANIMATION
+
+
+def test_failed_fetch_backs_off(cache, server):
+    url = f"{server}/missing.json"
+    LottieHandler.requests.clear()
+    assert cache.get(url) == {"fallback": True}
+    wait_idle(cache)
+    assert url in cache._failed_at
+    assert cache.get(url) == {"fallback": True}
+    wait_idle(cache)
+    assert len(LottieHandler.requests) == 1
+
+
+def test_compile_static():
+    text = "<style>\n    /* comment */\n    .a { color: red; }\n\n</style>\n<!-- note -->\n    <div>x</div>\n"
+    assert compile_static(text) == "<style>\n.a { color: red; }\n</style>\n<div>x</div>"
+
+
+def test_lottie_player_is_inlined():
+    player = load_script("lottie.min.js")
+    assert "loadAnimation" in player and "</script" not in player
+    page = load_static("lottie.html").format(key="intro", height=200, data=json.dumps(ANIMATION), player=player)
+    # Nothing is fetched from outside, so the animation plays in an offline deployment
+    assert "<script src" not in page and "cdnjs" not in page
+    assert page.count("<script>") == 2 and player in page
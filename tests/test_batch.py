@@ -0,0 +1,110 @@
+import io
+import json
+
+import networkx as nx
+import pytest
+
+from batch import JsonlWriter, iter_directory, iter_jsonl, run_batch
+
+
+def graph_line(graph, graph_id=None):
+    edges = [[str(u), str(v)] for u, v in graph.edges()]
+    return json.dumps(edges if graph_id is None else {"id": graph_id, "edges": edges})
+
+
+def graphs(count):
+    return [nx.complete_graph(5) if i % 3 == 0 else nx.cycle_graph(i + 3) for i in range(count)]
+
+
+def rows(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_iter_jsonl_reads_only_the_top_level_id():
+    lines = [
+        '{"edges": [{"id": "inner", "source": 1, "target": 2}], "id": "outer"}',
+        '{"edges": [{"id": 7, "source": 1, "target": 2}]}',
+        '{"name": "id", "id": 3}',
+        "",
+        "[[1, 2]]",
+        '{"id": "a \\"quoted\\" [id]", "edges": [[1, 2]]}',
+    ]
+    ids = [graph_id for graph_id, _ in iter_jsonl(io.StringIO("\n".join(lines)))]
+    assert ids == ["outer", "line:2", "3", "line:5", 'a "quoted" [id]']
+
+
+def test_default_ids_do_not_collide_with_numeric_ids():
+    text = graph_line(nx.path_graph(3)) + "\n" + graph_line(nx.path_graph(4), 1) + "\n"
+    assert [graph_id for graph_id, _ in iter_jsonl(io.StringIO(text))] == ["line:1", "1"]
+
+
+def test_run_batch_rows(tmp_path):
+    tasks = [(str(i), graph_line(graph)) for i, graph in enumerate(graphs(6))]
+    tasks.append(("bad", "[[1, 2]"))
+    output = tmp_path / "results.jsonl"
+    summary = run_batch(tasks, str(output), workers=1, chunksize=2, log=None)
+    assert {k: summary[k] for k in ("processed", "planar", "non_planar", "errors", "skipped")} == {
+        "processed": 7, "planar": 4, "non_planar": 2, "errors": 1, "skipped": 0}
+    by_id = {row["id"]: row for row in rows(output)}
+    assert by_id["0"]["is_planar"] is False and by_id["0"]["tier"] == "edge-bound"
+    assert (by_id["1"]["vertices"], by_id["1"]["edges"], by_id["1"]["faces"]) == (4, 4, 2)
+    assert by_id["bad"]["error"] and by_id["bad"]["is_planar"] is None
+
+
+def test_resume_skips_completed_and_redoes_torn_lines(tmp_path):
+    tasks = [(str(i), graph_line(graph)) for i, graph in enumerate(graphs(8))]
+    output = tmp_path / "results.jsonl"
+    run_batch(tasks[:3], str(output), workers=1, log=None)
+    with open(output, "a", encoding="utf-8") as f:
+        f.write('{"id": "3", "is_pla')
+    summary = run_batch(tasks, str(output), workers=1, resume=True, log=None)
+    assert (summary["skipped"], summary["processed"]) == (3, 5)
+    assert sorted(row["id"] for row in rows(output)) == sorted(str(i) for i in range(8))
+
+
+def test_interrupted_run_resumes_from_checkpoint(tmp_path):
+    lines = [graph_line(graph, f"g{i}") for i, graph in enumerate(graphs(30))]
+
+    def interrupted():
+        yield from iter_jsonl(io.StringIO("\n".join(lines[:10])))
+        raise KeyboardInterrupt
+
+    output = tmp_path / "results.jsonl"
+    with pytest.raises(KeyboardInterrupt):
+        run_batch(interrupted(), str(output), workers=1, chunksize=1, flush_every=2, log=None)
+    checkpoint = JsonlWriter.completed_ids(output)
+    assert checkpoint and checkpoint <= {f"g{i}" for i in range(10)}
+
+    summary = run_batch(iter_jsonl(io.StringIO("\n".join(lines))), str(output), workers=1,
+                        chunksize=4, resume=True, log=None)
+    assert summary["skipped"] == len(checkpoint)
+    assert sorted(row["id"] for row in rows(output)) == sorted(f"g{i}" for i in range(30))
+
+
+def test_tasks_are_read_as_the_pool_drains_them(tmp_path):
+    consumed = []
+
+    def tasks():
+        for i, graph in enumerate(graphs(200)):
+            consumed.append(i)
+            yield str(i), graph_line(graph)
+
+    seen = []
+
+    class Log:
+        def write(self, text):
+            if text.strip():
+                seen.append(len(consumed))
+
+    run_batch(tasks(), str(tmp_path / "results.jsonl"), workers=1, chunksize=2, flush_every=10, log=Log())
+    # At the first progress line only a bounded window of tasks has been read ahead
+    assert seen[0] < 100 and len(consumed) == 200
+
+
+def test_iter_directory(tmp_path):
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.csv").write_text("source,target\na,b\n")
+    (tmp_path / "a.txt").write_text("a b\n")
+    (tmp_path / "notes.md").write_text("# not a graph\n")
+    assert [graph_id for graph_id, _ in iter_directory(tmp_path)] == ["a.txt", "sub/b.csv"]
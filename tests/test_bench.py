@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+import bench
+from bench import CASES, FAMILIES, _names, _projected, compare, format_report, load_baseline, run_benchmarks
+
+
+def entry(seconds, **extra):
+    return {"seconds": seconds, "peak_bytes": None, "nodes": 10, "edges": 20, **extra}
+
+
+def test_compare():
+    baseline = {"ok": entry(1.0), "slow": entry(1.0), "fast": entry(1.0), "noise": entry(0.001)}
+    results = {"ok": entry(1.2), "slow": entry(2.0), "fast": entry(0.5), "noise": entry(0.01),
+               "new": entry(1.0), "app/home/rerun": entry(0.5, budget=0.25)}
+    status = compare(results, baseline)
+    assert {key: label for key, (label, _) in status.items()} == {
+        "ok": "ok", "slow": "REGRESSION", "fast": "faster", "noise": "ok", "new": "new",
+        "app/home/rerun": "OVER BUDGET"}
+    assert status["slow"][1] == pytest.approx(2.0)
+    assert compare({"slow": entry(2.0)}, baseline, tolerance=1.5)["slow"][0] == "ok"
+    report = format_report(results, status)
+    assert len(report.splitlines()) == len(results) + 1 and "REGRESSION" in report
+
+
+def test_projected_growth():
+    assert _projected([], 100) == 0.0
+    assert _projected([(10, 0.5)], 100) == pytest.approx(5.0)
+    # Quadratic growth between the last two sizes carries on, capped at cubic
+    assert _projected([(10, 0.1), (100, 10.0)], 1000) == pytest.approx(1000.0)
+    assert _projected([(10, 0.1), (100, 1000.0)], 1000) == pytest.approx(1e6)
+
+
+def test_names():
+    assert _names(None, FAMILIES, "families") == list(FAMILIES)
+    assert _names("none", CASES, "cases") == []
+    assert _names(" grid ,tree", FAMILIES, "families") == ["grid", "tree"]
+    with pytest.raises(SystemExit):
+        _names("grid,nope", FAMILIES, "families")
+
+
+def test_run_benchmarks():
+    results = run_benchmarks(["grid", "complete"], ["planarity", "faces"], [10, 100], repeat=1, memory=False)
+    assert set(results) == {"grid/planarity/10", "grid/faces/10", "grid/planarity/100", "grid/faces/100",
+                            "complete/planarity/10", "complete/planarity/100"}
+    assert results["complete/planarity/100"]["is_planar"] is False
+    assert results["grid/planarity/100"]["nodes"] == 100
+    # Sizes past the time limit, projected from the smaller ones, are skipped
+    assert set(run_benchmarks(["grid"], ["planarity"], [10, 100], repeat=1, memory=False, time_limit=0)) == {
+        "grid/planarity/10"}
+
+
+def test_main_saves_and_checks_a_baseline(tmp_path, capsys):
+    baseline, output = tmp_path / "baseline.json", tmp_path / "results.json"
+    argv = ["--families", "grid", "--cases", "planarity", "--sizes", "10", "--repeat", "1", "--no-memory",
+            "--baseline", str(baseline)]
+    assert bench.main(argv + ["--save-baseline", "-o", str(output)]) == 0
+    saved = load_baseline(baseline)
+    assert list(saved["results"]) == ["grid/planarity/10"] and saved["environment"]["seed"] == bench.SEED
+    assert json.loads(output.read_text())["status"] == {"grid/planarity/10": "new"}
+    assert bench.main(argv + ["--check"]) == 0
+
+    saved["results"]["grid/planarity/10"]["seconds"] = -1.0
+    baseline.write_text(json.dumps(saved))
+    assert bench.main(argv + ["--check"]) == 1
+    assert "regression" in capsys.readouterr().err
+
+
+def test_stored_baseline_names_known_cases():
+    results = load_baseline()["results"]
+    assert results
+    for key in results:
+        if key.startswith("app/"):
+            continue
+        family, case, size = key.split("/")
+        assert family in FAMILIES and case in CASES and int(size) in bench.SIZES
@@ -0,0 +1,62 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from compact import CompactGraph, EdgeBuffer, LabelInterner, is_canonical
+
+
+@pytest.fixture(params=range(10))
+def graph(request):
+    return nx.gnm_random_graph(50, 90, seed=request.param)
+
+
+def test_interner_normalizes_labels():
+    interner = LabelInterner([1, " 1 ", "2"])
+    assert interner.labels == ["1", "2"] and interner.get(" 2") == 1 and 1 in interner
+    buffer = EdgeBuffer(interner)
+    buffer.add("2", 3)
+    assert buffer.to_numpy().tolist() == [[1, 2]] and len(buffer) == 1
+
+
+def test_edges_are_canonical():
+    compact = CompactGraph.from_labeled_edges([("b", "a"), ("a", "b"), ("c", "a"), ("c", "c")], nodes=["d"])
+    assert compact.labels == ["d", "b", "a", "c"]
+    assert compact.edges.tolist() == [[1, 2], [2, 3]]
+    assert compact.loops.tolist() == [3]
+    assert (compact.m, compact.number_of_edges()) == (2, 3)
+    assert is_canonical(compact.edges, compact.n)
+    assert not is_canonical(np.array([[2, 1]]), 3) and not is_canonical(np.array([[0, 1], [0, 1]]), 3)
+
+
+def test_matches_networkx(graph):
+    compact = CompactGraph.from_networkx(graph)
+    assert compact.n == graph.number_of_nodes() and compact.m == graph.number_of_edges()
+    for node in graph:
+        i = compact.index[str(node)]
+        assert sorted(compact.labels[j] for j in compact.neighbors(i).tolist()) == sorted(map(str, graph[node]))
+    assert compact.degree().tolist() == [graph.degree(int(label)) for label in compact.labels]
+    assert compact.components[0] == nx.number_connected_components(graph)
+    assert compact.is_bipartite() == nx.is_bipartite(graph)
+    assert nx.utils.graphs_equal(compact.to_networkx(), nx.relabel_nodes(graph, str))
+    assert compact.to_scipy().sum() == 2 * compact.m
+
+
+def test_bipartite():
+    assert CompactGraph.from_networkx(nx.complete_bipartite_graph(3, 4)).is_bipartite()
+    assert not CompactGraph.from_networkx(nx.cycle_graph(5)).is_bipartite()
+
+
+def test_content_hash_ignores_ids_and_order(graph):
+    compact = CompactGraph.from_networkx(graph)
+    edges = [(v, u) for u, v in graph.edges()][::-1]
+    shuffled = CompactGraph.from_labeled_edges(edges, nodes=sorted(graph, reverse=True))
+    assert shuffled.content_hash() == compact.content_hash()
+    graph.add_edge(0, 0)
+    assert CompactGraph.from_networkx(graph).content_hash() != compact.content_hash()
+
+
+def test_from_canonical_edges_keeps_the_array():
+    edges = np.array([[0, 1], [1, 2]], dtype=np.int64)
+    assert np.shares_memory(CompactGraph.from_canonical_edges(edges, ["a", "b", "c"]).edges, edges)
+    messy = CompactGraph.from_canonical_edges(np.array([[2, 1], [1, 0], [0, 1]]), ["a", "b", "c"])
+    assert messy.edges.tolist() == [[0, 1], [1, 2]]
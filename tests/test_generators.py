@@ -0,0 +1,108 @@
+import io
+import json
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from batch import iter_jsonl
+from generators import GENERATORS, _pairs_from_index, estimate_edges, generate, main
+from planarity import check_planarity_and_euler
+
+PLANAR = ["grid", "triangulated-grid", "delaunay", "apollonian", "tree"]
+SIZES = [3, 10, 257, 2000]
+
+
+def check(compact):
+    return check_planarity_and_euler(compact, use_cache=False)
+
+
+@pytest.mark.parametrize("name", list(GENERATORS))
+def test_deterministic_per_seed(name):
+    first = generate(name, 500, seed=7)
+    assert first.content_hash() == generate(name, 500, seed=7).content_hash()
+    if name not in ("grid", "complete"):
+        assert first.content_hash() != generate(name, 500, seed=8).content_hash()
+
+
+@pytest.mark.parametrize("n", SIZES)
+@pytest.mark.parametrize("name", list(GENERATORS))
+def test_simple_graphs_within_the_edge_estimate(name, n):
+    if name == "crossings" and n == 3:
+        # A single triangle has no quadrilateral to put a crossing into
+        with pytest.raises(ValueError):
+            generate(name, n, seed=1)
+        return
+    compact = generate(name, n, seed=1)
+    assert len(compact.loops) == 0
+    assert (compact.edges[:, 0] < compact.edges[:, 1]).all()
+    assert len(np.unique(compact.edges, axis=0)) == compact.m
+    assert compact.m <= estimate_edges(name, compact.n)
+    assert compact.labels == [str(i) for i in range(compact.n)]
+
+
+@pytest.mark.parametrize("n", SIZES)
+@pytest.mark.parametrize("name", PLANAR)
+def test_planar_families(name, n):
+    assert check(generate(name, n, seed=3)).is_planar
+
+
+def test_apollonian_is_maximal_planar():
+    compact = generate("apollonian", 1000, seed=0)
+    assert compact.n == 1000 and compact.m == 3 * compact.n - 6
+
+
+@pytest.mark.parametrize("crossings", [1, 5])
+def test_crossings_family_is_not_planar(crossings):
+    base = generate("delaunay", 2000, seed=4)
+    compact = generate("crossings", 2000, seed=4, crossings=crossings)
+    assert compact.m == base.m + crossings
+    result = check(compact)
+    assert not result.is_planar and result.tier not in ("edge-bound", "bipartite-bound")
+
+
+def test_gnp_draws_distinct_pairs():
+    compact = generate("gnp", 1000, seed=2)
+    assert len(compact.loops) == 0 and compact.number_of_edges() == compact.m
+    assert abs(compact.m - 1500) < 4 * np.sqrt(1500)
+    assert generate("gnp", 1, seed=0).m == 0
+    assert generate("gnp", 4, seed=0, mean_degree=3).m == 6
+
+
+@pytest.mark.parametrize("n", [2, 5, 64, 1000])
+def test_pairs_from_index(n):
+    u, v = np.triu_indices(n, k=1)
+    assert np.array_equal(_pairs_from_index(np.arange(len(u)), n), np.column_stack([u, v]))
+
+
+def test_pairs_from_index_on_a_large_graph():
+    n = 2_000_000
+    index = np.array([0, n - 2, n - 1, n * (n - 1) // 4, n * (n - 1) // 2 - 1], dtype=np.int64)
+    u, v = _pairs_from_index(index, n).T
+    assert (u < v).all() and (v < n).all()
+    assert np.array_equal(u * (2 * n - u - 1) // 2 + v - u - 1, index)
+
+
+def test_unknown_family():
+    with pytest.raises(ValueError):
+        generate("nope", 10)
+    with pytest.raises(ValueError):
+        estimate_edges("nope", 10)
+
+
+def test_jsonl_output_feeds_batch(tmp_path):
+    path = tmp_path / "graphs.jsonl"
+    assert main(["crossings", "300", "--crossings", "2", "--count", "3", "--seed", "5", "-o", str(path)]) == 0
+    tasks = list(iter_jsonl(io.StringIO(path.read_text())))
+    assert [graph_id for graph_id, _ in tasks] == ["crossings-300-5", "crossings-300-6", "crossings-300-7"]
+    edges = json.loads(tasks[1][1])["edges"]
+    assert len(edges) == generate("crossings", 300, seed=6, crossings=2).m
+    assert not nx.check_planarity(nx.Graph([tuple(edge) for edge in edges]))[0]
+
+
+def test_csv_output(tmp_path):
+    path = tmp_path / "grid.csv"
+    assert main(["grid", "16", "-o", str(path)]) == 0
+    assert np.array_equal(np.loadtxt(path, delimiter=",", dtype=np.int64), generate("grid", 16).edges)
+    with pytest.raises(SystemExit):
+        main(["grid", "16", "--count", "2", "-o", str(path)])
@@ -0,0 +1,178 @@
+from importlib.util import find_spec
+
+import networkx as nx
+import numpy as np
+import pytest
+
+import graph_binary
+from compact import CompactGraph
+from graph_binary import decode, encode, read, write_graph
+from planarity import check_planarity_and_euler
+
+COMPRESSIONS = ["none", "gzip"] + (["zstd"] if find_spec("zstandard") else [])
+
+
+def graphs():
+    random = nx.gnm_random_graph(40, 80, seed=3)
+    return {
+        "random": CompactGraph.from_networkx(random),
+        "labeled": CompactGraph.from_labeled_edges([("a", "b"), ("b", "ç"), ("ç", "a"), ("d d", "a"), ("e", "e")],
+                                                   nodes=["isolated"]),
+        "empty": CompactGraph.from_labeled_edges([]),
+        "nodes only": CompactGraph.from_labeled_edges([], nodes=["x", "y"]),
+    }
+
+
+@pytest.fixture(params=list(graphs()))
+def graph(request):
+    return graphs()[request.param]
+
+
+@pytest.mark.parametrize("encoding", graph_binary.EDGE_ENCODINGS)
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_round_trip(graph, encoding, compression):
+    decoded = decode(encode(graph, encoding=encoding, compression=compression)).compact
+    assert decoded.labels == graph.labels
+    assert decoded.edges.tolist() == graph.edges.tolist()
+    assert decoded.loops.tolist() == graph.loops.tolist()
+    assert decoded.indptr.tolist() == graph.indptr.tolist()
+    assert decoded.indices.tolist() == graph.indices.tolist()
+    assert decoded.content_hash() == graph.content_hash()
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_delta_edges_round_trip(seed):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(2, 5000))
+    edges = CompactGraph(rng.integers(0, n, size=(int(rng.integers(1, 20000)), 2)), range(n)).edges
+    du, dv = graph_binary.encode_edges(edges)
+    assert graph_binary.decode_edges(du, dv, len(edges)).tolist() == edges.tolist()
+
+
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_layout_and_rotation_round_trip(tmp_path, compression):
+    compact = CompactGraph.from_networkx(nx.triangular_lattice_graph(5, 5))
+    result = check_planarity_and_euler(compact)
+    layout = {label: (i, -i / 2) for i, label in enumerate(compact.labels)}
+    path = tmp_path / "lattice.pgb"
+    write_graph(compact, path, layout=layout, rotation=result.embedding, compression=compression)
+
+    stored = read(path)
+    assert stored.compact.content_hash() == compact.content_hash()
+    assert stored.coords.tolist() == [list(layout[label]) for label in compact.labels]
+    assert stored.positions.nodes == compact.labels
+    labels = compact.labels
+    for u in range(compact.n):
+        rotation = [labels[v] for v in stored.targets[stored.offsets[u]:stored.offsets[u + 1]].tolist()]
+        assert rotation == list(result.embedding.neighbors_cw_order(labels[u]))
+
+
+@pytest.mark.parametrize("name", ["graph.graphml", "graph.csv", "graph.csv.gz"])
+def test_write_graph_formats(tmp_path, name):
+    from ingest import load_graph
+
+    # Rebuilt from its edges, since a CSV edge list cannot carry isolated nodes
+    compact = graphs()["random"]
+    compact = CompactGraph.from_labeled_edges(
+        [(compact.labels[u], compact.labels[v]) for u, v in compact.edges.tolist()])
+    write_graph(compact, tmp_path / name)
+    assert load_graph(tmp_path / name).content_hash() == compact.content_hash()
+
+
+@pytest.mark.parametrize("encoding", graph_binary.EDGE_ENCODINGS)
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_truncated_file_is_rejected(encoding, compression):
+    data = encode(graphs()["labeled"], layout=np.zeros((6, 2)), encoding=encoding, compression=compression)
+    for size in range(len(data)):
+        with pytest.raises(ValueError):
+            decode(data[:size])
+
+
+def test_bad_header_is_rejected():
+    data = bytearray(encode(graphs()["random"]))
+    with pytest.raises(ValueError, match="Not a binary graph"):
+        decode(b"PGBX" + bytes(data[4:]))
+    newer = bytearray(data)
+    newer[4] = graph_binary.FORMAT_VERSION + 1
+    with pytest.raises(ValueError, match="newer"):
+        decode(bytes(newer))
+    unknown = bytearray(data)
+    unknown[6] = len(graph_binary.COMPRESSIONS)
+    with pytest.raises(ValueError, match="compression"):
+        decode(bytes(unknown))
+
+
+def test_unknown_options_are_rejected():
+    with pytest.raises(ValueError):
+        encode(graphs()["random"], encoding="rle")
+    with pytest.raises(ValueError):
+        encode(graphs()["random"], compression="lz4")
+
+
+def test_nul_in_label_is_rejected():
+    with pytest.raises(ValueError, match="NUL"):
+        encode([("a\0b", "c")])
+
+
+def forge(n, m, sections, loops=0, flags=0, count=None):
+    body = b""
+    for tag, array in sections:
+        data = array.tobytes()
+        body += graph_binary._SECTION.pack(tag, array.dtype.str.encode("ascii"), len(data)) + data
+        body += b"\0" * (-len(data) % 8)
+    count = len(sections) if count is None else count
+    return graph_binary._HEADER.pack(graph_binary.MAGIC, graph_binary.FORMAT_VERSION, 0, flags, n, m, loops, count) + body
+
+
+TRIANGLE = np.array([[0, 1], [0, 2], [1, 2]], dtype="<i8")
+
+
+@pytest.mark.parametrize("n, m, loops", [(1 << 60, 0, 0), (0, 1 << 60, 0), (0, 0, 1 << 60), (1 << 40, 1 << 40, 0)])
+def test_huge_header_counts_are_rejected(n, m, loops):
+    with pytest.raises(ValueError, match="decode limit"):
+        decode(forge(n, m, [], loops=loops, flags=graph_binary.LABELS_ARE_RANGE))
+
+
+@pytest.mark.parametrize("n, m, sections, loops, match", [
+    (4, 3, [(b"LABL", np.frombuffer(b"a\0b\0c", np.uint8)), (b"EDGE", TRIANGLE)], 0, "labels"),
+    (3, 4, [(b"EDGE", TRIANGLE)], 0, "edges"),
+    (2, 3, [(b"EDGE", TRIANGLE)], 0, "outside"),
+    (3, 3, [(b"EDGE", -TRIANGLE)], 0, "outside"),
+    (3, 3, [(b"EDGE", TRIANGLE)], 1, "self-loops"),
+    (3, 3, [(b"EDGE", TRIANGLE), (b"LOOP", np.array([3], dtype="<i8"))], 1, "outside"),
+    (3, 3, [(b"EDGE", TRIANGLE), (b"XY", np.zeros(4))], 0, "layout"),
+    (3, 3, [(b"EDGE", TRIANGLE), (b"ROTO", np.array([0, 2, 4, 9], dtype="<i8")),
+            (b"ROTT", np.array([1, 2, 0, 2, 0, 1], dtype="<i8"))], 0, "rotation"),
+    (3, 3, [(b"EDGE", TRIANGLE), (b"ROTO", np.array([0, 2, 4, 6], dtype="<i8")),
+            (b"ROTT", np.array([1, 2, 0, 2, 0, 7], dtype="<i8"))], 0, "rotation"),
+    (3, 3, [(b"EDGE", TRIANGLE.astype("<f8"))], 0, "dtype"),
+], ids=["label count", "edge count", "edge id", "negative id", "loop count", "loop id", "layout", "offsets",
+        "targets", "dtype"])
+def test_forged_sections_are_rejected(n, m, sections, loops, match):
+    with pytest.raises(ValueError, match=match):
+        decode(forge(n, m, sections, loops=loops, flags=graph_binary.LABELS_ARE_RANGE * (n != 4)))
+
+
+def test_varint_counts_are_checked():
+    du, dv = graph_binary.encode_edges(TRIANGLE)
+    with pytest.raises(ValueError):
+        decode(forge(3, 1000, [(b"EDU", du), (b"EDV", dv)], flags=graph_binary.LABELS_ARE_RANGE))
+
+
+def test_forged_adjacency_is_rebuilt():
+    compact = CompactGraph(TRIANGLE, range(3))
+    indices = np.array([1, 2, 0, 2, 0, 9], dtype=compact.indices.dtype.newbyteorder("<"))
+    data = forge(3, 3, [(b"EDGE", TRIANGLE), (b"ADJP", compact.indptr.astype("<i8")), (b"ADJI", indices)],
+                 flags=graph_binary.LABELS_ARE_RANGE)
+    decoded = decode(data).compact
+    assert decoded.indices.tolist() == compact.indices.tolist()
+
+
+@pytest.mark.parametrize("compression", COMPRESSIONS[1:])
+def test_decompression_is_capped(compression):
+    data = bytearray(encode(graphs()["random"], layout=np.zeros((40, 2)), compression=compression))
+    assert decode(bytes(data), max_bytes=1 << 16).compact.n == 40
+    # A small file that inflates far past the limit
+    bomb = graph_binary._compress(b"\0" * (1 << 22), compression, None)
+    with pytest.raises(ValueError, match="decode limit"):
+        decode(bytes(data[:graph_binary._HEADER.size]) + bomb, max_bytes=1 << 20)
@@ -0,0 +1,124 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from compact import CompactGraph
+from graph_store import GraphStore
+from planarity import check_planarity_and_euler
+from planarize import planarize
+
+
+@pytest.fixture
+def store(tmp_path):
+    return GraphStore(tmp_path / "graphs")
+
+
+def test_planar_round_trip(store):
+    compact = CompactGraph.from_networkx(nx.triangular_lattice_graph(5, 5))
+    result = check_planarity_and_euler(compact)
+    layout = {label: (i, i % 3) for i, label in enumerate(reversed(compact.labels))}
+    graph_id = store.save(compact, result=result, layout=layout, name="lattice")
+
+    stored = store.open(graph_id)
+    assert stored.name == "lattice"
+    assert stored.compact.content_hash() == compact.content_hash()
+    assert stored.compact.labels == compact.labels
+    assert stored.compact.edges.tolist() == compact.edges.tolist()
+    assert (stored.is_planar, stored.tier, stored.V, stored.E, stored.F, stored.C) == (
+        True, result.tier, result.V, result.E, result.F, result.C)
+    assert stored.positions.coords.tolist() == [list(layout[label]) for label in compact.labels]
+    stored.embedding.check_structure()
+    for label in compact.labels:
+        assert list(stored.embedding.neighbors_cw_order(label)) == list(result.embedding.neighbors_cw_order(label))
+    assert stored.kuratowski is None and stored.planarization is None
+
+
+def test_non_planar_round_trip(store):
+    compact = CompactGraph.from_networkx(nx.petersen_graph())
+    result = check_planarity_and_euler(compact)
+    planarization = planarize(compact)
+    stored = store.open(store.save(compact, result=result, planarization=planarization))
+
+    assert not stored.is_planar and stored.embedding is None
+    assert stored.kuratowski.kind == result.kuratowski.kind
+    assert stored.kuratowski.edges == [tuple(edge) for edge in result.kuratowski.edges]
+    saved = stored.planarization
+    assert sorted(saved.removed_edges) == sorted(planarization.removed_edges)
+    assert sorted(saved.planar_edges) == sorted(planarization.planar_edges)
+    assert (saved.crossings, saved.maximal, saved.complete) == (
+        planarization.crossings, planarization.maximal, planarization.complete)
+    assert np.allclose(saved.layout.coords, [planarization.layout.coords[planarization.layout.index[label]]
+                                             for label in compact.labels])
+
+
+def test_analysis_is_computed_when_missing(store):
+    edges = [("a", "b"), ("b", "c"), ("c", "a"), ("c", "c")]
+    stored = store.open(store.save(edges))
+    assert (stored.is_planar, stored.V, stored.E, stored.F, stored.C) == (True, 3, 4, 3, 1)
+    assert stored.compact.loops.tolist() == [2]
+    assert stored.positions is not None
+
+
+def test_same_graph_same_id(store):
+    first = store.save([(1, 2), (2, 3)])
+    assert store.save([("3", "2"), (" 2 ", 1)]) == first
+    assert store.open(store.open(first).hash).id == first
+    assert [row["id"] for row in store.list()] == [first]
+
+
+def test_concurrent_saves(store):
+    edges = list(nx.grid_2d_graph(6, 6).edges())
+    with ThreadPoolExecutor(4) as pool:
+        ids = list(pool.map(lambda _: store.save(edges), range(8)))
+    assert len(set(ids)) == 1
+    assert store.open(ids[0]).compact.m == len(edges)
+
+
+def test_empty_and_isolated_graphs(store):
+    empty = store.open(store.save([]))
+    assert empty.compact.n == 0 and empty.is_planar
+    isolated = CompactGraph.from_labeled_edges([], nodes=["x", "y"])
+    stored = store.open(store.save(isolated))
+    assert stored.compact.labels == ["x", "y"] and stored.C == 2
+
+
+def test_unknown_id(store):
+    assert store.open("0" * 12) is None
+    assert store.open("f" * 32) is None
+
+
+def test_nul_label_is_rejected(store):
+    with pytest.raises(ValueError, match="NUL"):
+        store.save([("a\0b", "c")])
+    assert store.list() == []
+
+
+def test_lookup_list_and_memory_maps(store):
+    wheel = CompactGraph.from_networkx(nx.wheel_graph(6))
+    assert store.lookup(wheel) is None and store.list() == []
+    first = store.save(wheel, name="wheel")
+    second = store.save(CompactGraph.from_networkx(nx.petersen_graph()), name="petersen")
+    assert store.lookup(wheel) == first and store.lookup(wheel.content_hash()) == first
+    assert store.open(wheel.content_hash()).id == first
+    listed = store.list()
+    assert {entry["id"] for entry in listed} == {first, second}
+    assert {(entry["name"], entry["nodes"], entry["edges"]) for entry in listed} == {
+        ("wheel", 6, 10), ("petersen", 10, 15)}
+    assert len(store.list(limit=1)) == 1
+    assert isinstance(store.open(first).compact.edges, np.memmap)
+
+
+def test_cli_save_and_list(tmp_path, capsys):
+    from graph_store import main
+
+    path = tmp_path / "edges.csv"
+    path.write_text("source,target\na,b\nb,c\nc,a\n")
+    root = str(tmp_path / "graphs")
+    assert main(["--root", root, "save", str(path)]) == 0
+    graph_id = capsys.readouterr().out.strip()
+    stored = GraphStore(root).open(graph_id)
+    assert stored.name == "edges.csv" and stored.is_planar and stored.F == 2
+    assert main(["--root", root, "list"]) == 0
+    assert graph_id in capsys.readouterr().out
@@ -0,0 +1,85 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from incremental import IncrementalPlanarity
+
+
+def assert_matches(inc, nodes, edges):
+    graph = nx.Graph()
+    graph.add_nodes_from(nodes)
+    graph.add_edges_from(edges)
+    assert inc.is_planar == nx.check_planarity(graph)[0]
+    if inc.is_planar:
+        inc.embedding.check_structure()
+        assert inc.embedding.number_of_edges() == 2 * graph.number_of_edges()
+        assert inc.C == nx.number_connected_components(graph)
+        assert inc.V - inc.E + inc.F == 1 + inc.C
+
+
+@pytest.mark.parametrize("seed", range(15))
+def test_random_edits_match_networkx(seed):
+    rng = np.random.default_rng(seed)
+    nodes = [str(i) for i in range(12)]
+    edges = set()
+    inc = IncrementalPlanarity(nodes, edges)
+    for _ in range(60):
+        u, v = sorted(rng.choice(len(nodes), 2, replace=False).tolist())
+        edge = (nodes[u], nodes[v])
+        if edge in edges and rng.random() < 0.7:
+            edges.discard(edge)
+        else:
+            edges.add(edge)
+        inc.sync(nodes, edges)
+        assert_matches(inc, nodes, edges)
+
+
+def test_edge_between_components_stays_incremental():
+    nodes = [str(i) for i in range(8)]
+    edges = [("0", "1"), ("1", "2"), ("2", "0"), ("4", "5"), ("5", "6"), ("6", "4"), ("4", "0")]
+    inc = IncrementalPlanarity(nodes, edges)
+    # Removing the bridge splits the components; joining them again needs no full check
+    assert inc.sync(nodes, edges[:-1]) == "incremental"
+    assert inc.C == 4
+    assert inc.sync(nodes, edges[:-1] + [("2", "6")]) == "incremental"
+    assert inc.sync(nodes, edges[:-1] + [("2", "6"), ("7", "3")]) == "incremental"
+    assert_matches(inc, nodes, edges[:-1] + [("2", "6"), ("7", "3")])
+
+
+def test_non_planar_graph_becomes_planar_again():
+    nodes = [str(i) for i in range(5)]
+    k5 = [(u, v) for u in nodes for v in nodes if u < v]
+    inc = IncrementalPlanarity(nodes, k5)
+    assert not inc.is_planar
+    assert inc.sync(nodes, k5[1:]) == "full"
+    assert_matches(inc, nodes, k5[1:])
+    inc.sync(nodes, k5)
+    assert_matches(inc, nodes, k5)
+
+
+def test_large_edit_is_rechecked_in_full():
+    graph = nx.relabel_nodes(nx.grid_2d_graph(12, 12), lambda node: f"{node[0]}_{node[1]}")
+    nodes, edges = list(graph.nodes()), list(graph.edges())
+    inc = IncrementalPlanarity(nodes, edges[:10])
+    assert inc.sync(nodes, edges) == "full"
+    assert_matches(inc, nodes, edges)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_node_edits_match_networkx(seed):
+    rng = np.random.default_rng(seed)
+    nodes = [str(i) for i in range(10)]
+    edges = {(str(i), str(i + 1)) for i in range(9)}
+    inc = IncrementalPlanarity(nodes, edges)
+    for step in range(20):
+        if rng.random() < 0.5:
+            new = f"n{step}"
+            nodes.append(new)
+            edges.add((nodes[int(rng.integers(len(nodes) - 1))], new))
+        else:
+            gone = nodes.pop(int(rng.integers(len(nodes))))
+            edges = {edge for edge in edges if gone not in edge}
+        u, v = rng.choice(len(nodes), 2, replace=False).tolist()
+        edges.add((nodes[u], nodes[v]))
+        inc.sync(nodes, edges)
+        assert_matches(inc, nodes, edges)
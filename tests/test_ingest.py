@@ -0,0 +1,155 @@
+import csv
+import gzip
+import io
+import json
+
+import networkx as nx
+import pytest
+
+import graph_binary
+from compact import CompactGraph
+from ingest import _iter_json_array, detect_format, load_graph, open_edge_stream, parse_edge_line
+
+
+@pytest.fixture(params=range(5))
+def graph(request):
+    random = nx.gnm_random_graph(30, 60, seed=request.param)
+    # Edge lists cannot carry isolated nodes
+    random.remove_nodes_from(list(nx.isolates(random)))
+    return CompactGraph.from_networkx(nx.relabel_nodes(random, {i: f"n{i}" for i in random}))
+
+
+def pairs(compact):
+    return [(compact.labels[u], compact.labels[v]) for u, v in compact.edges.tolist()]
+
+
+def as_json(compact):
+    return json.dumps([list(edge) for edge in pairs(compact)]).encode()
+
+
+def as_json_objects(compact):
+    return json.dumps([{"source": u, "target": v} for u, v in pairs(compact)]).encode()
+
+
+def as_ndjson(compact):
+    return "".join(json.dumps(list(edge)) + "\n" for edge in pairs(compact)).encode()
+
+
+def as_csv(compact, delimiter=","):
+    text = io.StringIO()
+    writer = csv.writer(text, delimiter=delimiter)
+    writer.writerow(["source", "target"])
+    writer.writerows(pairs(compact))
+    return text.getvalue().encode()
+
+
+def as_tsv(compact):
+    return as_csv(compact, delimiter="\t")
+
+
+def as_dashes(compact):
+    return "".join(f"{u}-{v}\n" for u, v in pairs(compact)).encode()
+
+
+def as_spaces(compact):
+    return "".join(f"{u} {v}\n\n" for u, v in pairs(compact)).encode()
+
+
+def as_graphml(compact):
+    return "\n".join(nx.generate_graphml(compact.to_networkx())).encode()
+
+
+def as_pgb(compact):
+    return graph_binary.encode(compact)
+
+
+EDGE_LIST_WRITERS = [as_json, as_json_objects, as_ndjson, as_csv, as_tsv, as_dashes, as_spaces]
+
+
+@pytest.mark.parametrize("write", EDGE_LIST_WRITERS + [as_graphml, as_pgb])
+def test_round_trip(graph, write):
+    data = write(graph)
+    assert load_graph(data).content_hash() == graph.content_hash()
+    assert load_graph(io.BytesIO(data)).content_hash() == graph.content_hash()
+
+
+@pytest.mark.parametrize("write", EDGE_LIST_WRITERS)
+def test_gzip_round_trip(graph, write):
+    assert load_graph(gzip.compress(write(graph))).content_hash() == graph.content_hash()
+
+
+@pytest.mark.parametrize("write, fmt", [
+    (as_json, "json"), (as_json_objects, "json"), (as_ndjson, "ndjson"),
+    (as_csv, "csv"), (as_tsv, "csv"), (as_dashes, "lines"), (as_spaces, "lines"),
+])
+def test_detect_format(graph, write, fmt):
+    assert detect_format(open_edge_stream(write(graph))) == fmt
+    assert detect_format(open_edge_stream(gzip.compress(write(graph)))) == fmt
+
+
+@pytest.mark.parametrize("name, write", [
+    ("edges.json", as_json), ("edges.jsonl", as_ndjson), ("edges.csv.gz", as_csv),
+    ("edges.tsv", as_tsv), ("edges.txt", as_spaces), ("edges.graphml", as_graphml), ("edges.pgb", as_pgb),
+])
+def test_load_path(graph, tmp_path, name, write):
+    path = tmp_path / name
+    data = write(graph)
+    path.write_bytes(gzip.compress(data) if name.endswith(".gz") else data)
+    assert load_graph(path).content_hash() == graph.content_hash()
+    assert load_graph(str(path)).content_hash() == graph.content_hash()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 16])
+def test_json_array_across_chunks(graph, chunk_size):
+    text = json.dumps([{"source": u, "target": v} for u, v in pairs(graph)], indent=2)
+    assert list(_iter_json_array(io.StringIO(text), chunk_size)) == json.loads(text)
+
+
+def test_labels_are_normalized():
+    compact = load_graph(b"[[1, 2], [\" 2 \", \"3\"], [3, 1]]")
+    assert compact.labels == ["1", "2", "3"] and compact.m == 3
+
+
+def test_self_loops_and_duplicates():
+    compact = load_graph(b"a b\nb a\na a\n")
+    assert (compact.m, compact.number_of_edges(), compact.loops.tolist()) == (1, 2, [0])
+
+
+@pytest.mark.parametrize("line, edge", [
+    ("a-b", ("a", "b")),
+    (" a   b \n", ("a", "b")),
+    ("a", None),
+    ("a b c", None),
+    ("a-b-c", None),
+    ("[a, b]", None),
+    ('"a" "b"', None),
+    ("{a} b", None),
+])
+def test_parse_edge_line(line, edge):
+    assert parse_edge_line(line) == edge
+
+
+@pytest.mark.parametrize("data", [
+    b"[1, 2, 3]",
+    b"[[1, 2] [3, 4]]",
+    b"[[1, 2], [3, 4]] garbage",
+    b"[[1, 2]]\n[3]\n",
+    b"[[1, 2], [3, 4]",
+    b"[[1, 2],]",
+    b"[[[1], 2]]",
+    b"[{\"source\": {}, \"target\": 1}]",
+    b"[[1, 2]\n",
+    b"garbage ]]",
+    b"a-b\nc d e\n",
+    gzip.compress(b"[[1, 2] [3, 4]]"),
+    b"<graphml>broken",
+    b"PGBF\x01\x00garbage",
+], ids=lambda data: repr(data[:20]))
+def test_malformed_input_is_rejected(data):
+    with pytest.raises(ValueError):
+        load_graph(data)
+
+
+def test_ndjson_missing_endpoint_is_rejected():
+    with pytest.raises((ValueError, KeyError)):
+        load_graph(b'{"source": 1}\n')
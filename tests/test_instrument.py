@@ -0,0 +1,150 @@
+import json
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from instrument import (REGISTRY, JsonlExporter, Registry, annotate, call_traced, prometheus_text, span, timed,
+                        trace)
+from planarity import check_planarity_and_euler
+
+
+def counts(registry=REGISTRY):
+    return {name: stage["count"] for name, stage in registry.snapshot().items()}
+
+
+def parse_prometheus(text):
+    samples = {}
+    for line in text.splitlines():
+        if line.startswith("#"):
+            continue
+        name, value = line.rsplit(" ", 1)
+        samples[name] = float(value)
+    return samples
+
+
+def test_spans_nest_within_a_trace():
+    with trace("run", profile=False, memory=False) as t:
+        with span("outer", size=3):
+            with span("inner"):
+                pass
+            with span("inner"):
+                annotate(kind="second")
+        with span("after"):
+            pass
+    assert [(s.name, s.depth) for s in t.spans] == [("outer", 0), ("inner", 1), ("inner", 1), ("after", 0)]
+    assert t.spans[0].attrs == {"size": 3} and t.spans[2].attrs == {"kind": "second"}
+    stages = t.stages()
+    assert stages["inner"] == pytest.approx(t.spans[1].seconds + t.spans[2].seconds)
+    assert stages["outer"] >= stages["inner"] and t.seconds >= stages["outer"] + stages["after"]
+    entry = t.to_dict()
+    assert entry["name"] == "run" and [s["name"] for s in entry["spans"]] == ["outer", "inner", "inner", "after"]
+    assert all(s["offset"] >= 0 for s in entry["spans"]) and "profile" not in entry
+
+
+def test_spans_outside_a_trace_reach_the_registry():
+    before = counts()
+
+    @timed("test-stage")
+    def work(x):
+        return x + 1
+
+    assert work(1) == 2 and work.__name__ == "work"
+    with span("test-stage") as s:
+        annotate(ignored=True)  # no trace, nothing to attach to
+    assert s.seconds is not None and s.attrs == {}
+    assert counts()["test-stage"] == before.get("test-stage", 0) + 2
+
+
+def test_memory_peaks_per_span():
+    with trace("run", profile=False, memory=True) as t:
+        with span("outer"):
+            with span("big"):
+                block = bytearray(4 << 20)
+                del block
+            with span("small"):
+                block = bytearray(1 << 10)
+                del block
+    outer, big, small = t.spans
+    assert big.peak_bytes >= 4 << 20 > small.peak_bytes
+    assert outer.peak_bytes >= big.peak_bytes
+    assert t.to_dict()["spans"][1]["peak_bytes"] == big.peak_bytes
+
+
+def test_profile_is_captured():
+    def busy():
+        return sum(i * i for i in range(10000))
+
+    with trace("run", profile=True, memory=False) as t:
+        busy()
+    assert "busy" in t.profile and t.to_dict()["profile"] == t.profile
+
+
+def test_registry_histogram():
+    registry = Registry(buckets=(0.01, 0.1, 1.0))
+    for seconds in (0.005, 0.05, 0.5, 5.0):
+        registry.observe("stage", seconds)
+    registry.observe("stage", 0.001, peak_bytes=100)
+    registry.observe("stage", 0.001, peak_bytes=50)
+    stage = registry.snapshot()["stage"]
+    assert stage["buckets"] == [3, 4, 5] and stage["count"] == 6
+    assert stage["sum"] == pytest.approx(5.557) and stage["peak_bytes"] == 100
+    registry.reset()
+    assert registry.snapshot() == {}
+
+
+def test_prometheus_text():
+    registry = Registry(buckets=(0.01, 0.1))
+    registry.observe("load", 0.05)
+    registry.observe("load", 0.5)
+    registry.observe('odd "name"\n', 0.001, peak_bytes=10)
+    text = prometheus_text(registry, prefix="test")
+    samples = parse_prometheus(text)
+    assert samples['test_stage_seconds_bucket{stage="load",le="0.01"}'] == 0
+    assert samples['test_stage_seconds_bucket{stage="load",le="0.1"}'] == 1
+    assert samples['test_stage_seconds_bucket{stage="load",le="+Inf"}'] == 2
+    assert samples['test_stage_seconds_count{stage="load"}'] == 2
+    assert samples['test_stage_seconds_sum{stage="load"}'] == pytest.approx(0.55)
+    assert samples['test_stage_peak_bytes{stage="odd \\"name\\"\\n"}'] == 10
+    assert "# TYPE test_stage_seconds histogram" in text and text.endswith("\n")
+    assert "peak_bytes" not in prometheus_text(Registry())
+
+
+def test_call_traced_in_a_worker_process():
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        result, run = pool.submit(call_traced, check_planarity_and_euler, [(1, 2), (2, 3), (3, 1)],
+                                  use_cache=False).result(120)
+    assert result.is_planar and run["name"] == "check_planarity_and_euler"
+    assert "planarity" in [s["name"] for s in run["spans"]]
+    registry = Registry()
+    registry.observe_trace(json.loads(json.dumps(run)))
+    assert counts(registry)["planarity"] == 1
+
+
+def test_jsonl_exporter(tmp_path):
+    exporter = JsonlExporter(tmp_path / "traces.jsonl")
+    with trace("one", profile=False, memory=False) as t:
+        with span("stage"):
+            pass
+    exporter.export(t.to_dict(), id="g1")
+    exporter.export({"name": "two", "spans": []})
+    lines = [json.loads(line) for line in (tmp_path / "traces.jsonl").read_text().splitlines()]
+    assert [line["name"] for line in lines] == ["one", "two"]
+    assert lines[0]["id"] == "g1" and lines[0]["spans"][0]["name"] == "stage"
+
+
+def test_batch_metrics(tmp_path):
+    from batch import run_batch
+
+    tasks = [(str(i), json.dumps([[0, 1], [1, 2], [2, i + 3]])) for i in range(3)]
+    prom = tmp_path / "stages.prom"
+    run_batch(tasks, str(tmp_path / "results.jsonl"), workers=1, log=None, metrics=str(prom))
+    samples = parse_prometheus(prom.read_text())
+    assert samples['planar_stage_seconds_count{stage="load"}'] == 3
+    assert samples['planar_stage_seconds_count{stage="planarity"}'] == 3
+
+    traces = tmp_path / "traces.jsonl"
+    run_batch(tasks, str(tmp_path / "results2.jsonl"), workers=1, log=None, metrics=str(traces))
+    lines = [json.loads(line) for line in traces.read_text().splitlines()]
+    assert sorted(line["id"] for line in lines) == ["0", "1", "2"]
+    assert all(re.fullmatch(r"\w+", span["name"]) for line in lines for span in line["spans"])
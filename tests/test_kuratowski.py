@@ -0,0 +1,74 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from compact import CompactGraph
+from kuratowski import find_kuratowski_subgraph, minimal_nonplanar_edges
+
+
+def subdivided(graph, k=1):
+    result = nx.Graph()
+    for i, (u, v) in enumerate(graph.edges()):
+        nx.add_path(result, [u] + [f"s{i}_{j}" for j in range(k)] + [v])
+    return result
+
+
+def check_witness(graph, witness):
+    graph = nx.relabel_nodes(graph, str)
+    branch = set(witness.branch_vertices)
+    assert len(branch) == {"K5": 5, "K3,3": 6}[witness.kind]
+    assert len(witness.paths) == {"K5": 10, "K3,3": 9}[witness.kind]
+    subgraph = nx.Graph(witness.edges)
+    assert all(graph.has_edge(u, v) for u, v in subgraph.edges())
+    assert not nx.check_planarity(subgraph)[0]
+    degree = 4 if witness.kind == "K5" else 3
+    assert all(d == (degree if node in branch else 2) for node, d in subgraph.degree())
+
+    interiors = [node for path in witness.paths for node in path[1:-1]]
+    assert len(interiors) == len(set(interiors)) and not branch & set(interiors)
+    pairs = {frozenset((path[0], path[-1])) for path in witness.paths}
+    assert len(pairs) == len(witness.paths) and all(len(pair) == 2 and pair <= branch for pair in pairs)
+    if witness.kind == "K3,3":
+        left, right = map(set, witness.sides)
+        assert pairs == {frozenset((a, b)) for a in left for b in right}
+    for path in witness.paths:
+        assert all(subgraph.has_edge(u, v) for u, v in zip(path, path[1:]))
+
+
+@pytest.mark.parametrize("graph, kind", [
+    (nx.complete_graph(5), "K5"),
+    (nx.complete_bipartite_graph(3, 3), "K3,3"),
+    (subdivided(nx.complete_graph(5), 3), "K5"),
+    (subdivided(nx.complete_bipartite_graph(3, 3), 2), "K3,3"),
+    (nx.petersen_graph(), "K3,3"),
+], ids=["K5", "K3,3", "subdivided K5", "subdivided K3,3", "petersen"])
+def test_known_graphs(graph, kind):
+    witness = find_kuratowski_subgraph(graph)
+    assert witness.kind == kind
+    check_witness(graph, witness)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_non_planar_graphs(seed):
+    graph = nx.gnm_random_graph(30, 90, seed=seed)
+    # A planar lattice hanging off the non-planar part must not end up in the witness
+    lattice = nx.relabel_nodes(nx.triangular_lattice_graph(4, 4), lambda node: f"t{node}")
+    graph = nx.union(graph, lattice)
+    graph.add_edge(0, "t(0, 0)")
+    witness = find_kuratowski_subgraph(CompactGraph.from_networkx(graph))
+    check_witness(graph, witness)
+    assert not any(node.startswith("t") for node in nx.Graph(witness.edges))
+
+
+@pytest.mark.parametrize("graph", [nx.complete_graph(4), nx.triangular_lattice_graph(5, 5), nx.empty_graph(3)],
+                         ids=["K4", "lattice", "edgeless"])
+def test_planar_graph_has_no_witness(graph):
+    assert find_kuratowski_subgraph(graph) is None
+
+
+def test_minimal_nonplanar_edges_is_minimal():
+    edges = CompactGraph.from_networkx(nx.complete_graph(6)).edges
+    kept = minimal_nonplanar_edges(edges)
+    assert not nx.check_planarity(nx.Graph(kept.tolist()))[0]
+    for i in range(len(kept)):
+        assert nx.check_planarity(nx.Graph(np.delete(kept, i, axis=0).tolist()))[0]
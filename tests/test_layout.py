@@ -0,0 +1,128 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from compact import CompactGraph
+from layout import (LAYOUT_METHODS, PLANAR_MAX_NODES, SPRING_MAX_NODES, LayoutCache, choose_method, compute_layout,
+                    refine_layout)
+from planarity import check_planarity_and_euler
+from planarize import count_crossings
+
+
+@pytest.fixture
+def lattice():
+    return CompactGraph.from_networkx(nx.triangular_lattice_graph(8, 8))
+
+
+def test_choose_method_by_size():
+    assert choose_method(10) == "spring"
+    assert choose_method(SPRING_MAX_NODES + 1) == "multilevel"
+    assert choose_method(10, embedding=object()) == "planar"
+    assert choose_method(PLANAR_MAX_NODES + 1, embedding=object()) == "multilevel"
+
+
+@pytest.mark.parametrize("method", [m for m in LAYOUT_METHODS if m not in ("auto", "planar")])
+def test_every_method_places_every_node(lattice, method):
+    layout = compute_layout(lattice, method=method)
+    assert layout.method == method
+    assert layout.coords.shape == (lattice.n, 2) and np.isfinite(layout.coords).all()
+    assert layout.nodes == lattice.labels
+    assert np.array_equal(compute_layout(lattice, method=method).coords, layout.coords)
+
+
+def test_planar_layout_is_crossing_free(lattice):
+    result = check_planarity_and_euler(lattice)
+    layout = compute_layout(lattice, embedding=result.embedding)
+    assert layout.method == "planar"
+    assert count_crossings(layout.coords, lattice.edges) == 0
+
+
+def test_planar_without_embedding_falls_back(lattice):
+    assert compute_layout(lattice, method="planar").method == "spectral"
+
+
+def test_networkx_graph_and_empty_graph():
+    layout = compute_layout(nx.path_graph(["a", "b", "c"]))
+    assert layout.nodes == ["a", "b", "c"] and set(layout.pos) == {"a", "b", "c"}
+    assert compute_layout(CompactGraph.from_labeled_edges([])).coords.shape == (0, 2)
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        compute_layout(nx.path_graph(3), method="circular")
+
+
+def grid(rows=12, cols=12):
+    return nx.relabel_nodes(nx.grid_2d_graph(rows, cols), lambda node: f"{node[0]}_{node[1]}")
+
+
+def positions(result):
+    return {node: result.coords[result.index[node]] for node in result.nodes}
+
+
+def far_from(graph, sources, hops):
+    near = set()
+    for source in sources:
+        near.update(nx.single_source_shortest_path_length(graph, source, cutoff=hops + 1))
+    return [node for node in graph if node not in near]
+
+
+def test_layout_cache_reuses_an_unchanged_layout():
+    cache = LayoutCache(method="spring")
+    first = positions(cache.layout(grid()))
+    assert cache.last_update == "full"
+    again = positions(cache.layout(grid()))
+    assert cache.last_update == "unchanged"
+    assert all(np.array_equal(first[node], again[node]) for node in first)
+
+
+@pytest.mark.parametrize("edit", ["add edge", "remove edge", "add node", "remove node"])
+def test_layout_cache_moves_only_the_edited_neighborhood(edit):
+    graph = grid()
+    cache = LayoutCache(method="spring")
+    before = positions(cache.layout(graph))
+    edited = graph.copy()
+    if edit == "add edge":
+        changed = ["5_5", "6_6"]
+        edited.add_edge(*changed)
+    elif edit == "remove edge":
+        changed = ["5_5", "5_6"]
+        edited.remove_edge(*changed)
+    elif edit == "add node":
+        changed = ["5_5"]
+        edited.add_edge("5_5", "new")
+    else:
+        changed = list(graph["5_5"])
+        edited.remove_node("5_5")
+
+    result = cache.layout(edited)
+    assert cache.last_update == "incremental"
+    after = positions(result)
+    assert set(after) == set(edited.nodes())
+    assert np.isfinite(result.coords).all()
+    untouched = far_from(edited, changed, cache.hops)
+    assert untouched and all(np.array_equal(before[node], after[node]) for node in untouched)
+    if edit == "add node":
+        # Placed next to its neighbor, not somewhere across the drawing
+        step = np.median([np.linalg.norm(before[u] - before[v]) for u, v in graph.edges()])
+        assert np.linalg.norm(after["new"] - after["5_5"]) < 3 * step
+
+
+def test_layout_cache_falls_back_to_a_full_layout():
+    cache = LayoutCache(method="spring")
+    cache.layout(grid())
+    cache.layout(nx.relabel_nodes(grid(), lambda node: f"other {node}"))
+    assert cache.last_update == "full"
+    cache.layout(nx.path_graph(30))
+    cache.layout(nx.complete_graph(30))
+    assert cache.last_update == "full"
+
+
+def test_refine_layout_keeps_other_nodes_fixed():
+    coords = np.random.default_rng(0).random((50, 2))
+    edges = np.array([(i, i + 1) for i in range(49)])
+    refined = refine_layout(coords, edges, [10, 11])
+    fixed = np.setdiff1d(np.arange(50), [10, 11])
+    assert np.array_equal(refined[fixed], coords[fixed])
+    assert not np.array_equal(refined[[10, 11]], coords[[10, 11]])
+    assert np.array_equal(refine_layout(coords, edges, []), coords)
@@ -0,0 +1,72 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from compact import CompactGraph
+from metrics import face_metrics, rotation_arrays
+from planarity import check_planarity_and_euler
+
+
+def metrics_of(graph):
+    compact = CompactGraph.from_networkx(graph)
+    result = check_planarity_and_euler(compact, use_cache=False)
+    return compact, result, face_metrics(compact, result.embedding)
+
+
+def test_disconnected_graph():
+    graph = nx.disjoint_union(nx.cycle_graph(3), nx.complete_graph(4))
+    graph.add_node("isolated")
+    compact, result, metrics = metrics_of(graph)
+    assert (metrics.V, metrics.E, metrics.C, metrics.F) == (8, 9, 3, 5)
+    assert result.F == metrics.F
+    assert metrics.component_faces[compact.components[1][compact.index["0"]]] == 2
+    assert metrics.component_faces[compact.components[1][compact.index["3"]]] == 4
+    assert metrics.component_faces[compact.components[1][compact.index["isolated"]]] == 1
+    assert sorted(metrics.face_sizes.tolist()) == [3, 3, 3, 3, 3, 3]
+
+
+def test_trees_and_self_loops():
+    graph = nx.path_graph(4)
+    graph.add_edge(0, 0)
+    compact, result, metrics = metrics_of(graph)
+    # The path bounds one face on both sides; the loop adds a face of its own
+    assert metrics.F == result.F == 2
+    assert metrics.component_faces.tolist() == [2]
+    assert sorted(metrics.face_sizes.tolist()) == [1, 6]
+    assert metrics.size_distribution().tolist() == [0, 1, 0, 0, 0, 0, 1]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_faces_per_component_match_the_embedding(seed):
+    rng = np.random.default_rng(seed)
+    graph = nx.Graph()
+    for i in range(int(rng.integers(1, 5))):
+        part = nx.triangular_lattice_graph(int(rng.integers(1, 4)), int(rng.integers(1, 4)))
+        part = nx.relabel_nodes(part, lambda node: (i, node))
+        part.remove_edges_from(list(part.edges())[:int(rng.integers(0, 4))])
+        graph.update(part)
+    compact, result, metrics = metrics_of(graph)
+    C, component = compact.components
+    assert metrics.F == compact.m - compact.n + C + 1
+    assert metrics.face_sizes.sum() == 2 * compact.m
+
+    # Walking each component on its own gives its face count (isolated vertices have one face)
+    for c in range(C):
+        nodes = [compact.labels[i] for i in np.flatnonzero(component == c).tolist()]
+        sub = result.embedding.subgraph(nodes)
+        seen, faces = set(), 0
+        for u, v in sub.edges():
+            if (u, v) not in seen:
+                sub.traverse_face(u, v, mark_half_edges=seen)
+                faces += 1
+        assert metrics.component_faces[c] == max(faces, 1)
+        assert (metrics.face_component == c).sum() == faces
+
+
+def test_rotation_arrays():
+    compact, result, _ = metrics_of(nx.wheel_graph(5))
+    offsets, targets = rotation_arrays(compact, result.embedding)
+    assert offsets[-1] == 2 * compact.m
+    for u, label in enumerate(compact.labels):
+        rotation = [compact.labels[v] for v in targets[offsets[u]:offsets[u + 1]].tolist()]
+        assert rotation == list(result.embedding.neighbors_cw_order(label))
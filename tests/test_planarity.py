@@ -0,0 +1,181 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from compact import CompactGraph
+from planarity import (GraphResultCache, biconnected_blocks, cache_info, check_blocks, check_planarity_and_euler,
+                       clear_cache, graph_hash, is_planar_edges, planarity_kernel)
+from planarize import count_crossings
+
+SEEDS = range(60)
+
+
+def random_graph(seed):
+    """
+    A random graph around the planarity threshold, with subdivided edges and pendant
+    vertices mixed in so the kernel has chains and leaves to strip.
+    """
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(5, 40))
+    graph = nx.gnm_random_graph(n, int(rng.integers(n - 1, 3 * n // 2 + 4)), seed=seed)
+    for i, (u, v) in enumerate(list(graph.edges())[:int(rng.integers(0, 6))]):
+        graph.remove_edge(u, v)
+        nx.add_path(graph, [u, f"s{i}", v])
+    for i in range(int(rng.integers(0, 6))):
+        graph.add_edge(f"leaf{i}", int(rng.integers(n)))
+    return graph
+
+
+def subdivided(graph, k=1):
+    result = nx.Graph()
+    for i, (u, v) in enumerate(graph.edges()):
+        nx.add_path(result, [u] + [f"s{i}_{j}" for j in range(k)] + [v])
+    return result
+
+
+def check(graph, **options):
+    return check_planarity_and_euler(CompactGraph.from_networkx(graph), use_cache=False, **options)
+
+
+def test_graph_hash_ignores_order_direction_and_formatting():
+    assert graph_hash([(1, 2), (2, 3)]) == graph_hash([(" 3", "2"), ("2", 1)])
+    assert graph_hash([(1, 2), (2, 3)]) != graph_hash([(1, 2), (1, 3)])
+    assert graph_hash([(1, 2)]) != graph_hash([(1, 2), (2, 2)])
+
+
+def test_cache_keys_on_content():
+    clear_cache()
+    first = check_planarity_and_euler([(1, 2), (2, 3), (3, 1)])
+    assert check_planarity_and_euler([("3", "2"), (" 1 ", 3), (2, 1)]) is first
+    assert cache_info()["hits"] == 1 and cache_info()["misses"] == 1
+    assert check_planarity_and_euler([(1, 2), (2, 3), (3, 1)], use_cache=False) is not first
+
+
+def test_cache_evicts_least_recently_used():
+    cache = GraphResultCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+    assert cache.info() == {"hits": 3, "misses": 1, "size": 2, "maxsize": 2}
+
+
+@pytest.mark.parametrize("graph", [nx.complete_graph(4), nx.wheel_graph(8), nx.triangular_lattice_graph(4, 4),
+                                   nx.disjoint_union(nx.cycle_graph(3), nx.complete_graph(4))],
+                         ids=["K4", "wheel", "lattice", "two components"])
+def test_embedding_faces_and_positions(graph):
+    compact = CompactGraph.from_networkx(graph)
+    result = check_planarity_and_euler(compact, use_cache=False)
+    embedding = result.embedding
+    assert result.embedding is embedding
+    embedding.check_structure()
+    assert embedding.number_of_edges() == 2 * graph.number_of_edges()
+    # Every half-edge lies on exactly one face
+    assert sum(len(face) for face in result.faces) == 2 * graph.number_of_edges()
+    pos = result.positions
+    coords = np.array([pos[label] for label in compact.labels], dtype=float)
+    assert count_crossings(coords, compact.edges) == 0
+
+
+def test_non_planar_result_has_no_embedding():
+    result = check_planarity_and_euler(CompactGraph.from_networkx(nx.petersen_graph()), use_cache=False)
+    assert result.embedding is None and result.faces is None and result.positions is None
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_matches_networkx(seed):
+    graph = random_graph(seed)
+    result = check(graph)
+    assert result.is_planar == nx.check_planarity(graph)[0]
+    if result.is_planar:
+        C = nx.number_connected_components(graph)
+        assert (result.V, result.E, result.C) == (graph.number_of_nodes(), graph.number_of_edges(), C)
+        assert result.V - result.E + result.F == 1 + C
+        result.embedding.check_structure()
+        assert set(map(frozenset, result.embedding.edges())) == {frozenset(map(str, e)) for e in graph.edges()}
+    else:
+        assert result.V is None and result.F is None
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_kernel_preserves_planarity(seed):
+    graph = random_graph(seed)
+    compact = CompactGraph.from_networkx(graph)
+    kernel = planarity_kernel(compact)
+    assert kernel.m <= compact.m
+    if kernel.m:
+        assert kernel.degree().min() >= 3
+    assert nx.check_planarity(kernel.to_networkx())[0] == nx.check_planarity(graph)[0]
+    assert is_planar_edges(compact.edges) == nx.check_planarity(graph)[0]
+
+
+@pytest.mark.parametrize("graph, is_planar, tier", [
+    (nx.complete_graph(6), False, "edge-bound"),
+    (nx.complete_bipartite_graph(3, 3), False, "bipartite-bound"),
+    (nx.cycle_graph(8), True, "max-degree-2"),
+    (nx.balanced_tree(2, 4), True, "forest"),
+    (nx.lollipop_graph(3, 4), True, "reduced"),
+    (subdivided(nx.complete_graph(6)), False, "reduced-edge-bound"),
+    (nx.petersen_graph(), False, "full"),
+    (nx.complete_graph(4), True, "full"),
+    (subdivided(nx.complete_bipartite_graph(3, 3)), False, "reduced-full"),
+])
+def test_tiers(graph, is_planar, tier):
+    result = check(graph)
+    assert (result.is_planar, result.tier) == (is_planar, tier)
+    assert nx.check_planarity(graph)[0] == is_planar
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_blocks_match_networkx(seed):
+    graph = random_graph(seed)
+    result = check(graph, parallel=True)
+    assert result.is_planar == nx.check_planarity(graph)[0]
+    if result.is_planar and result.tier == "blocks":
+        result.embedding.check_structure()
+        assert result.embedding.number_of_edges() == 2 * graph.number_of_edges()
+
+
+def test_biconnected_blocks_partition_the_edges():
+    graph = nx.Graph([(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (4, 5), (5, 3), (5, 6)])
+    compact = CompactGraph.from_networkx(graph)
+    blocks = biconnected_blocks(compact)
+    assert sorted(len(block) for block in blocks) == [1, 1, 3, 3]
+    assert sum(len(block) for block in blocks) == compact.m
+
+
+def test_large_blocks_in_pool():
+    # Two blocks over INLINE_BLOCK_EDGES joined by a bridge go to the process pool
+    lattice = nx.triangular_lattice_graph(6, 6)
+    planar = nx.union(lattice, lattice, rename=("a", "b"))
+    planar.add_edge(f"a{(0, 0)}", f"b{(0, 0)}")
+    nonplanar = nx.union(lattice, subdivided(nx.petersen_graph(), 5), rename=("a", "p"))
+    nonplanar.add_edge(f"a{(0, 0)}", "p0")
+
+    result = check(planar, parallel=True, workers=2)
+    assert (result.is_planar, result.tier) == (True, "blocks")
+    result.embedding.check_structure()
+    assert check(nonplanar, parallel=True, workers=2).is_planar is False
+
+
+def test_check_blocks_embedding_covers_every_edge():
+    graph = nx.triangular_lattice_graph(4, 4)
+    is_planar, embedding = check_blocks(CompactGraph.from_networkx(graph))
+    assert is_planar
+    embedding.check_structure()
+    assert embedding.number_of_edges() == 2 * graph.number_of_edges()
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_kuratowski_witness(seed):
+    graph = random_graph(seed)
+    result = check(graph)
+    if result.is_planar:
+        assert result.kuratowski is None
+        return
+    witness = result.kuratowski
+    assert witness.kind in ("K5", "K3,3")
+    edges = {frozenset(map(str, e)) for e in graph.edges()}
+    assert {frozenset(e) for e in witness.edges} <= edges
+    assert not nx.check_planarity(nx.Graph(witness.edges))[0]
@@ -0,0 +1,86 @@
+import itertools
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from compact import CompactGraph
+from planarize import count_crossings, maximal_planar_subgraph, planarize
+
+
+def brute_force_crossings(coords, edges):
+    def orient(a, b, c):
+        return np.sign((b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0]))
+
+    total = 0
+    for (a, b), (c, d) in itertools.combinations(edges, 2):
+        if {a, b} & {c, d}:
+            continue
+        p, q, r, s = coords[a], coords[b], coords[c], coords[d]
+        total += orient(p, q, r) != orient(p, q, s) and orient(r, s, p) != orient(r, s, q)
+    return total
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_count_crossings_matches_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    coords = rng.random((30, 2))
+    edges = CompactGraph.from_networkx(nx.gnm_random_graph(30, 60, seed=seed)).edges
+    expected = brute_force_crossings(coords, edges.tolist())
+    assert count_crossings(coords, edges) == expected
+    subset = rng.choice(len(edges), 10, replace=False)
+    rest = np.setdiff1d(np.arange(len(edges)), subset)
+    inside = brute_force_crossings(coords, edges[rest].tolist())
+    assert count_crossings(coords, edges, subset=subset) == expected - inside
+
+
+@pytest.mark.parametrize("graph", [
+    nx.complete_graph(5),
+    nx.complete_graph(8),
+    nx.petersen_graph(),
+    nx.complete_bipartite_graph(4, 5),
+    nx.gnm_random_graph(40, 120, seed=1),
+], ids=["K5", "K8", "petersen", "K4,5", "gnm"])
+def test_planarize_keeps_a_maximal_planar_subgraph(graph):
+    compact = CompactGraph.from_networkx(graph)
+    result = planarize(compact)
+    kept = nx.Graph(result.planar_edges)
+    edges = {frozenset(map(str, e)) for e in graph.edges()}
+    assert {frozenset(e) for e in result.planar_edges} | {frozenset(e) for e in result.removed_edges} == edges
+    assert len(result.planar_edges) + len(result.removed_edges) == graph.number_of_edges()
+    assert nx.check_planarity(kept)[0]
+    assert result.removed_edges
+    if result.maximal:
+        for u, v in result.removed_edges:
+            kept.add_edge(u, v)
+            assert not nx.check_planarity(kept)[0]
+            kept.remove_edge(u, v)
+    coords = result.layout.coords[[result.layout.index[label] for label in compact.labels]]
+    assert result.crossings == count_crossings(coords, compact.edges)
+    if result.layout.method == "planar-subgraph":
+        kept_ids = [(compact.index[u], compact.index[v]) for u, v in result.planar_edges]
+        assert count_crossings(coords, kept_ids) == 0
+
+
+def test_planarize_planar_graph_removes_nothing():
+    result = planarize(CompactGraph.from_networkx(nx.triangular_lattice_graph(4, 4)))
+    assert result.removed_edges == [] and result.maximal
+
+
+def test_exhausted_budget_still_gives_a_planar_subgraph():
+    compact = CompactGraph.from_networkx(nx.gnm_random_graph(60, 400, seed=3))
+    kept, removed, maximal = maximal_planar_subgraph(compact, deadline=0.0)
+    assert len(kept) + len(removed) == compact.m and not maximal
+    assert nx.check_planarity(nx.Graph(kept.tolist()))[0]
+    result = planarize(compact, budget=0.0)
+    assert not result.complete
+    assert nx.check_planarity(nx.Graph(result.planar_edges))[0]
+    assert len(result.layout.nodes) == compact.n
+
+
+def test_to_dict():
+    result = planarize(CompactGraph.from_networkx(nx.complete_graph(5)))
+    payload = result.to_dict()
+    assert payload["removed"] == len(payload["removed_edges"]) == 1
+    assert len(payload["positions"]) == len(payload["nodes"]) == 5
+    assert result.edges == result.removed_edges and result.branch_vertices == []
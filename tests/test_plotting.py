@@ -0,0 +1,110 @@
+from types import SimpleNamespace
+
+import networkx as nx
+import numpy as np
+import plotly.graph_objects as go
+import pytest
+
+from compact import CompactGraph
+from layout import LayoutResult
+from plotting import (LABEL_MAX_NODES, LOD_NODE_THRESHOLD, aggregate_graph, decimate_edges, edge_coordinates,
+                      plot_interactive_graph, resolve_layout)
+
+
+def test_edge_coordinates():
+    coords = np.array([[0.0, 0.0], [1.0, 2.0], [3.0, 4.0]])
+    x, y = edge_coordinates(coords, np.array([[0, 1], [1, 2]]))
+    assert np.array_equal(x, [0, 1, np.nan, 1, 3, np.nan], equal_nan=True)
+    assert np.array_equal(y, [0, 2, np.nan, 2, 4, np.nan], equal_nan=True)
+
+
+def test_resolve_layout():
+    graph = nx.path_graph(["a", "b", "c"])
+    layout = resolve_layout(graph, {"a": (0, 0), "c": (2, 0)})
+    assert layout.nodes == ["a", "b", "c"] and layout.method == "given"
+    assert layout.coords[0].tolist() == [0, 0] and layout.coords[2].tolist() == [2, 0]
+    assert resolve_layout(graph, layout) is layout
+    assert isinstance(resolve_layout(graph), LayoutResult)
+
+
+def test_traces_follow_the_layout():
+    graph = CompactGraph.from_networkx(nx.cycle_graph(5))
+    layout = resolve_layout(graph)
+    fig = plot_interactive_graph(graph, pos=layout)
+    edges, nodes = fig.data
+    assert isinstance(nodes, go.Scatter)
+    assert np.allclose(nodes.x, layout.coords[:, 0]) and list(nodes.text) == graph.labels
+    assert np.isnan(np.asarray(edges.x, dtype=float)).sum() == graph.m
+
+
+def test_webgl_above_threshold():
+    graph = CompactGraph.from_networkx(nx.cycle_graph(5))
+    assert isinstance(plot_interactive_graph(graph, webgl_threshold=5).data[0], go.Scattergl)
+    assert isinstance(plot_interactive_graph(graph, webgl_threshold=10).data[0], go.Scatter)
+
+
+def random_layout(compact, seed=0):
+    coords = np.random.default_rng(seed).random((compact.n, 2))
+    return LayoutResult(compact.labels, coords, "given", 0.0, compact.index, compact.edges)
+
+
+def glyphs(fig):
+    # Line traces hold x0, x1, NaN per segment; the other traces one marker per point
+    return sum(len(trace.x) // 3 if trace.mode == "lines" else len(trace.x) for trace in fig.data)
+
+
+def test_aggregate_graph_keeps_counts():
+    compact = CompactGraph.from_networkx(nx.grid_2d_graph(40, 40))
+    layout = random_layout(compact)
+    centroids, sizes, super_edges, weights = aggregate_graph(layout.coords, compact.edges, 100)
+    assert len(centroids) == len(sizes) <= 100 and sizes.sum() == compact.n
+    assert (super_edges[:, 0] < super_edges[:, 1]).all() and super_edges.max() < len(sizes)
+    assert weights.sum() <= compact.m
+
+
+def test_decimate_edges_keeps_the_heaviest():
+    edges = np.arange(10).reshape(5, 2)
+    kept, weights = decimate_edges(edges, np.array([1, 5, 2, 4, 3]), 2)
+    assert kept.tolist() == [[2, 3], [6, 7]] and weights.tolist() == [5, 4]
+    assert len(decimate_edges(edges, None, 3)[0]) == 3
+    assert decimate_edges(edges, None, 10)[0] is edges
+
+
+@pytest.mark.parametrize("n, max_glyphs", [(60, 20000), (150, 20000), (60, 1000), (150, 500)])
+def test_glyph_cap(n, max_glyphs):
+    compact = CompactGraph.from_networkx(nx.grid_2d_graph(n, n))
+    fig = plot_interactive_graph(compact, random_layout(compact), max_glyphs=max_glyphs)
+    assert glyphs(fig) <= max_glyphs
+    if compact.n > LOD_NODE_THRESHOLD or compact.n > max_glyphs // 4:
+        assert "clusters" in fig.layout.title.text
+        sizes = [int(text.split()[0]) for text in fig.data[-1].hovertext]
+        assert sum(sizes) == compact.n
+
+
+def test_lod_switch():
+    compact = CompactGraph.from_networkx(nx.grid_2d_graph(60, 60))
+    layout = random_layout(compact)
+    assert "clusters" in plot_interactive_graph(compact, layout).layout.title.text
+    fig = plot_interactive_graph(compact, layout, lod=False)
+    assert "clusters" not in fig.layout.title.text and len(fig.data[-1].x) == compact.n
+
+
+def test_labels_only_on_small_graphs():
+    small = CompactGraph.from_networkx(nx.path_graph(LABEL_MAX_NODES))
+    large = CompactGraph.from_networkx(nx.path_graph(LABEL_MAX_NODES + 1))
+    assert plot_interactive_graph(small, random_layout(small)).data[-1].mode == "markers+text"
+    node_trace = plot_interactive_graph(large, random_layout(large)).data[-1]
+    assert node_trace.mode == "markers" and len(node_trace.hovertext) == large.n
+
+
+def test_highlight_shares_the_glyph_budget():
+    compact = CompactGraph.from_networkx(nx.grid_2d_graph(60, 60))
+    labels = compact.labels
+    highlight = SimpleNamespace(kind="K3,3", edges=[(labels[u], labels[v]) for u, v in compact.edges.tolist()],
+                                branch_vertices=labels[:6])
+    for max_glyphs in (20000, 2000):
+        fig = plot_interactive_graph(compact, random_layout(compact), max_glyphs=max_glyphs, highlight=highlight)
+        assert glyphs(fig) <= max_glyphs
+        marked, branch = fig.data[-2], fig.data[-1]
+        assert len(branch.x) >= 1
+        assert len(marked.x) // 3 <= max_glyphs // 2
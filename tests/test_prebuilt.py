@@ -0,0 +1,73 @@
+import json
+
+import numpy as np
+import pytest
+
+import prebuilt
+from prebuilt import ARRAYS, EXAMPLES, build, build_example, fingerprint, load_example, main
+
+
+@pytest.fixture
+def root(tmp_path):
+    build(tmp_path)
+    yield tmp_path
+    prebuilt._open_prebuilt.cache_clear()
+
+
+def same(loaded, built):
+    assert (loaded.is_planar, loaded.V, loaded.E, loaded.F, loaded.C, loaded.tier, loaded.nodes) == (
+        built.is_planar, built.V, built.E, built.F, built.C, built.tier, built.nodes)
+    for key in ARRAYS:
+        assert np.array_equal(getattr(loaded, key), getattr(built, key))
+
+
+def test_committed_artifacts_are_current():
+    # Fails when the examples or the analysis/plotting code changed without `python prebuilt.py`
+    assert main(["--check"]) == 0
+
+
+@pytest.mark.parametrize("name", list(EXAMPLES))
+def test_load_matches_build(root, name):
+    loaded = load_example(name, root)
+    built = build_example(name)
+    same(loaded, built)
+    assert isinstance(loaded.edges.base, np.memmap)
+    assert bytes(loaded.figure_json) == built.figure_json
+    assert len(loaded.figure().data) == len(built.figure().data)
+
+
+def test_metrics():
+    assert (load_example("K3").V, load_example("K3").E, load_example("K3").F) == (3, 3, 2)
+    assert not load_example("K5").is_planar and load_example("K5").F is None
+    assert len(load_example("C4").targets) == 2 * 4 and len(load_example("K3,3").targets) == 0
+
+
+def test_stale_artifacts_are_recomputed(root):
+    manifest = json.loads((root / "manifest.json").read_text())
+    manifest["fingerprint"] = "0" * 32
+    (root / "manifest.json").write_text(json.dumps(manifest))
+    prebuilt._open_prebuilt.cache_clear()
+    assert main(["--check", "--root", str(root)]) == 1
+    loaded = load_example("K5", root)
+    assert not isinstance(loaded.edges.base, np.memmap)
+    same(loaded, build_example("K5"))
+
+
+def test_missing_artifacts_are_recomputed(tmp_path):
+    assert main(["--check", "--root", str(tmp_path)]) == 1
+    same(load_example("C4", tmp_path), build_example("C4"))
+    prebuilt._open_prebuilt.cache_clear()
+
+
+def test_fingerprint_covers_the_examples(monkeypatch):
+    before = fingerprint()
+    monkeypatch.setitem(EXAMPLES, "P2", [("A", "B")])
+    assert fingerprint() != before
+    monkeypatch.undo()
+    monkeypatch.setattr(prebuilt, "FORMAT_VERSION", prebuilt.FORMAT_VERSION + 1)
+    assert not prebuilt.is_current(prebuilt.read_manifest())
+
+
+def test_unknown_example():
+    with pytest.raises(ValueError):
+        load_example("K7")
@@ -0,0 +1,81 @@
+import networkx as nx
+import pytest
+
+from compact import CompactGraph
+from render import RenderCache, RenderService, draw_graph, render_key, render_params
+
+pytest.importorskip("matplotlib")
+
+MAGIC = {"png": b"\x89PNG", "svg": b"<?xml"}
+
+
+@pytest.fixture
+def service(tmp_path):
+    service = RenderService(RenderCache(tmp_path), workers=1)
+    yield service
+    service.shutdown()
+
+
+def wheel():
+    return CompactGraph.from_networkx(nx.wheel_graph(7))
+
+
+def test_render_params():
+    assert render_params() == {"layout": "auto", "seed": 42, "width": 8.0, "height": 6.0, "dpi": 100,
+                               "labels": True}
+    params = render_params(width="4", dpi="72", labels=0, seed=None)
+    assert (params["width"], params["dpi"], params["labels"], params["seed"]) == (4.0, 72, False, 42)
+    with pytest.raises(ValueError):
+        render_params(colour="red")
+    with pytest.raises(ValueError):
+        render_params(width=100)
+
+
+def test_render_key():
+    params = render_params()
+    key = render_key("a" * 32, "png", params)
+    assert key.startswith("a" * 32) and key.endswith(".png")
+    assert render_key("a" * 32, "png", dict(reversed(params.items()))) == key
+    assert render_key("a" * 32, "svg", params) != key
+    assert render_key("a" * 32, "png", render_params(dpi=72)) != key
+    with pytest.raises(ValueError):
+        render_key("a" * 32, "gif", params)
+
+
+@pytest.mark.parametrize("fmt", ["png", "svg"])
+@pytest.mark.parametrize("graph", [nx.wheel_graph(7), nx.petersen_graph(), nx.empty_graph(0)],
+                         ids=["planar", "non-planar", "empty"])
+def test_draw_graph(graph, fmt):
+    assert draw_graph(CompactGraph.from_networkx(graph), fmt).startswith(MAGIC[fmt])
+
+
+def test_cache_is_bounded_by_bytes_and_backed_by_disk(tmp_path):
+    cache = RenderCache(tmp_path, memory_budget=10)
+    cache.put("a", b"1234")
+    cache.put("b", b"5678")
+    cache.put("c", b"9012")
+    assert list(cache._memory) == ["b", "c"] and cache._size == 8
+    # Evicted from memory, still on disk
+    assert cache.get("a") == b"1234" and list(cache._memory) == ["c", "a"]
+    cache.put("big", b"x" * 11)
+    assert "big" not in cache._memory and cache.get("big") == b"x" * 11
+    assert RenderCache(tmp_path).get("b") == b"5678"
+    assert cache.get("missing") is None and cache.misses == 1
+
+
+def test_service_shares_in_flight_renders_and_caches_them(service):
+    compact = wheel()
+    first = service.submit(compact, "svg")
+    assert service.submit(compact, "svg") is first
+    key, data = first.result(120)
+    assert data.startswith(MAGIC["svg"]) and not service._inflight
+
+    again = service.submit(compact, "svg")
+    assert again.done() and again.result() == (key, data)
+    assert service.render(compact, "svg", dpi=72)[0] != key
+
+
+def test_render_errors_reach_the_caller(service):
+    with pytest.raises(ValueError):
+        service.render(wheel(), "png", layout="no-such-layout", timeout=120)
+    assert not service._inflight
@@ -0,0 +1,58 @@
+import json
+from concurrent.futures import Future
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+pytest.importorskip("flask")
+
+import render
+import tempCodeRunnerFile
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    service = render.RenderService(render.RenderCache(tmp_path), workers=1)
+    monkeypatch.setattr(render, "_render_service", service)
+    yield tempCodeRunnerFile.app.test_client()
+    service.shutdown()
+
+
+def submit(client, edges):
+    response = client.post("/", data={"edges": json.dumps(edges)})
+    assert response.status_code == 302
+    return json.loads(parse_qs(urlparse(response.location).query)["result"][0])
+
+
+def test_faces_of_a_disconnected_graph(client):
+    result = submit(client, [[1, 2], [2, 3], [3, 1], [4, 5], [5, 6], [6, 4]])
+    assert (result["vertices"], result["edges"], result["faces"]) == (6, 6, 3)
+
+
+def test_non_planar_and_invalid_input(client):
+    k5 = [[u, v] for u in range(5) for v in range(u + 1, 5)]
+    assert submit(client, k5) == {"is_planar": False}
+    assert "error" in submit(client, [[1, 2, 3, 4]])
+
+
+def test_image_is_served_on_first_view(client):
+    result = submit(client, [[1, 2], [2, 3], [3, 1]])
+    response = client.get(result["graph_url"])
+    assert response.status_code == 200 and response.mimetype == "image/png"
+    assert response.data.startswith(b"\x89PNG")
+
+
+def test_slow_render_answers_202(client, monkeypatch):
+    url = submit(client, [[1, 2], [2, 3], [3, 1]])["graph_url"]
+    monkeypatch.setattr(tempCodeRunnerFile, "RENDER_WAIT", 0.01)
+    monkeypatch.setattr(tempCodeRunnerFile, "get_render_service",
+                        lambda: SimpleNamespace(submit=lambda compact, fmt: Future()))
+    response = client.get(url)
+    assert response.status_code == 202 and response.headers["Location"] == url
+
+
+def test_unknown_image_is_404(client):
+    assert client.get("/graph/" + "0" * 32 + ".png").status_code == 404
+    url = submit(client, [[1, 2], [2, 3], [3, 1]])["graph_url"]
+    assert client.get(url.replace(".png", ".gif")).status_code == 404
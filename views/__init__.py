@@ -0,0 +1,83 @@
+"""
+The pages of the Streamlit app, one module each.
+
+``dmgt.py`` only draws the header and the navigation and then calls ``render``,
+which imports the selected page's module on its first visit. A page's
+dependencies (NetworkX, Plotly, the planarity code, Lottie) are therefore
+loaded when that page is first shown, not on every app start, and the other
+pages' code is not even evaluated on a rerun.
+
+Every run is traced (see ``instrument``) and timed against ``STARTUP_BUDGET``
+(the first run of a page in the process, which pays for its imports) or
+``RERUN_BUDGET``; the timings are kept in ``st.session_state["run_times"]``, and
+``python bench.py --app`` measures them from a fresh process and fails over
+budget. In developer mode (``PLANAR_DEV=1`` in the server's environment) the
+sidebar shows the stages of the last run, with optional cProfile and
+tracemalloc capture (``views.dev``).
+"""
+import importlib
+import json
+import os
+import sys
+
+import streamlit as st
+from streamlit.components.v1 import html
+
+from assets import load_script, load_static
+from instrument import trace
+
+# Page title shown in the navigation -> module in this package
+PAGES = {
+    "🏠 Home": "home",
+    "📐 Edit Graph": "edit_graph",
+    "📊 Live Graph": "live_graph",
+    "📚 Learn": "learn",
+    "📬 Contact": "contact",
+}
+
+# Seconds a page may take to render without user input: on its first visit in the
+# process, and on every rerun after that
+STARTUP_BUDGET = 1.5
+RERUN_BUDGET = 0.1
+
+
+def dev_mode():
+    # Server-side only: the panel exposes profiles and memory snapshots, so visitors cannot turn it on
+    return os.environ.get("PLANAR_DEV", "").lower() in ("1", "true", "yes")
+
+
+def render(page):
+    """
+    Function to render ``page``, importing its module on first use; returns the seconds it took.
+    """
+    name = f"{__name__}.{PAGES[page]}"
+    first = name not in sys.modules
+    dev = dev_mode()
+    capture = {}
+    if dev:
+        from views import dev as dev_panel
+
+        capture = dev_panel.controls()
+    with trace(page, **capture) as run:
+        importlib.import_module(name).render()
+    budget = STARTUP_BUDGET if first else RERUN_BUDGET
+    st.session_state.setdefault("run_times", {})[page] = {
+        "seconds": run.seconds, "budget": budget, "over_budget": run.seconds > budget}
+    if dev:
+        dev_panel.show(run, budget)
+    return run.seconds
+
+
+def show_lottie(animation, height, key):
+    """
+    Function to play a Lottie animation with lottie-web in a plain HTML component.
+
+    Not ``streamlit_lottie``: for every custom component call Streamlit imports
+    pandas and pyarrow to inspect its arguments, which cost the first run of a
+    page about 0.25 s. lottie-web itself is inlined from ``assets/static``, so
+    the animation plays without network access.
+    """
+    # "</" would end the inline script early
+    data = json.dumps(animation, separators=(",", ":")).replace("</", "<\\/")
+    player = load_script("lottie.min.js")
+    html(load_static("lottie.html").format(key=key, height=height, data=data, player=player), height=height)
@@ -0,0 +1,88 @@
+import streamlit as st
+
+from assets import load_lottie_url
+from views import show_lottie
+
+
+def render():
+    st.markdown("""
+    <div class='card'>
+        <h2>📬 Contact Us</h2>
+        <p>Have questions, feedback, or suggestions? We'd love to hear from you!</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    contact_col1, contact_col2 = st.columns([3, 2])
+
+    with contact_col1:
+        st.markdown("<h3>Send us a message</h3>", unsafe_allow_html=True)
+
+        with st.form("contact_form"):
+            name = st.text_input("Name")
+            email = st.text_input("Email")
+            subject = st.selectbox("Subject",
+                                   ["General Inquiry", "Bug Report", "Feature Request", "Collaboration", "Other"])
+            message = st.text_area("Message", height=150)
+            submitted = st.form_submit_button("Send Message", use_container_width=True)
+
+            if submitted:
+                st.success("Thank you for your message! We'll get back to you soon.")
+                # Here you would typically add code to send the message via email or save to a database
+
+    with contact_col2:
+        st.markdown("""
+        <div style='background-color:#AFDDFF; padding:1.5rem; border-radius:0.5rem;'>
+            <h4>Get in Touch</h4>
+            <p>Reach out with questions, feedback, or collaboration:</p>
+
+
+        <p>📧 <b>Email:</b><a href="#"> support@planargraph.com</a></p>
+        <p>🧠 <b>GitHub:</b> <a href="https://github.com/your-repo" target="_blank">Graph Master</a></p>
+        <p>🐦 <b>Twitter:</b> <a href="https://twitter.com/PlanarGraph" target="_blank">@PlanarGraph</a></p>
+
+        </div>
+        """, unsafe_allow_html=True)
+
+        # Add a lottie animation for the contact page
+        lottie_url = "https://assets9.lottiefiles.com/packages/lf20_in4cufsz.json"  # Message/contact animation
+        lottie_json = load_lottie_url(lottie_url)
+        if lottie_json:
+            show_lottie(lottie_json, height=200, key="contact_animation")
+
+    st.markdown("<hr style='margin: 2rem 0;'>", unsafe_allow_html=True)
+
+    st.markdown("""
+    <h3>Frequently Asked Questions</h3>
+    """, unsafe_allow_html=True)
+
+    with st.expander("What is a planar graph?"):
+        st.markdown("""
+        A planar graph is a graph that can be drawn on a plane without any edges crossing. 
+        In other words, it can be drawn so that no edges intersect except at their endpoints (vertices).
+        """)
+
+    with st.expander("How can I determine if my graph is planar?"):
+        st.markdown("""
+        You can use our tool to check if your graph is planar! Simply input your graph's edges in the 
+        format shown in the examples, and our algorithm will determine if it's planar. 
+
+        Alternatively, you can use Kuratowski's theorem, which states that a graph is planar if and only if 
+        it doesn't contain a subdivision of K₅ or K₃,₃.
+        """)
+
+    with st.expander("Can I export my graph visualization?"):
+        st.markdown("""
+        Yes! After creating your graph in the "Edit Graph" section, you'll see options to export your graph 
+        as JSON or copy the data to your clipboard. You can also take a screenshot of the visualization.
+        """)
+
+    with st.expander("Are there any limitations to the tool?"):
+        st.markdown("""
+        The current version has some limitations:
+
+        - Very large graphs (hundreds of nodes) may have slower performance
+        - The automatic layout algorithm may not always produce the most visually pleasing arrangement
+        - Custom styling options are limited in the current version
+
+        We're continuously improving the tool and welcome your feedback!
+        """)
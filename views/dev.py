@@ -0,0 +1,43 @@
+import streamlit as st
+
+from instrument import REGISTRY, prometheus_text
+
+
+def controls():
+    """
+    Sidebar switches for this run's profiling; returns the ``trace`` capture options.
+    """
+    st.sidebar.markdown("### ⏱ Developer")
+    return {
+        "profile": st.sidebar.checkbox("cProfile this run", key="dev_profile"),
+        "memory": st.sidebar.checkbox("Trace memory (tracemalloc)", key="dev_memory"),
+    }
+
+
+def show(run, budget):
+    """
+    Sidebar table of the stages of ``run``, the finished page ``Trace``.
+    """
+    status = "over budget" if run.seconds > budget else "within budget"
+    st.sidebar.caption(f"{run.name}: {run.seconds * 1000:.1f} ms ({status}, budget {budget * 1000:.0f} ms)")
+    rows = []
+    for span in run.spans:
+        row = {
+            "stage": "· " * span.depth + span.name,
+            "start ms": round((span.start - run.start) * 1000, 1),
+            "ms": round(span.seconds * 1000, 2),
+        }
+        if span.peak_bytes is not None:
+            row["peak MB"] = round(span.peak_bytes / 2 ** 20, 2)
+        if span.attrs:
+            row["details"] = ", ".join(f"{k}={v}" for k, v in span.attrs.items())
+        rows.append(row)
+    if rows:
+        st.sidebar.dataframe(rows, hide_index=True, use_container_width=True)
+    else:
+        st.sidebar.caption("No instrumented stage ran.")
+    if run.profile:
+        with st.sidebar.expander("cProfile (cumulative)"):
+            st.code(run.profile, language="text")
+    with st.sidebar.expander("All stages since start (Prometheus)"):
+        st.code(prometheus_text(REGISTRY), language="text")
@@ -0,0 +1,214 @@
+import json
+
+import streamlit as st
+
+from assets import load_lottie_url
+from instrument import span
+from views import show_lottie
+from views.shared import open_shared, save_and_share, shared_id, show_share_link
+
+# Shared or imported graphs with more edges than this are not loaded into the text editor
+EDIT_MAX_EDGES = 500
+
+DEFAULT_GRAPH = ("A,B,C,D", "A-B\nB-C\nC-D\nD-A")
+
+
+def _editor_text(compact):
+    # Form contents for a loaded graph: node list and one A-B line per edge
+    labels = compact.labels
+    edges = [f"{labels[u]}-{labels[v]}" for u, v in compact.edges.tolist()]
+    edges += [f"{labels[u]}-{labels[u]}" for u in compact.loops.tolist()]
+    return ",".join(labels), "\n".join(edges)
+
+
+def _read_import(upload):
+    from graph_binary import BinaryGraph, is_binary_graph, read
+    from ingest import load_graph
+
+    data = upload.getvalue()
+    if is_binary_graph(data):
+        return read(data)
+    return BinaryGraph(load_graph(data, name=upload.name))
+
+
+def _load_into_editor(key, load):
+    """
+    Prefill the editor with a shared or imported graph, drawn with its saved layout; returns whether it changed.
+
+    ``load`` returns the graph (anything with ``compact`` and ``positions``) and
+    runs only the first time ``key`` is seen.
+    """
+    if st.session_state.get("edit_loaded") == key:
+        return False
+    st.session_state["edit_loaded"] = key
+    try:
+        graph = load()
+    except ValueError as e:
+        st.error(f"Could not load the graph: {e}")
+        return False
+    if graph is None:
+        st.error(f"No saved graph with the ID '{key}'.")
+        return False
+    if graph.compact.number_of_edges() > EDIT_MAX_EDGES:
+        st.info(f"This graph has more than {EDIT_MAX_EDGES} edges, too many to edit here; check it on the Home page.")
+        return False
+
+    from layout import LayoutCache
+
+    st.session_state["edit_defaults"] = _editor_text(graph.compact)
+    st.session_state["edit_shown"] = True
+    layout_cache = st.session_state["edit_layout"] = LayoutCache()
+    layout_cache.result = graph.positions
+    return True
+
+
+def render():
+    # A shared link (?graph=<id>) opens the saved graph in the editor
+    shared = shared_id()
+    if shared:
+        _load_into_editor(shared, lambda: open_shared(shared))
+    default_nodes, default_edges = st.session_state.get("edit_defaults", DEFAULT_GRAPH)
+
+    st.markdown("""
+    <div class='card'>
+        <h2>✏ Node & Edge Editor</h2>
+        <p>Create your own graph by defining nodes and edges below.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        with st.form("graph_editor"):
+            st.markdown("<h4>Define Your Graph</h4>", unsafe_allow_html=True)
+            node_names = st.text_input("Nodes (comma separated)", value=default_nodes)
+            edge_pairs = st.text_area("Edges (each as A-B)", value=default_edges, height=150)
+            submitted = st.form_submit_button("Render Graph", use_container_width=True)
+
+        imported = st.file_uploader("Or import a graph (.pgb, GraphML, JSON or an edge list)",
+                                    type=["pgb", "graphml", "json", "ndjson", "jsonl", "csv", "tsv", "txt", "edges",
+                                          "gz"], key="edit_import")
+        if imported is not None and _load_into_editor(imported.file_id, lambda: _read_import(imported)):
+            # The form above was drawn with the previous contents
+            st.rerun()
+
+    with col2:
+        st.markdown("""
+        <div class='card'>
+            <h4>Tips for Creating Graphs</h4>
+            <ul>
+                <li>Use simple labels for nodes (A, B, 1, 2, etc.)</li>
+                <li>Each edge should connect two existing nodes</li>
+                <li>For a planar graph, avoid creating too many crossing edges</li>
+                <li>Try creating classic structures like cycles, trees, or grids</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # Add a small lottie animation
+        lottie_url = "https://assets3.lottiefiles.com/packages/lf20_ystsffqy.json"  # Edit animation
+        lottie_json = load_lottie_url(lottie_url)
+        if lottie_json:
+            show_lottie(lottie_json, height=180, key="edit_animation")
+
+    # The graph stays on screen across reruns (e.g. after an export or share click) once it was rendered
+    if submitted:
+        st.session_state["edit_shown"] = True
+    if st.session_state.get("edit_shown"):
+        # NetworkX and Plotly are only loaded once there is a graph to draw
+        from graph_binary import encode
+        from incremental import IncrementalPlanarity
+        from kuratowski import find_kuratowski_subgraph
+        from layout import LayoutCache
+        from plotting import plot_interactive_graph
+
+        try:
+            with span("parse"):
+                nodes = [n.strip() for n in node_names.split(",") if n.strip()]
+                edges = [(e.split("-")[0].strip(), e.split("-")[1].strip()) for e in edge_pairs.strip().split("\n")
+                         if "-" in e]
+
+            # Planarity is kept across submits and updated with just the edited edges
+            with span("incremental"):
+                editor = st.session_state.get("edit_planarity")
+                if editor is None:
+                    editor = st.session_state["edit_planarity"] = IncrementalPlanarity(nodes, edges)
+                else:
+                    editor.sync(nodes, edges)
+                G = editor.to_compact()
+
+            st.markdown("<hr style='margin: 2rem 0;'>", unsafe_allow_html=True)
+
+            st.markdown("""
+            <div class='card'>
+                <h3>Your Graph Visualization</h3>
+            </div>
+            """, unsafe_allow_html=True)
+
+            # Previous positions are kept; only the neighborhood of the edit is re-laid out
+            layout_cache = st.session_state.setdefault("edit_layout", LayoutCache())
+            with span("relayout"):
+                layout = layout_cache.layout(G, embedding=editor.embedding)
+            witness = None if editor.is_planar else find_kuratowski_subgraph(G)
+            figure = plot_interactive_graph(G, layout, highlight=witness)
+            with span("chart"):
+                st.plotly_chart(figure, use_container_width=True)
+
+            if editor.is_planar:
+                st.markdown(f"""
+                <div style='background-color:#e6f7e6; border-left:4px solid #28a745; padding:1rem; border-radius:0.5rem;'>
+                    <h4 style='color:#28a745; margin:0;'>✅ This is a planar graph!</h4>
+                    <p style='margin-top:0.5rem;'>Vertices: {editor.V} | Edges: {editor.E} | Faces: {editor.F}</p>
+                </div>
+                """, unsafe_allow_html=True)
+            else:
+                st.markdown("""
+                <div style='background-color:#fff4e6; border-left:4px solid #fd7e14; padding:1rem; border-radius:0.5rem;'>
+                    <h4 style='color:#fd7e14; margin:0;'>❌ This graph is NOT planar.</h4>
+                </div>
+                """, unsafe_allow_html=True)
+                if witness is not None:
+                    st.caption(f"The red edges form a subdivision of {witness.kind}.")
+
+            # Add export options
+            st.markdown("<div style='height:1rem;'></div>", unsafe_allow_html=True)
+            export_col1, export_col2, export_col3 = st.columns(3)
+
+            with export_col1:
+                edge_list_json = json.dumps([{"source": e[0], "target": e[1]} for e in edges])
+                st.download_button(
+                    label="📥 Export as JSON",
+                    data=edge_list_json,
+                    file_name="graph_data.json",
+                    mime="application/json",
+                )
+
+            with export_col2:
+                st.download_button(
+                    label="📦 Export as binary (.pgb)",
+                    data=encode(G, layout=layout, rotation=editor.embedding if editor.is_planar else None,
+                                compression="gzip"),
+                    file_name="graph_data.pgb",
+                    mime="application/octet-stream",
+                )
+
+            with export_col3:
+                st.button("🔗 Save & Share", key="share_btn", on_click=save_and_share, args=(G,),
+                          kwargs={"layout": layout}, use_container_width=True)
+
+            graph_id = shared_id()
+            if graph_id and G.content_hash().startswith(graph_id):
+                show_share_link(graph_id)
+
+        except Exception as e:
+            st.error(f"Error: {e}")
+            st.markdown("""
+            <div style='background-color:#f8d7da; padding:1rem; border-radius:0.5rem;'>
+                <p>Please check your input format:</p>
+                <ul>
+                    <li>Nodes should be comma-separated (e.g., A,B,C,D)</li>
+                    <li>Edges should be in the format A-B, one per line</li>
+                    <li>Make sure all edge endpoints exist in your node list</li>
+                </ul>
+            </div>
+            """, unsafe_allow_html=True)
@@ -0,0 +1,15 @@
+import streamlit as st
+
+from prebuilt import load_example
+
+
+@st.cache_resource(show_spinner=False)
+def example(name):
+    """
+    Function to get the precomputed ``ExampleArtifact`` of the example ``name`` and its Plotly figure.
+
+    The artifact is memory-mapped from ``assets/prebuilt`` (see ``prebuilt``) and
+    the figure rebuilt from its stored JSON once per process, shared by all sessions.
+    """
+    artifact = load_example(name)
+    return artifact, artifact.figure()
@@ -0,0 +1,228 @@
+import io
+
+import streamlit as st
+
+from assets import load_lottie_url
+from compact import CompactGraph
+from generators import GENERATORS, estimate_edges, generate
+from ingest import load_edges, load_graph
+from instrument import span
+from views import show_lottie
+from views.shared import open_shared, save_and_share, shared_id, show_share_link
+
+# Largest synthetic graphs (estimated edges) the page checks and draws within a few
+# seconds; non-planar families also get a Kuratowski subgraph and planarize()
+GENERATOR_MAX_EDGES = 30_000
+NONPLANAR_MAX_EDGES = 5_000
+NONPLANAR_FAMILIES = ("crossings", "complete", "gnp")
+
+
+def generator_limit(family):
+    """
+    Function to find the largest node count the generator panel accepts for ``family``.
+    """
+    max_edges = NONPLANAR_MAX_EDGES if family in NONPLANAR_FAMILIES else GENERATOR_MAX_EDGES
+    lo, hi = 3, max_edges + 1
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if estimate_edges(family, mid) <= max_edges:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def render():
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.markdown("""
+        <div class='card'>
+            <h2>🔍 What is a Planar Graph?</h2>
+            <p style='font-size:1.1rem; line-height:1.6;'>
+                A planar graph can be drawn on a 2D surface without any edge crossings. 
+                This property is fundamental in various fields including circuit design, 
+                map coloring, and network visualization.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown("""
+        <div class='card'>
+            <h3>✏ Try It Yourself</h3>
+            <p>Paste your graph below in JSON format to check if it's planar!</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        graph_input = st.text_area("Graph edges",
+                                   placeholder='[{"source": "A", "target": "B"}, {"source": "B", "target": "C"}, {"source": "C", "target": "A"}]',
+                                   height=150, label_visibility="collapsed")
+
+        uploaded_file = st.file_uploader(
+            "Or upload a graph (JSON, NDJSON, CSV or A-B lines, optionally gzipped; GraphML or binary .pgb)",
+            type=["json", "ndjson", "jsonl", "csv", "tsv", "txt", "edges", "gz", "graphml", "pgb"])
+
+        check_button = st.button("Check Planarity", use_container_width=True)
+
+        with st.expander("Or generate a synthetic test graph"):
+            generator_family = st.selectbox("Family", list(GENERATORS), index=list(GENERATORS).index("delaunay"))
+            limit = generator_limit(generator_family)
+            # One widget per family, so switching families never holds a value above the new limit
+            generator_nodes = st.number_input("Nodes", min_value=3, max_value=limit, value=min(1000, limit),
+                                              step=100, key=f"generator_nodes_{generator_family}",
+                                              help=f"Up to {limit:,} nodes for this family, so the check stays "
+                                                   f"interactive.")
+            generator_seed = st.number_input("Seed", min_value=0, value=0, step=1)
+            generate_button = st.button("Generate and Check", use_container_width=True)
+
+    with col2:
+        # Add a lottie animation for the home page
+        lottie_url = "https://assets9.lottiefiles.com/packages/lf20_kkflmtur.json"  # Graph animation
+        lottie_json = load_lottie_url(lottie_url)
+        if lottie_json:
+            show_lottie(lottie_json, height=300, key="home_animation")
+
+        st.markdown("""
+        <div class='card'>
+            <h4>Quick Examples</h4>
+            <ul>
+                <li>Triangle: <code>[["A", "B"], ["B", "C"], ["C", "A"]]</code></li>
+                <li>Square: <code>[["A", "B"], ["B", "C"], ["C", "D"], ["D", "A"]]</code></li>
+                <li>K5 (Non-planar): <code>[["1", "2"], ["1", "3"], ["1", "4"], ["1", "5"], ["2", "3"], ["2", "4"], ["2", "5"], ["3", "4"], ["3", "5"], ["4", "5"]]</code></li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+    checking = generate_button or (check_button and (graph_input or uploaded_file))
+    shared = None if checking else shared_id()
+    if checking or shared:
+        # NetworkX and Plotly are only loaded once there is a graph to check
+        from planarity import check_planarity_and_euler
+        from planarize import planarize
+        from plotting import plot_interactive_graph
+
+        try:
+            stored = planarization = None
+            if checking:
+                st.query_params.pop("graph", None)
+                # Both inputs are parsed incrementally into a compact integer edge array;
+                # JSON accepts a list of dictionaries or a list of lists
+                with span("input", source="generator" if generate_button else "text"):
+                    if generate_button:
+                        if int(generator_nodes) > generator_limit(generator_family):
+                            raise ValueError(f"At most {generator_limit(generator_family):,} nodes for the "
+                                             f"'{generator_family}' family.")
+                        compact = generate(generator_family, int(generator_nodes), seed=int(generator_seed))
+                    else:
+                        if uploaded_file is not None:
+                            compact = load_graph(uploaded_file, name=uploaded_file.name)
+                        else:
+                            compact = CompactGraph.from_buffer(load_edges(io.StringIO(graph_input)))
+                        if compact.number_of_edges() == 0:
+                            raise ValueError("No edges found in the input.")
+
+                result = check_planarity_and_euler(compact)
+            else:
+                # A saved graph comes with its analysis; nothing is recomputed
+                stored = result = open_shared(shared)
+                if stored is None:
+                    raise ValueError(f"No saved graph with the ID '{shared}'.")
+
+            st.markdown("<hr style='margin: 2rem 0;'>", unsafe_allow_html=True)
+
+            if result.is_planar:
+                st.markdown("""
+                <div style='background-color:#e6f7e6; border-left:4px solid #28a745; padding:1rem; border-radius:0.5rem; margin-bottom:1.5rem;'>
+                    <h3 style='color:#28a745; margin:0;'>✅ The graph is planar!</h3>
+                </div>
+                """, unsafe_allow_html=True)
+
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.markdown(f"""
+                    <div class='metric-card'>
+                        <div class='metric-value'>{result.V}</div>
+                        <div class='metric-label'>Vertices</div>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+                with col2:
+                    st.markdown(f"""
+                    <div class='metric-card'>
+                        <div class='metric-value'>{result.E}</div>
+                        <div class='metric-label'>Edges</div>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+                with col3:
+                    st.markdown(f"""
+                    <div class='metric-card'>
+                        <div class='metric-value'>{result.F}</div>
+                        <div class='metric-label'>Faces</div>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+                st.markdown("<div style='height:1rem;'></div>", unsafe_allow_html=True)
+                figure = plot_interactive_graph(result.compact, result.positions)
+                with span("chart"):
+                    st.plotly_chart(figure, use_container_width=True)
+
+                if result.C == 1:
+                    st.info("💡 Euler's formula V - E + F = 2 is satisfied for this planar graph.")
+                else:
+                    st.info(f"💡 This graph has {result.C} components, so Euler's formula reads "
+                            f"V - E + F = 1 + C = {1 + result.C}.")
+
+            else:
+                st.markdown("""
+                <div style='background-color:#fff4e6; border-left:4px solid #fd7e14; padding:1rem; border-radius:0.5rem; margin-bottom:1.5rem;'>
+                    <h3 style='color:#fd7e14; margin:0;'>❌ The graph is NOT planar.</h3>
+                    <p style='margin-top:0.5rem;'>This graph cannot be drawn on a plane without edge crossings.</p>
+                </div>
+                """, unsafe_allow_html=True)
+
+                witness = result.kuratowski
+                st.plotly_chart(plot_interactive_graph(result.compact, result.positions, highlight=witness),
+                                use_container_width=True)
+
+                if witness is not None:
+                    st.info(f"💡 Highlighted in red: a subdivision of {witness.kind} on the branch vertices "
+                            f"{', '.join(witness.branch_vertices)}. By Kuratowski's theorem, any graph containing "
+                            f"one cannot be drawn without edge crossings.")
+
+                st.markdown("### 🪡 Planarized Drawing")
+                planarization = stored.planarization if stored is not None else None
+                if planarization is None:
+                    with st.spinner("Finding a maximal planar subgraph..."):
+                        planarization = planarize(result.compact)
+                st.plotly_chart(plot_interactive_graph(result.compact, planarization.layout, highlight=planarization),
+                                use_container_width=True)
+                removed = len(planarization.removed_edges)
+                crossings = (f"has {planarization.crossings} edge crossings" if planarization.crossings is not None
+                             else "was drawn before its crossings could be counted")
+                st.info(f"💡 Removing the {removed} edge{'s' if removed != 1 else ''} highlighted in red leaves a "
+                        f"{'maximal ' if planarization.maximal else ''}planar subgraph. This drawing {crossings}.")
+                if not planarization.complete:
+                    st.caption(f"Stopped after {planarization.elapsed:.1f}s; a longer search may remove fewer "
+                               f"edges or find fewer crossings.")
+
+            st.caption(f"Decided by the '{result.tier}' check.")
+
+            if stored is not None:
+                show_share_link(stored.id)
+            else:
+                st.button("🔗 Save & Share", key="home_share", on_click=save_and_share, args=(result.compact,),
+                          kwargs={"result": result, "layout": result.positions,
+                                  "planarization": planarization})
+
+        except Exception as e:
+            st.error(f"Error: {e}")
+            st.markdown("""
+            <div style='background-color:#f8d7da; padding:1rem; border-radius:0.5rem;'>
+                <p>Please check your input format. Examples:</p>
+                <ul>
+                    <li><code>[["A", "B"], ["B", "C"], ["C", "A"]]</code></li>
+                    <li><code>[{"source": "A", "target": "B"}, {"source": "B", "target": "C"}]</code></li>
+                </ul>
+            </div>
+            """, unsafe_allow_html=True)
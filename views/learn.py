@@ -0,0 +1,173 @@
+import streamlit as st
+
+from assets import load_lottie_url
+from views import show_lottie
+from views.examples import example
+
+
+def render():
+    st.markdown("""
+    <div class='card'>
+        <h2>📚 Learn About Planar Graphs</h2>
+        <p>Explore the fascinating world of planar graphs and their applications.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    learn_tabs = st.tabs(["Basics", "Euler's Formula", "Kuratowski's Theorem", "Applications", "Resources"])
+
+    with learn_tabs[0]:
+        col1, col2 = st.columns([3, 2])
+
+        with col1:
+            st.markdown("""
+            <h3>What is a Planar Graph?</h3>
+            <p>A graph is called <b>planar</b> if it can be drawn on a plane (or a sphere) in such a way that no edges cross each other. In other words, it can be drawn so that no edges intersect except at their endpoints (vertices).</p>
+
+            <h4>Key Properties:</h4>
+            <ul>
+                <li>Every planar graph can be drawn with straight-line edges</li>
+                <li>A planar graph with n ≥ 3 vertices has at most 3n - 6 edges</li>
+                <li>A planar graph always has a vertex with degree at most 5</li>
+                <li>Every planar graph is 4-colorable (Four Color Theorem)</li>
+            </ul>
+            """, unsafe_allow_html=True)
+
+        with col2:
+            # Add a lottie animation for the learn page
+            lottie_url = "https://assets5.lottiefiles.com/packages/lf20_qp1q7mct.json"  # Education animation
+            lottie_json = load_lottie_url(lottie_url)
+            if lottie_json:
+                show_lottie(lottie_json, height=250, key="learn_animation")
+
+            st.markdown("""
+            <div style='background-color:#e6f7ff; border-left:4px solid #1890ff; padding:1rem; border-radius:0.5rem; margin-top:1rem;'>
+                <h4 style='color:#1890ff; margin:0;'>Did You Know?</h4>
+                <p>The study of planar graphs began with the famous "Seven Bridges of Königsberg" problem, solved by Leonhard Euler in 1736.</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    with learn_tabs[1]:
+        st.markdown("""
+        <h3>Euler's Formula</h3>
+        <p>For any connected planar graph with V vertices, E edges, and F faces (including the outer face), Euler's formula states:</p>
+        <div style='text-align:center; font-size:1.5rem; margin:1.5rem 0; font-weight:bold; color:#123458;'>
+            V - E + F = 2
+        </div>
+
+        <h4>Example:</h4>
+        <p>Consider a cube drawn in the plane:</p>
+        <ul>
+            <li>Vertices (V): 8</li>
+            <li>Edges (E): 12</li>
+            <li>Faces (F): 6</li>
+        </ul>
+        <p>Applying Euler's formula: 8 - 12 + 6 = 2 ✓</p>
+
+        <h4>Consequences of Euler's Formula:</h4>
+        <ul>
+            <li>For a simple planar graph with n ≥ 3 vertices: E ≤ 3n - 6</li>
+            <li>For a simple bipartite planar graph: E ≤ 2n - 4</li>
+            <li>Every planar graph has a vertex of degree at most 5</li>
+        </ul>
+        """, unsafe_allow_html=True)
+
+        # Add a simple visualization
+        st.image(
+            "https://upload.wikimedia.org/wikipedia/commons/thumb/9/9b/Schlegel_wireframe_8-cell.png/440px-Schlegel_wireframe_8-cell.png",
+            caption="A planar embedding of a cube", width=300)
+
+    with learn_tabs[2]:
+        st.markdown("""
+        <h3>Kuratowski's Theorem</h3>
+        <p>Kuratowski's theorem provides a complete characterization of planar graphs:</p>
+        <div style='background-color:#f0f2f5; padding:1rem; border-radius:0.5rem; margin:1rem 0;'>
+            <p style='font-weight:bold;'>A graph is planar if and only if it does not contain a subgraph that is a subdivision of K₅ or K₃,₃.</p>
+        </div>
+
+        <h4>The Forbidden Subgraphs:</h4>
+        <ul>
+            <li><b>K₅</b>: The complete graph on 5 vertices</li>
+            <li><b>K₃,₃</b>: The complete bipartite graph with 3 vertices in each part (also known as the "utility graph")</li>
+        </ul>
+
+        <p>A <b>subdivision</b> of a graph is obtained by replacing edges with paths. This means that if you can find either K₅ or K₃,₃ within your graph (possibly with some edges replaced by paths), then your graph is not planar.</p>
+        """, unsafe_allow_html=True)
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("<h5 style='text-align:center;'>K₅ (Complete Graph)</h5>", unsafe_allow_html=True)
+            st.plotly_chart(example("K5")[1], use_container_width=True)
+
+        with col2:
+            st.markdown("<h5 style='text-align:center;'>K₃,₃ (Utility Graph)</h5>", unsafe_allow_html=True)
+            st.plotly_chart(example("K3,3")[1], use_container_width=True)
+
+    with learn_tabs[3]:
+        st.markdown("""
+        <h3>Applications of Planar Graphs</h3>
+        <p>Planar graphs have numerous practical applications across various fields:</p>
+        """, unsafe_allow_html=True)
+
+        app_col1, app_col2 = st.columns(2)
+
+        with app_col1:
+            st.markdown("""
+            <div style='background-color:#f0f8ff; padding:1rem; border-radius:0.5rem; height:100%;'>
+                <h4 style='color:#123458;'>Circuit Design</h4>
+                <p>Planar graphs are essential in designing printed circuit boards (PCBs) where crossing wires can cause short circuits.</p>
+                <h4 style='color:#123458;'>Map Coloring</h4>
+                <p>The Four Color Theorem states that any planar graph can be colored with at most four colors, which has applications in map coloring problems.</p>
+                <h4 style='color:#123458;'>Network Design</h4>
+                <p>Planning road networks, utility distribution, and telecommunication networks often involves planar graph considerations.</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+        with app_col2:
+            st.markdown("""
+            <div style='background-color:#f0f8ff; padding:1rem; border-radius:0.5rem; height:100%;'>
+                <h4 style='color:#123458;'>VLSI Design</h4>
+                <p>Very Large Scale Integration (VLSI) chip design relies on planar graph algorithms to minimize wire crossings.</p>
+                <h4 style='color:#123458;'>Graph Drawing</h4>
+                <p>Visualizing complex networks in a clear, readable manner often involves planar graph drawing algorithms.</p>
+                <h4 style='color:#123458;'>Computational Geometry</h4>
+                <p>Triangulations, Voronoi diagrams, and other geometric structures are closely related to planar graphs.</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    with learn_tabs[4]:
+        st.markdown("""
+        <h3>Learning Resources</h3>
+        <p>Explore these resources to deepen your understanding of planar graphs:</p>
+        """, unsafe_allow_html=True)
+
+        st.markdown("""
+        <div style='background-color:#f5f5f5; padding:1.5rem; border-radius:0.5rem;'>
+            <h4>Books</h4>
+            <ul>
+                <li>"Graph Theory" by Reinhard Diestel</li>
+                <li>"Introduction to Graph Theory" by Douglas B. West</li>
+                <li>"Planar Graphs: Theory and Algorithms" by Takao Nishizeki and Norishige Chiba</li>
+            </ul>
+
+            <h4>Online Courses</h4>
+            <ul>
+                <li>Coursera: "Discrete Mathematics" by University of California San Diego</li>
+                <li>edX: "Graph Theory" by University of California San Diego</li>
+                <li>Khan Academy: "Graph Theory Basics"</li>
+            </ul>
+
+            <h4>Interactive Tools</h4>
+            <ul>
+                <li><a href="https://d3gt.com/unit.html" target="_blank">D3 Graph Theory</a> - Interactive graph theory tutorials</li>
+                <li><a href="https://graphonline.ru/en/" target="_blank">Graph Online</a> - Create and analyze graphs</li>
+                <li><a href="https://www.geogebra.org/m/nbjfjtpv" target="_blank">GeoGebra: Graph Theory</a> - Interactive graph theory demonstrations</li>
+            </ul>
+
+            <h4>Research Papers</h4>
+            <ul>
+                <li>"Planarity Testing in Parallel" by J. Hopcroft and R. Tarjan</li>
+                <li>"Linear-Time Algorithms for Testing the Planarity of Graphs" by N. Chiba et al.</li>
+                <li>"Efficient Algorithms for Maximum Planar Subgraphs" by C. Gutwenger and P. Mutzel</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
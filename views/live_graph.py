@@ -0,0 +1,159 @@
+import streamlit as st
+
+from views.examples import example
+
+
+def render():
+    st.markdown("""
+    <div class='card'>
+        <h2>📈 Interactive Graph Examples</h2>
+        <p>Explore these pre-built graph examples to understand planar and non-planar structures.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    example_tabs = st.tabs(["Triangle (K3)", "Square (C4)", "Complete Graph (K5)", "Utility Graph (K3,3)", "Custom"])
+
+    with example_tabs[0]:
+        st.markdown("<h4>Triangle (K3) - Planar</h4>", unsafe_allow_html=True)
+        result, figure = example("K3")
+
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            st.plotly_chart(figure, use_container_width=True)
+        with col2:
+            st.markdown(f"""
+            <div class='metric-card' style='background-color:#123458; color:white; padding:1rem; border-radius:0.5rem; text-align:center;'>
+                <div class='metric-value' style='font-size:2rem; font-weight:700; color:white;'>{result.V}</div>
+                <div class='metric-label' style='font-size:0.9rem; color:white; margin-top:0.3rem;'>Vertices</div>
+            </div>
+            <div style='height:0.5rem;'></div>
+            <div class='metric-card' style='background-color:#123458; color:white; padding:1rem; border-radius:0.5rem; text-align:center;'>
+                <div class='metric-value' style='font-size:2rem; font-weight:700; color:white;'>{result.E}</div>
+                <div class='metric-label' style='font-size:0.9rem; color:white; margin-top:0.3rem;'>Edges</div>
+            </div>
+            <div style='height:0.5rem;'></div>
+            <div class='metric-card' style='background-color:#123458; color:white; padding:1rem; border-radius:0.5rem; text-align:center;'>
+                <div class='metric-value' style='font-size:2rem; font-weight:700; color:white;'>{result.F}</div>
+                <div class='metric-label' style='font-size:0.9rem; color:white; margin-top:0.3rem;'>Faces</div>
+            </div>
+            """, unsafe_allow_html=True)
+
+            st.markdown("""
+            <div style='margin-top:1rem;'>
+                <code>[["A", "B"], ["B", "C"], ["C", "A"]]</code>
+            </div>
+            """, unsafe_allow_html=True)
+
+    with example_tabs[1]:
+        st.markdown("<h4>Square (C4) - Planar</h4>", unsafe_allow_html=True)
+        result, figure = example("C4")
+
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            st.plotly_chart(figure, use_container_width=True)
+        with col2:
+            st.markdown(f"""
+            <div class='metric-card' style='background-color:#123458; color:white; padding:1rem; border-radius:0.5rem; text-align:center;'>
+                <div class='metric-value' style='font-size:2rem; font-weight:700; color:white;'>{result.V}</div>
+                <div class='metric-label' style='font-size:0.9rem; color:white; margin-top:0.3rem;'>Vertices</div>
+            </div>
+            <div style='height:0.5rem;'></div>
+            <div class='metric-card' style='background-color:#123458; color:white; padding:1rem; border-radius:0.5rem; text-align:center;'>
+                <div class='metric-value' style='font-size:2rem; font-weight:700; color:white;'>{result.E}</div>
+                <div class='metric-label' style='font-size:0.9rem; color:white; margin-top:0.3rem;'>Edges</div>
+            </div>
+            <div style='height:0.5rem;'></div>
+            <div class='metric-card' style='background-color:#123458; color:white; padding:1rem; border-radius:0.5rem; text-align:center;'>
+                <div class='metric-value' style='font-size:2rem; font-weight:700; color:white;'>{result.F}</div>
+                <div class='metric-label' style='font-size:0.9rem; color:white; margin-top:0.3rem;'>Faces</div>
+            </div>
+            """, unsafe_allow_html=True)
+
+            st.markdown("""
+            <div style='margin-top:1rem;'>
+                <code>[["A", "B"], ["B", "C"], ["C", "D"], ["D", "A"]]</code>
+            </div>
+            """, unsafe_allow_html=True)
+
+    with example_tabs[2]:
+        st.markdown("<h4>Complete Graph (K5) - Non-Planar</h4>", unsafe_allow_html=True)
+        _, figure = example("K5")
+
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            st.plotly_chart(figure, use_container_width=True)
+        with col2:
+            st.markdown("""
+            <div style='background-color:#fff4e6; border-left:4px solid #fd7e14; padding:1rem; border-radius:0.5rem;'>
+                <h4 style='color:#fd7e14; margin:0;'>Non-Planar Graph</h4>
+                <p>K5 is one of the Kuratowski graphs that cannot be drawn on a plane without edge crossings.</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+            st.markdown("""
+            <div style='margin-top:1rem;'>
+                <p>Complete graph with 5 vertices where every vertex is connected to all others.</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    with example_tabs[3]:
+        st.markdown("<h4>Utility Graph (K3,3) - Non-Planar</h4>", unsafe_allow_html=True)
+        _, figure = example("K3,3")
+
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            st.plotly_chart(figure, use_container_width=True)
+        with col2:
+            st.markdown("""
+            <div style='background-color:#fff4e6; border-left:4px solid #fd7e14; padding:1rem; border-radius:0.5rem;'>
+                <h4 style='color:#fd7e14; margin:0;'>Non-Planar Graph</h4>
+                <p>K3,3 is the other Kuratowski graph that cannot be drawn on a plane without edge crossings.</p>
+            </div>
+            """, unsafe_allow_html=True)
+            st.markdown("""
+            <div style='margin-top:1rem;'>
+                <p>Also known as the "Utility Graph" - represents 3 houses connected to 3 utilities.</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    with example_tabs[4]:
+        st.markdown("<h4>Custom Graph</h4>", unsafe_allow_html=True)
+
+        custom_nodes = st.text_input("Nodes (comma separated)", value="A,B,C,D,E")
+        custom_edges = st.text_area("Edges (each as A-B)", value="A-B\nB-C\nC-D\nD-E\nE-A", height=150)
+
+        if st.button("Generate Custom Graph", use_container_width=True):
+            # The examples above are precomputed; only a custom graph needs NetworkX
+            from compact import CompactGraph
+            from layout import LayoutCache
+            from planarity import check_planarity_and_euler
+            from plotting import plot_interactive_graph
+
+            try:
+                nodes = [n.strip() for n in custom_nodes.split(",") if n.strip()]
+                edges = [(e.split("-")[0].strip(), e.split("-")[1].strip()) for e in custom_edges.strip().split("\n") if
+                         "-" in e]
+
+                G = CompactGraph.from_labeled_edges(edges, nodes=nodes)
+
+                result = check_planarity_and_euler(edges)
+
+                layout_cache = st.session_state.setdefault("custom_layout", LayoutCache())
+                layout = layout_cache.layout(G, embedding=result.embedding)
+                st.plotly_chart(plot_interactive_graph(G, layout), use_container_width=True)
+
+                if result.is_planar:
+                    st.markdown(f"""
+                    <div style='background-color:#e6f7e6; border-left:4px solid #28a745; padding:1rem; border-radius:0.5rem;'>
+                        <h4 style='color:#28a745; margin:0;'>✅ This is a planar graph!</h4>
+                        <p style='margin-top:0.5rem;'>Vertices: {result.V} | Edges: {result.E} | Faces: {result.F}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                else:
+                    st.markdown("""
+                    <div style='background-color:#fff4e6; border-left:4px solid #fd7e14; padding:1rem; border-radius:0.5rem;'>
+                        <h4 style='color:#fd7e14; margin:0;'>❌ This graph is NOT planar.</h4>
+                    </div>
+                    """, unsafe_allow_html=True)
+            except Exception as e:
+                st.error(f"Error: {e}")
@@ -0,0 +1,41 @@
+import streamlit as st
+
+from graph_store import GraphStore
+
+
+@st.cache_resource(show_spinner=False)
+def store():
+    return GraphStore()
+
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def open_shared(graph_id):
+    """
+    Function to open the saved graph ``graph_id`` (``None`` if unknown), once per process for all sessions.
+    """
+    return store().open(graph_id)
+
+
+def shared_id():
+    """
+    ID of the saved graph in the URL (``?graph=<id>``), or ``None``.
+    """
+    return st.query_params.get("graph")
+
+
+def save_and_share(graph, **analysis):
+    """
+    Function to save ``graph`` and put its ID in the URL; meant as a button's ``on_click``.
+
+    ``analysis`` is passed on to ``GraphStore.save`` (``result``, ``layout``, ``planarization``).
+    """
+    st.query_params["graph"] = store().save(graph, **analysis)
+
+
+def show_share_link(graph_id):
+    """
+    Function to show the link to the saved graph ``graph_id``, with a copy button.
+    """
+    base = (st.context.url or "").split("?")[0]
+    st.code(f"{base}?graph={graph_id}", language=None)
+    st.caption("Anyone with this link sees the saved graph and its analysis, without recomputing it.")